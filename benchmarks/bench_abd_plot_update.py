@@ -0,0 +1,67 @@
+"""Benchmark frames per second of `AbdPlot.update` against full rebuilds
+
+Each frame plots new data and renders the figure to an Agg buffer, as when a
+dashboard re-plots the same comparison.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_abd_plot_update
+"""
+from time import perf_counter
+
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")
+
+from pliffy import estimate, parser, figure, plot
+from pliffy.utils import PliffyInfoABD
+
+NUM_FRAMES = 50
+SAMPLE_SIZES = (30, 1_000, 10_000)
+
+
+def _rebuild(info: PliffyInfoABD):
+    estimates = estimate.estimate_abd(info)
+    save, ab_info, diff_info = parser.abd(info, estimates)
+    ab_ax = figure.FigureAB(ab_info)
+    diff_ax = figure.DiffAxCreator(ab_ax, info, diff_info).diff_ax()
+    figure.FigureDiff(diff_info, diff_ax, save)
+    ab_ax.ax.figure.canvas.draw()
+
+
+def _frames(rng: np.random.Generator, size: int, design: str):
+    for _ in range(NUM_FRAMES):
+        data_a = rng.normal(10, 2, size)
+        data_b = data_a + rng.normal(1, 1, size)
+        if design == "unpaired":
+            data_b = rng.permutation(data_b)
+        yield data_a, data_b
+
+
+def main():
+    rng = np.random.default_rng(42)
+    print(f"{'design':<10s}{'n':>8s}{'rebuild fps':>14s}{'update fps':>13s}")
+    for design in ("unpaired", "paired"):
+        for size in SAMPLE_SIZES:
+            info = PliffyInfoABD(
+                data_a=rng.normal(10, 2, size),
+                data_b=rng.normal(11, 2, size),
+                design=design,
+                show=False,
+            )
+            start = perf_counter()
+            for data_a, data_b in _frames(rng, size, design):
+                _rebuild(info._replace(data_a=data_a, data_b=data_b))
+            rebuild_fps = NUM_FRAMES / (perf_counter() - start)
+
+            abd_plot = plot.AbdPlot(info)
+            start = perf_counter()
+            for data_a, data_b in _frames(rng, size, design):
+                abd_plot.update(data_a, data_b)
+            update_fps = NUM_FRAMES / (perf_counter() - start)
+            print(f"{design:<10s}{size:>8d}{rebuild_fps:>14.1f}{update_fps:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark bootstrap confidence intervals
+
+Computes percentile bootstrap confidence intervals with 10,000 resamples of
+100,000 paired data points, serially and with a pool of processes.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_bootstrap
+"""
+
+import os
+from time import perf_counter
+
+import numpy as np
+
+from pliffy import bootstrap
+
+NUM_POINTS = 100_000
+N_RESAMPLES = 10_000
+
+
+def main():
+    rng = np.random.default_rng(42)
+    data_a = rng.lognormal(0, 1, NUM_POINTS)
+    data_b = data_a + rng.normal(0.1, 0.5, NUM_POINTS)
+    print(f"{NUM_POINTS:,d} points, {N_RESAMPLES:,d} resamples")
+    print(f"{'workers':>8s}{'seconds':>10s}  diff CI")
+    for max_workers in (None, os.cpu_count()):
+        start = perf_counter()
+        cis = bootstrap.bootstrap_abd(
+            data_a,
+            data_b,
+            design="paired",
+            n_resamples=N_RESAMPLES,
+            seed=1,
+            max_workers=max_workers,
+        )
+        elapsed = perf_counter() - start
+        workers = str(max_workers or 1)
+        print(f"{workers:>8s}{elapsed:>10.2f}  {cis.diff[0]:.5f} to {cis.diff[1]:.5f}")
+
+
+if __name__ == "__main__":
+    main()
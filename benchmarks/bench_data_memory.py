@@ -0,0 +1,102 @@
+"""Benchmark peak memory (RSS) of estimating and plotting large data
+
+Data are prepared once (`utils.load_data`) as contiguous float arrays shared
+by estimates, parsing and plotting. Arrays are used without copying, and lists
+are converted once, so peak memory beyond the data given should be about 1x
+the data size (as float64) for lists and close to 0 for estimates from
+arrays. Raw data are subsampled, which sorts each group (or paired
+differences) to find quantiles, so that drawing millions of points does not
+dominate. Each case runs in a new process. Linux only (reads
+`/proc/self/status`).
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_data_memory
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+import numpy as np
+
+SIZE = 5_000_000
+# Peak memory beyond data given (and converted, for lists), as multiple of data.
+# The benchmark exits with an error if any case exceeds it
+MAX_EXTRA_RATIO = 1.25
+CASES = [
+    (step, design, input_type)
+    for step in ("estimate", "plot")
+    for design in ("unpaired", "paired")
+    for input_type in ("list", "float64", "float32")
+]
+
+
+def _status_mb(field: str) -> float:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1e3
+
+
+def _reset_peak_rss():
+    with open("/proc/self/clear_refs", "w") as clear_refs:
+        clear_refs.write("5")
+
+
+def _peak_mb(step: str, design: str, input_type: str) -> float:
+    """Peak RSS above RSS once data exist, in MB"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from pliffy import estimate, plot
+    from pliffy.utils import PliffyInfoABD
+
+    rng = np.random.default_rng(42)
+    data_a, data_b = rng.normal(10, 2, SIZE), rng.normal(11, 2, SIZE)
+    if input_type == "list":
+        data_a, data_b = data_a.tolist(), data_b.tolist()
+    else:
+        data_a, data_b = data_a.astype(input_type), data_b.astype(input_type)
+    info = PliffyInfoABD(
+        data_a=data_a,
+        data_b=data_b,
+        design=design,
+        show=False,
+        raw_display="subsample",
+    )
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        # Warm up, so that imports and Matplotlib caches are not counted
+        plot.plot_abd(info._replace(data_a=[1.0, 2.0], data_b=[2.0, 3.0]))
+        _reset_peak_rss()
+        start = _status_mb("VmRSS")
+        if step == "estimate":
+            estimate.estimate_abd(info)
+        else:
+            plot.plot_abd(info)
+    return _status_mb("VmHWM") - start
+
+
+def main():
+    data_mb = 2 * SIZE * np.dtype(float).itemsize / 1e6
+    print(f"data: 2 x {SIZE:,} values ({data_mb:.0f} MB as float64)")
+    print(f"{'step':<10s}{'design':<10s}{'input':<9s}{'peak MB':>9s}{'x data':>8s}")
+    context = multiprocessing.get_context("spawn")
+    failures = list()
+    for step, design, input_type in CASES:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            peak_mb = executor.submit(_peak_mb, step, design, input_type).result()
+        ratio = peak_mb / data_mb
+        max_ratio = MAX_EXTRA_RATIO + (input_type == "list")
+        flag = ""
+        if ratio > max_ratio:
+            failures.append((step, design, input_type))
+            flag = f"  > {max_ratio}x"
+        row = f"{step:<10s}{design:<10s}{input_type:<9s}"
+        print(f"{row}{peak_mb:>9.0f}{ratio:>8.2f}{flag}")
+    if failures:
+        raise SystemExit(f"Peak memory above limit for {len(failures)} case(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark per-call overhead of computing estimates
+
+Compares `calc_abd`, which prints a table of estimates to the console, with
+`estimate_abd`, which has no side effects. Console output is sent to
+`os.devnull`, so only the cost of formatting and writing the table is
+measured, not that of the terminal.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_estimates
+"""
+import os
+from contextlib import redirect_stdout
+from time import perf_counter
+from typing import Callable
+
+import numpy as np
+
+from pliffy import estimate
+from pliffy.utils import PliffyInfoABD
+
+NUM_CALLS = 5_000
+SAMPLE_SIZE = 30
+
+
+def _time_per_call(func: Callable, info: PliffyInfoABD) -> float:
+    func(info)
+    start = perf_counter()
+    for _ in range(NUM_CALLS):
+        func(info)
+    return (perf_counter() - start) / NUM_CALLS
+
+
+def main():
+    rng = np.random.default_rng(42)
+    print(f"{'design':<10s}{'calc_abd us':>14s}{'estimate_abd us':>18s}")
+    for design in ("unpaired", "paired"):
+        info = PliffyInfoABD(
+            data_a=list(rng.normal(10, 2, SAMPLE_SIZE)),
+            data_b=list(rng.normal(12, 2, SAMPLE_SIZE)),
+            design=design,
+        )
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            printed = _time_per_call(estimate.calc_abd, info)
+        silent = _time_per_call(estimate.estimate_abd, info)
+        print(f"{design:<10s}{printed * 1e6:>14.1f}{silent * 1e6:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
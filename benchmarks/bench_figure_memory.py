@@ -0,0 +1,50 @@
+"""Benchmark memory (RSS) while generating many ABD figures in one process
+
+Figures generated by `plot_abd` with `show=False` are not managed by pyplot, so
+memory should stay flat however many figures are generated. Linux only (reads
+`/proc/self/statm`).
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_figure_memory
+"""
+import gc
+import os
+from contextlib import redirect_stdout
+from time import perf_counter
+
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")
+
+from pliffy import plot
+from pliffy.utils import PliffyInfoABD
+
+NUM_FIGURES = 10_000
+REPORT_EVERY = 1_000
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+
+
+def main():
+    rng = np.random.default_rng(42)
+    info = PliffyInfoABD(
+        data_a=rng.normal(10, 2, 30), data_b=rng.normal(11, 2, 30), show=False
+    )
+    print(f"{'figures':>8s}{'RSS MB':>9s}{'seconds':>9s}")
+    start = perf_counter()
+    with open(os.devnull, "w") as devnull:
+        for i in range(1, NUM_FIGURES + 1):
+            with redirect_stdout(devnull):
+                plot.plot_abd(info)
+            if i % REPORT_EVERY == 0:
+                gc.collect()
+                print(f"{i:>8d}{_rss_mb():>9.1f}{perf_counter() - start:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
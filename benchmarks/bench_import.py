@@ -0,0 +1,63 @@
+"""Benchmark time taken to import pliffy
+
+Runs each statement with `python -X importtime` in fresh interpreters and
+reports the wall-clock time of the statement, the cumulative import time of
+the `pliffy` package reported by `-X importtime` and which heavy dependencies
+were loaded.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_import
+"""
+
+import subprocess
+import sys
+from typing import Tuple, Dict, List
+
+REPEATS = 5
+STATEMENTS = ("import pliffy", "from pliffy import plot_abd")
+HEAVY_MODULES = ("matplotlib", "matplotlib.pyplot", "scipy", "scipy.stats")
+TIMED_STATEMENT = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "{statement}\n"
+    "print(time.perf_counter() - start)\n"
+    "print(','.join(module for module in {heavy_modules} if module in sys.modules))"
+)
+
+
+def _run(statement: str) -> Tuple[float, Dict[str, int], List[str]]:
+    """Wall-clock time, cumulative import times and heavy modules loaded"""
+    code = TIMED_STATEMENT.format(statement=statement, heavy_modules=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, loaded = result.stdout.splitlines()
+    import_times = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        import_times[module.strip()] = int(cumulative)
+    return (
+        float(elapsed),
+        import_times,
+        [module for module in loaded.split(",") if module],
+    )
+
+
+def main():
+    print(f"{'statement':<30s}{'wall ms':>10s}{'pliffy ms':>12s}  heavy modules loaded")
+    for statement in STATEMENTS:
+        runs = [_run(statement) for _ in range(REPEATS)]
+        wall_ms = min(run[0] for run in runs) * 1000
+        pliffy_ms = min(run[1]["pliffy"] for run in runs) / 1000
+        loaded = ", ".join(runs[0][2]) or "-"
+        print(f"{statement:<30s}{wall_ms:>10.1f}{pliffy_ms:>12.1f}  {loaded}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark estimates updated as observations are added
+
+Compares `IncrementalEstimator`, which merges moments of each batch of new
+observations, with `estimate_abd` recomputing estimates from all data after
+each batch.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_incremental
+"""
+from time import perf_counter
+
+import numpy as np
+
+from pliffy import estimate
+from pliffy.utils import PliffyInfoABD
+
+NUM_UPDATES = 100
+INITIAL_SIZES = (1_000, 100_000, 1_000_000)
+BATCH_SIZE = 10
+
+
+def main():
+    rng = np.random.default_rng(42)
+    print(f"{'design':<10s}{'n':>10s}{'recompute us':>14s}{'incremental us':>16s}")
+    for design in ("unpaired", "paired"):
+        for size in INITIAL_SIZES:
+            data_a = rng.normal(10, 2, size + NUM_UPDATES * BATCH_SIZE)
+            data_b = data_a + rng.normal(1, 1, len(data_a))
+            info = PliffyInfoABD(
+                data_a=data_a[:size], data_b=data_b[:size], design=design
+            )
+            stops = range(size + BATCH_SIZE, len(data_a) + 1, BATCH_SIZE)
+            estimate.estimate_abd(info)
+
+            start = perf_counter()
+            for stop in stops:
+                estimate.estimate_abd(
+                    info._replace(data_a=data_a[:stop], data_b=data_b[:stop])
+                )
+            recompute = (perf_counter() - start) / NUM_UPDATES
+
+            estimator = estimate.IncrementalEstimator(info)
+            start = perf_counter()
+            for stop in stops:
+                new_a = data_a[stop - BATCH_SIZE : stop]
+                new_b = data_b[stop - BATCH_SIZE : stop]
+                if design == "paired":
+                    estimator.add_pair(new_a, new_b)
+                else:
+                    estimator.add_a(new_a)
+                    estimator.add_b(new_b)
+                estimator.estimates
+            incremental = (perf_counter() - start) / NUM_UPDATES
+            print(
+                f"{design:<10s}{size:>10d}{recompute * 1e6:>14.1f}"
+                f"{incremental * 1e6:>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark summary statistics used by the unpaired estimates
+
+Compares the calls to `np.std` and `np.mean` previously made by `calc_abd`
+for unpaired data (six full passes, each `np.std` allocating a temporary
+array the size of the data) with `estimate._moments`, which makes a single
+pass over memory per input and only allocates cache-sized chunks.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_moments
+"""
+
+import tracemalloc
+from time import perf_counter
+from typing import Callable, Tuple
+
+import numpy as np
+
+from pliffy import estimate
+
+NUM_POINTS = 10_000_000
+REPEATS = 3
+
+
+def _previous_unpaired(data_a: np.ndarray, data_b: np.ndarray):
+    """Calls made by `calc_abd` before the moments were shared"""
+    for data in (data_a, data_b):
+        np.std(data)
+        np.mean(data)
+    np.std(data_a)
+    np.std(data_b)
+
+
+def _moments_unpaired(data_a: np.ndarray, data_b: np.ndarray):
+    estimate._moments(data_a)
+    estimate._moments(data_b)
+
+
+def _time_and_peak_memory(func: Callable, *args) -> Tuple[float, float]:
+    elapsed = min(_time(func, *args) for _ in range(REPEATS))
+    tracemalloc.start()
+    func(*args)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak_bytes / 1e6
+
+
+def _time(func: Callable, *args) -> float:
+    start = perf_counter()
+    func(*args)
+    return perf_counter() - start
+
+
+def main():
+    rng = np.random.default_rng(42)
+    data_a = rng.normal(10, 2, NUM_POINTS)
+    data_b = rng.normal(12, 3, NUM_POINTS)
+    print(f"{NUM_POINTS:,d} points per group")
+    print(f"{'method':<12s}{'passes':>8s}{'seconds':>10s}{'peak MB':>10s}")
+    for name, passes, func in (
+        ("previous", 6, _previous_unpaired),
+        ("moments", 2, _moments_unpaired),
+    ):
+        elapsed, peak_mb = _time_and_peak_memory(func, data_a, data_b)
+        print(f"{name:<12s}{passes:>8d}{elapsed:>10.4f}{peak_mb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
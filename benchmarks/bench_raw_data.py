@@ -0,0 +1,55 @@
+"""Benchmark plotting of raw data points as the number of points grows
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_raw_data
+"""
+from time import perf_counter
+from typing import Tuple
+
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from pliffy import parser
+from pliffy.figure import Figure
+
+NUM_POINTS = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+class _RawPlotter(Figure):
+    """Minimal figure to exercise `Figure._plot_raw_data`"""
+
+    def __init__(self, ax):
+        self.ax = ax
+
+
+def _time_raw_data(num_points: int) -> Tuple[float, int]:
+    data = np.random.default_rng(42).normal(10, 2, num_points)
+    raw = parser.Raw(
+        data=data,
+        xval=parser.ABD_XVALS_RAW.a,
+        jitter=parser.JITTER_RANGE / num_points,
+        format_=parser._raw_format("black", "o", 3, 0.2),
+    )
+    fig, ax = plt.subplots()
+    start = perf_counter()
+    _RawPlotter(ax)._plot_raw_data(raw)
+    fig.canvas.draw()
+    elapsed = perf_counter() - start
+    num_artists = len(ax.lines)
+    plt.close(fig)
+    return elapsed, num_artists
+
+
+def main():
+    print(f"{'points':>10s}{'artists':>10s}{'seconds':>12s}")
+    for num_points in NUM_POINTS:
+        elapsed, num_artists = _time_raw_data(num_points)
+        print(f"{num_points:>10d}{num_artists:>10d}{elapsed:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark ABD plots of large groups with each `raw_display` strategy
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_raw_display
+"""
+from time import perf_counter
+
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")
+
+from pliffy import estimate, parser, figure
+from pliffy.utils import PliffyInfoABD
+
+NUM_POINTS = 1_000_000
+RAW_DISPLAYS = ("all", "subsample", "density")
+
+
+def _time_plot(info: PliffyInfoABD) -> float:
+    start = perf_counter()
+    estimates = estimate.estimate_abd(info)
+    save, ab_info, diff_info = parser.abd(info, estimates)
+    ab_ax = figure.FigureAB(ab_info)
+    diff_ax = figure.DiffAxCreator(ab_ax, info, diff_info).diff_ax()
+    figure.FigureDiff(diff_info, diff_ax, save)
+    ab_ax.ax.figure.canvas.draw()
+    elapsed = perf_counter() - start
+    return elapsed
+
+
+def main():
+    rng = np.random.default_rng(42)
+    data_a = rng.normal(10, 2, NUM_POINTS)
+    data_b = data_a + rng.normal(1, 1, NUM_POINTS)
+    print(f"{'design':<10s}{'raw_display':<14s}{'seconds':>10s}")
+    for design in ("unpaired", "paired"):
+        for raw_display in RAW_DISPLAYS:
+            info = PliffyInfoABD(
+                data_a=data_a,
+                data_b=data_b,
+                design=design,
+                raw_display=raw_display,
+                show=False,
+            )
+            print(f"{design:<10s}{raw_display:<14s}{_time_plot(info):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark size and save time of svg and pdf ABD figures
+
+Compares vector raw data with `rasterize_raw_data=True`, which rasterizes
+raw data points and paired lines at `dpi`.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_vector_output
+"""
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+
+from pliffy import estimate, parser, figure
+from pliffy.utils import PliffyInfoABD
+
+NUM_POINTS = 10_000
+
+
+def _plot(info: PliffyInfoABD) -> Figure:
+    estimates = estimate.estimate_abd(info)
+    save, ab_info, diff_info = parser.abd(info, estimates)
+    ab_ax = figure.FigureAB(ab_info)
+    diff_ax = figure.DiffAxCreator(ab_ax, info, diff_info).diff_ax()
+    figure.FigureDiff(diff_info, diff_ax, save)
+    return ab_ax.ax.figure
+
+
+def main():
+    rng = np.random.default_rng(42)
+    data_a = rng.normal(10, 2, NUM_POINTS)
+    data_b = data_a + rng.normal(1, 1, NUM_POINTS)
+    print(f"{'design':<10s}{'type':<6s}{'rasterize':<11s}{'MB':>8s}{'save s':>9s}")
+    with tempfile.TemporaryDirectory() as directory:
+        for design in ("unpaired", "paired"):
+            for save_type in ("svg", "pdf"):
+                for rasterize in (False, True):
+                    info = PliffyInfoABD(
+                        data_a=data_a,
+                        data_b=data_b,
+                        design=design,
+                        rasterize_raw_data=rasterize,
+                        save_type=save_type,
+                        save_path=directory,
+                        show=False,
+                    )
+                    fig = _plot(info)
+                    path = Path(directory) / f"figure.{save_type}"
+                    start = perf_counter()
+                    fig.savefig(path, dpi=info.dpi)
+                    elapsed = perf_counter() - start
+                    size = path.stat().st_size / 1e6
+                    print(
+                        f"{design:<10s}{save_type:<6s}{str(rasterize):<11s}"
+                        f"{size:>8.2f}{elapsed:>9.2f}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
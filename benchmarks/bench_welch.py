@@ -0,0 +1,48 @@
+"""Benchmark Welch confidence intervals of many unpaired comparisons
+
+Compares `estimate_abd` called once per comparison with `calc_abd_batch`,
+which computes Welch-Satterthwaite degrees-of-freedom and t-values for all
+comparisons at once.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_welch
+"""
+from time import perf_counter
+
+import numpy as np
+
+from pliffy import estimate
+from pliffy.utils import PliffyInfoABD
+
+NUM_COMPARISONS = 10_000
+LOOP_COMPARISONS = 1_000
+SIZE_A, SIZE_B = 50, 10
+
+
+def main():
+    rng = np.random.default_rng(42)
+    data_a = rng.normal(10, 1, (SIZE_A, NUM_COMPARISONS))
+    data_b = rng.normal(12, 4, (SIZE_B, NUM_COMPARISONS))
+
+    start = perf_counter()
+    for column in range(LOOP_COMPARISONS):
+        info = PliffyInfoABD(
+            data_a=data_a[:, column],
+            data_b=data_b[:, column],
+            unpaired_variance="welch",
+        )
+        estimate.estimate_abd(info)
+    loop = (perf_counter() - start) / LOOP_COMPARISONS
+
+    start = perf_counter()
+    estimate.calc_abd_batch(data_a, data_b, unpaired_variance="welch")
+    batch = (perf_counter() - start) / NUM_COMPARISONS
+
+    print(f"{'method':<16s}{'us per comparison':>20s}")
+    print(f"{'estimate_abd':<16s}{loop * 1e6:>20.2f}")
+    print(f"{'calc_abd_batch':<16s}{batch * 1e6:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
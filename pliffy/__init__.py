@@ -1,8 +1,29 @@
-from . import estimate
-from . import plot
-from . import utils
-from . import figure
-from . import parser
-from . import demo
-from pliffy.plot import plot_abd
+import importlib
+
+from pliffy import estimate, parser, utils
+from pliffy.estimate import estimate_abd
 from pliffy.utils import PliffyInfoABD, ABD
+
+# Modules and functions that depend on Matplotlib are imported on first use,
+# so that `import pliffy` only loads NumPy.
+SUBMODULES = ("plot", "figure", "demo", "live", "cache")
+PLOT_FUNCTIONS = (
+    "plot_abd",
+    "abd_figure",
+    "plot_abd_bytes",
+    "plot_abd_many",
+    "plot_abd_parallel",
+    "AbdPlot",
+)
+
+
+def __getattr__(name: str):
+    if name in SUBMODULES:
+        return importlib.import_module(f"pliffy.{name}")
+    if name in PLOT_FUNCTIONS:
+        return getattr(importlib.import_module("pliffy.plot"), name)
+    raise AttributeError(f"module 'pliffy' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(SUBMODULES) + list(PLOT_FUNCTIONS))
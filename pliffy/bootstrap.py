@@ -0,0 +1,227 @@
+from itertools import repeat
+from typing import Literal, Tuple, List
+
+import numpy as np
+
+from pliffy.utils import ABD
+
+
+BOOTSTRAP_METHODS = ("percentile", "bca")
+MAX_MEMORY_BYTES = 2 ** 28
+INDEX_BYTES = np.dtype(np.intp).itemsize
+
+
+def bootstrap_abd(
+    data_a: np.ndarray,
+    data_b: np.ndarray,
+    design: Literal["paired", "unpaired"] = "unpaired",
+    ci_percentage: int = 95,
+    method: Literal["percentile", "bca"] = "percentile",
+    n_resamples: int = 10000,
+    seed: int = None,
+    max_memory_bytes: int = MAX_MEMORY_BYTES,
+    max_workers: int = None,
+) -> "ABD":
+    """Calculate bootstrap confidence intervals of means of `a`, `b` and diff
+
+    Means are recomputed for resamples drawn in blocks, each block using its
+    own random generator spawned from `seed`. Results therefore only depend
+    on `seed`, `n_resamples` and `max_memory_bytes`, not on `max_workers`.
+
+    Parameters
+    ----------
+    data_a
+        First set of data
+    data_b
+        Second set of data
+    design
+        Flag to identify if data `a` and `b` are `paired` or `unpaired`. Paired
+        data are resampled in pairs
+    ci_percentage
+        Desired confidence interval.
+        Example: 95 or 99
+    method
+        "percentile" or "bca" (bias-corrected and accelerated)
+    n_resamples
+        Number of bootstrap resamples
+    seed
+        Seed used to create `np.random.Generator` for each block of resamples
+    max_memory_bytes
+        Approximate memory used by resample indices and values of one block
+    max_workers
+        If provided, blocks of resamples are computed in a pool of processes
+
+    Returns
+    -------
+    ABD of (lower, upper) confidence interval values
+
+    Examples
+    --------
+
+    >>> cis = bootstrap_abd(data_a, data_b, design="paired", method="bca", seed=1)
+    >>> cis.diff
+    """
+    if method not in BOOTSTRAP_METHODS:
+        raise ValueError("`method` must be set to either 'percentile' or 'bca'")
+    data_a = np.asarray(data_a, dtype=float)
+    data_b = np.asarray(data_b, dtype=float)
+    seed_a, seed_b = np.random.SeedSequence(seed).spawn(2)
+    bootstrap = _interval_function(method, ci_percentage)
+    if design == "paired":
+        if len(data_a) != len(data_b):
+            raise ValueError(
+                "`data_a` and `data_b` must have the same length in paired design."
+            )
+        means_a, means_b = _bootstrap_means(
+            np.column_stack((data_a, data_b)),
+            n_resamples,
+            seed_a,
+            max_memory_bytes,
+            max_workers,
+        ).T
+        return ABD(
+            a=bootstrap(means_a, data_a),
+            b=bootstrap(means_b, data_b),
+            diff=bootstrap(means_b - means_a, data_b - data_a),
+        )
+    means_a = _bootstrap_means(
+        data_a[:, np.newaxis], n_resamples, seed_a, max_memory_bytes, max_workers
+    )[:, 0]
+    means_b = _bootstrap_means(
+        data_b[:, np.newaxis], n_resamples, seed_b, max_memory_bytes, max_workers
+    )[:, 0]
+    return ABD(
+        a=bootstrap(means_a, data_a),
+        b=bootstrap(means_b, data_b),
+        diff=bootstrap(means_b - means_a, data_a, data_b),
+    )
+
+
+def _interval_function(method: str, ci_percentage: int):
+    """Return function that computes CI from bootstrap means and original data"""
+
+    def bootstrap(means: np.ndarray, *samples: np.ndarray) -> Tuple[float, float]:
+        if method == "percentile":
+            return _percentile_interval(means, ci_percentage)
+        return _bca_interval(means, samples, ci_percentage)
+
+    return bootstrap
+
+
+def _bootstrap_means(
+    data: np.ndarray,
+    n_resamples: int,
+    seed: np.random.SeedSequence,
+    max_memory_bytes: int,
+    max_workers: int = None,
+) -> np.ndarray:
+    """Compute column means of `n_resamples` resamples of the rows of `data`
+
+    Rows are resampled together, so paired data stay paired.
+    """
+    data = np.asfortranarray(data)
+    block_sizes = _block_sizes(len(data), n_resamples, max_memory_bytes)
+    seeds = seed.spawn(len(block_sizes))
+    if max_workers is None:
+        blocks = map(_block_means, repeat(data), seeds, block_sizes)
+        return np.concatenate(list(blocks))
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(block_sizes) // (4 * max_workers))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        blocks = executor.map(
+            _block_means, repeat(data), seeds, block_sizes, chunksize=chunksize
+        )
+        return np.concatenate(list(blocks))
+
+
+def _block_sizes(num_rows: int, n_resamples: int, max_memory_bytes: int) -> List[int]:
+    """Split resamples into blocks whose indices and values fit in memory cap"""
+    if n_resamples <= 0:
+        raise ValueError("`n_resamples` must be a positive integer")
+    bytes_per_resample = num_rows * (INDEX_BYTES + 8)
+    block_size = int(min(max(1, max_memory_bytes // bytes_per_resample), n_resamples))
+    num_full_blocks, remainder = divmod(n_resamples, block_size)
+    return [block_size] * num_full_blocks + ([remainder] if remainder else [])
+
+
+def _block_means(
+    data: np.ndarray, seed: np.random.SeedSequence, block_size: int
+) -> np.ndarray:
+    """Compute column means for a block of resamples drawn with replacement
+
+    Values are taken from one (contiguous) column at a time, which is much
+    faster than indexing rows of a 2-D array.
+    """
+    rng = np.random.default_rng(seed)
+    indexes = rng.integers(0, len(data), size=(block_size, len(data)))
+    return np.column_stack([np.take(column, indexes).mean(axis=1) for column in data.T])
+
+
+def _alpha(ci_percentage: int) -> float:
+    return (100 - ci_percentage) / 200
+
+
+def _percentile_interval(means: np.ndarray, ci_percentage: int) -> Tuple[float, float]:
+    alpha = _alpha(ci_percentage)
+    lower, upper = np.percentile(means, [100 * alpha, 100 * (1 - alpha)])
+    return lower, upper
+
+
+def _bca_interval(
+    means: np.ndarray, samples: Tuple[np.ndarray], ci_percentage: int
+) -> Tuple[float, float]:
+    """Bias-corrected and accelerated bootstrap interval
+
+    The statistic is the mean of one sample or, with two samples, the
+    difference of their means (second minus first).
+
+    Equation from: Efron B, Tibshirani RJ (1993). An Introduction to the
+                   Bootstrap. Chapman & Hall, New York. Chapter 14
+    """
+    from scipy.stats import norm
+
+    observed = _statistic(*(np.mean(sample) for sample in samples))
+    # Proportion is clipped so that the correction is finite, e.g. when all
+    # bootstrap means are equal because data (or paired differences) are constant
+    min_proportion = 1 / (2 * len(means))
+    proportion = np.clip(np.mean(means < observed), min_proportion, 1 - min_proportion)
+    bias_correction = norm.ppf(proportion)
+    acceleration = _acceleration(samples)
+    alpha = _alpha(ci_percentage)
+    z_alpha = norm.ppf([alpha, 1 - alpha])
+    z_adjusted = bias_correction + (bias_correction + z_alpha) / (
+        1 - acceleration * (bias_correction + z_alpha)
+    )
+    lower, upper = np.percentile(means, 100 * norm.cdf(z_adjusted))
+    return lower, upper
+
+
+def _statistic(*sample_means: float) -> float:
+    if len(sample_means) == 1:
+        return sample_means[0]
+    return sample_means[1] - sample_means[0]
+
+
+def _acceleration(samples: Tuple[np.ndarray]) -> float:
+    """Estimate acceleration from jackknife (leave-one-out) values of statistic
+
+    Acceleration is 0 if all jackknife values are equal (e.g. constant data).
+    """
+    sample_means = [np.mean(sample) for sample in samples]
+    numerator, denominator = 0.0, 0.0
+    for i, sample in enumerate(samples):
+        num_samples = len(sample)
+        jackknife_means = (np.sum(sample) - sample) / (num_samples - 1)
+        jackknife_stats = _statistic(
+            *(
+                jackknife_means if j == i else sample_mean
+                for j, sample_mean in enumerate(sample_means)
+            )
+        )
+        deviations = (num_samples - 1) * (np.mean(jackknife_stats) - jackknife_stats)
+        numerator += np.sum(deviations ** 3) / num_samples ** 3
+        denominator += np.sum(deviations ** 2) / num_samples ** 2
+    if denominator == 0:
+        return 0.0
+    return numerator / (6 * denominator ** 1.5)
@@ -0,0 +1,270 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from functools import lru_cache
+from importlib import metadata
+from io import BytesIO
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+import numpy as np
+
+from pliffy import estimate, utils
+from pliffy.utils import ABD
+
+DEFAULT_MAX_BYTES = 500 * 2 ** 20
+ENTRY_SUFFIX = ".entry"
+TEMP_SUFFIX = ".tmp"
+HASH_CHUNK_SIZE = 2 ** 20
+VERSIONS_PATTERN = "pliffy-*_matplotlib-*"
+# Subdirectories of other versions not written to for this long are deleted
+STALE_VERSION_SECONDS = 30 * 24 * 60 * 60
+# Fields that do not change the figure or the estimates
+UNHASHED_FIELDS = ("data_a", "data_b", "plot_name", "save", "save_path", "show")
+# Matplotlib settings that do not change figures (`font.size` is set by pliffy)
+UNHASHED_RC_PARAMS = ("backend", "backend_fallback", "interactive", "font.size")
+
+
+class CachedPlot(NamedTuple):
+    """Content of figure file (in `save_type` format) and estimates of ABD plot"""
+
+    image: bytes
+    estimates: ABD
+
+
+class PlotCache:
+    """On-disk cache of ABD figures and estimates
+
+    Entries are keyed by a hash of the data and of all fields of
+    `PliffyInfoABD` that change the figure or estimates, as well as the
+    Matplotlib settings (`rcParams`). Entries are stored in a subdirectory
+    specific to the versions of pliffy and Matplotlib. Processes using other
+    versions can share the same directory; `clear` also deletes subdirectories
+    of other versions not written to for `STALE_VERSION_SECONDS`.
+
+    When the total size of entries exceeds `max_bytes`, least recently used
+    entries are deleted. Entries are written to a temporary file that is then
+    renamed, so several processes can share a cache: readers see complete
+    entries or none, and concurrent writers of the same entry store identical
+    content.
+
+    Parameters
+    ----------
+    directory
+        Directory where entries are stored; created if needed
+    max_bytes
+        Maximum total size of entries
+
+    Examples
+    --------
+
+    >>> from pliffy.cache import PlotCache, plot_abd_cached
+    >>> cache = PlotCache(".pliffy_cache")
+    >>> image, estimates = plot_abd_cached(info, cache)
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(directory)
+        self.directory = self.root / _versions()
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, info: "utils.PliffyInfoABD") -> str:
+        """Hash of data, settings and Matplotlib settings used to plot `info`"""
+        info = utils.load_data(info)
+        digest = hashlib.sha256()
+        for data in (info.data_a, info.data_b):
+            _hash_array(digest, data)
+        settings = [
+            (name, value)
+            for name, value in info._asdict().items()
+            if name not in UNHASHED_FIELDS
+        ]
+        digest.update(repr(settings).encode())
+        digest.update(repr(_rc_params()).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CachedPlot]:
+        """Cached plot for `key`, or `None` if not cached"""
+        path = self._path(key)
+        try:
+            content = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        header, image = content.split(b"\n", 1)
+        return CachedPlot(image=image, estimates=_estimates_from_json(header))
+
+    def put(self, key: str, plot: CachedPlot):
+        """Store `plot` for `key`, then evict least recently used entries"""
+        content = _estimates_to_json(plot.estimates) + b"\n" + plot.image
+        try:
+            temp_path = self._write_temporary(content)
+        except FileNotFoundError:
+            # Directory deleted, e.g. by `clear` in another process
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp_path = self._write_temporary(content)
+        try:
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            # Entry in use by another process (Windows) or directory deleted
+            _remove(temp_path)
+        self._evict()
+
+    def size(self) -> int:
+        """Total size of entries in bytes"""
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def clear(self):
+        """Delete all entries, and subdirectories of stale other versions"""
+        for path, _ in self._entries():
+            _remove(path)
+        self._remove_stale_versions()
+
+    def _write_temporary(self, content: bytes) -> Path:
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=TEMP_SUFFIX, delete=False
+        ) as file:
+            file.write(content)
+        return Path(file.name)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (key + ENTRY_SUFFIX)
+
+    def _entries(self):
+        """Yield path and stat of each entry"""
+        for path in self.directory.glob("*" + ENTRY_SUFFIX):
+            try:
+                yield path, path.stat()
+            except FileNotFoundError:
+                continue
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            total -= stat.st_size
+
+    def _remove_stale_versions(self):
+        """Delete subdirectories of other versions not written to recently
+
+        Writing an entry renames a file into the subdirectory, which updates
+        its modification time.
+        """
+        oldest = time.time() - STALE_VERSION_SECONDS
+        for path in self.root.glob(VERSIONS_PATTERN):
+            try:
+                stale = path.is_dir() and path.stat().st_mtime < oldest
+            except FileNotFoundError:
+                continue
+            if stale and path != self.directory:
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def plot_abd_cached(info: "utils.PliffyInfoABD", cache: PlotCache) -> CachedPlot:
+    """Generate ABD plot and estimates, or get them from `cache`
+
+    On a cache hit, nothing is computed or rendered. Otherwise, estimates are
+    computed (nothing is printed), the figure is rendered in memory using
+    `save_type` and `dpi` (see `plot_abd_bytes`) and both are stored in the
+    cache. The figure is never shown; if `save=True`, it is also written to
+    `save_path` as `plot_abd` would.
+    """
+    key = cache.key(info)
+    plot = cache.get(key)
+    if plot is None:
+        plot = _render(utils.load_data(info))
+        cache.put(key, plot)
+    if info.save:
+        _save(info, plot.image)
+    return plot
+
+
+def _render(info: "utils.PliffyInfoABD") -> CachedPlot:
+    from pliffy import plot
+
+    estimates = estimate.estimate_abd(info)
+    buffer = BytesIO()
+    info = info._replace(save=True, save_path=buffer, show=False)
+    plot._close_figure(plot._plot_estimates(info, estimates))
+    return CachedPlot(image=buffer.getvalue(), estimates=estimates)
+
+
+def _save(info: "utils.PliffyInfoABD", image: bytes):
+    if not isinstance(info.save_path, (str, os.PathLike)):
+        info.save_path.write(image)
+        return
+    path = Path(info.save_path) / (info.plot_name + "." + info.save_type)
+    path.write_bytes(image)
+
+
+def _hash_array(digest, data):
+    if estimate._is_chunked(data):
+        raise ValueError("Cached plots require data held in memory")
+    data = np.asarray(data)
+    digest.update(repr(data.shape).encode())
+    flat = data.reshape(-1)
+    for start in range(0, len(flat), HASH_CHUNK_SIZE):
+        chunk = flat[start : start + HASH_CHUNK_SIZE]
+        digest.update(np.ascontiguousarray(chunk, dtype=float))
+
+
+def _rc_params() -> list:
+    import matplotlib
+
+    return [
+        (name, repr(value))
+        for name, value in sorted(matplotlib.rcParams.items())
+        if name not in UNHASHED_RC_PARAMS
+    ]
+
+
+@lru_cache(maxsize=None)
+def _versions() -> str:
+    """Name of cache subdirectory for installed pliffy and Matplotlib
+
+    A hash of pliffy source files is included so that entries are also
+    invalidated by changes to pliffy that are not released as new versions.
+    """
+    source = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.rglob("*.py")):
+        source.update(path.read_bytes())
+    return (
+        f"pliffy-{_version('pliffy')}-{source.hexdigest()[:12]}"
+        f"_matplotlib-{_version('matplotlib')}"
+    )
+
+
+def _version(package: str) -> str:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _estimates_to_json(estimates: ABD) -> bytes:
+    return json.dumps(
+        [[float(est.mean), [float(value) for value in est.ci]] for est in estimates]
+    ).encode()
+
+
+def _estimates_from_json(header: bytes) -> ABD:
+    return ABD(
+        *(
+            estimate.Estimates(mean=mean, ci=tuple(ci))
+            for mean, ci in json.loads(header)
+        )
+    )
+
+
+def _remove(path: Path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
@@ -1,17 +1,31 @@
-from typing import NamedTuple, Tuple, List
+import copy
+from collections import defaultdict
+from functools import lru_cache
+from typing import NamedTuple, Tuple, List, Literal, Sequence, Iterator, Callable, Any
 
-from scipy.stats import t
 import numpy as np
 
+from pliffy import utils
 from pliffy.utils import ABD
 
 
 VALID_DESIGN = ("unpaired", "paired")
+VALID_CI_METHOD = ("t", "percentile", "bca")
+VALID_UNPAIRED_VARIANCE = ("pooled", "welch")
+MOMENTS_CHUNK_SIZE = 2 ** 16
+T_VALUE_CACHE_SIZE = 1024
+UNEQUAL_LENGTH_MESSAGE = (
+    "`PliffyInfoABD.data_a` and `PliffyInfoABD.data_b` must have the "
+    "same length in paired design."
+)
 
 
 def calc_abd(info: "utils.PliffyInfoABD") -> "ABD":
     """Calculate means, mean difference and confidence interval for ABD
 
+    Estimates are printed to the Python console as a table. Use `estimate_abd`
+    to calculate estimates without printing.
+
     Parameters
     ----------
     info
@@ -19,33 +33,117 @@ def calc_abd(info: "utils.PliffyInfoABD") -> "ABD":
             First set of data
         b
             Second set of data
+            `a` and `b` can also be iterables (e.g. generators) of NumPy arrays,
+            which are read one chunk at a time to limit memory use
         design
             Flag to identify if data `a` and `b` are `paired` or `unpaired`
         ci_percentage
             Desired confidence interval.
             Example: 95 or 99
     """
+    return estimate_abd(info, report=print)
+
+
+def estimate_abd(
+    info: "utils.PliffyInfoABD", report: Callable[[str], Any] = None
+) -> "ABD":
+    """Calculate means, mean difference and confidence interval for ABD
+
+    Same as `calc_abd`, but nothing is printed unless `report` is provided.
+
+    Parameters
+    ----------
+    info
+        Same as for `calc_abd`
+    report
+        Optional function called with the table of estimates, for example
+        `print` or `logging.getLogger(__name__).info`
+
+    Examples
+    --------
+
+    >>> estimates = estimate_abd(PliffyInfoABD(data_a=data_a, data_b=data_b))
+    >>> estimates.diff.ci
+    """
+    _check_settings(info)
+    info = utils.load_data(info)
+    estimates = _estimates_from_moments(*_calc_moments(info), info)
+    if info.ci_method != "t":
+        estimates = _bootstrap_confidence_intervals(estimates, info)
+    if report is not None:
+        _report_estimates(estimates, info, report)
+    return estimates
+
+
+def _check_settings(info: "utils.PliffyInfoABD"):
     if info.design not in VALID_DESIGN:
         raise ValueError(
             "`PliffyData.design` must be set to either 'paired' or 'unpaired'"
         )
-    estimates_a, estimates_b = _calc_means_and_confidence_intervals(info)
+    if info.ci_method not in VALID_CI_METHOD:
+        raise ValueError(
+            "`PliffyData.ci_method` must be set to either 't', 'percentile' or 'bca'"
+        )
+    if info.unpaired_variance not in VALID_UNPAIRED_VARIANCE:
+        raise ValueError(
+            "`PliffyData.unpaired_variance` must be set to either 'pooled' or 'welch'"
+        )
+
+
+def _estimates_from_moments(
+    moments_a: "Moments",
+    moments_b: "Moments",
+    moments_diff: "Moments",
+    info: "utils.PliffyInfoABD",
+) -> ABD:
+    """Calculate t-based means and confidence intervals from moments of data"""
+    estimates_a = _mean_and_confidence_interval(moments_a, info.ci_percentage)
+    estimates_b = _mean_and_confidence_interval(moments_b, info.ci_percentage)
     estimates_diff = None
-    if info.design == "unpaired":
-        estimates_diff = _unpaired_mean_diff_and_confidence_interval(
-            info, estimates_a, estimates_b
+    if info.design == "unpaired" and info.unpaired_variance == "welch":
+        estimates_diff = _welch_diff_confidence_interval(
+            estimates_b.mean - estimates_a.mean,
+            moments_a,
+            moments_b,
+            info.ci_percentage,
+        )
+    elif info.design == "unpaired":
+        estimates_diff = _unpaired_diff_confidence_interval(
+            estimates_b.mean - estimates_a.mean,
+            moments_a,
+            moments_b,
+            info.ci_percentage,
         )
     if info.design == "paired":
-        estimates_diff = _paired_mean_diff_and_confidence_interval(info)
-    estimates = ABD(a=estimates_a, b=estimates_b, diff=estimates_diff)
-    _print_estimates(estimates, info)
-    return estimates
+        estimates_diff = _mean_and_confidence_interval(moments_diff, info.ci_percentage)
+    return ABD(a=estimates_a, b=estimates_b, diff=estimates_diff)
+
+
+def _bootstrap_confidence_intervals(estimates: ABD, info: "utils.PliffyInfoABD") -> ABD:
+    """Replace t-based confidence intervals with bootstrap confidence intervals"""
+    if _is_chunked(info.data_a) or _is_chunked(info.data_b):
+        raise ValueError("Bootstrap confidence intervals require data held in memory")
+    from pliffy import bootstrap
+
+    data_a, data_b = _data_arrays(info)
+    cis = bootstrap.bootstrap_abd(
+        data_a,
+        data_b,
+        design=info.design,
+        ci_percentage=info.ci_percentage,
+        method=info.ci_method,
+        n_resamples=info.bootstrap_resamples,
+        seed=info.bootstrap_seed,
+    )
+    return ABD(*(Estimates(mean=est.mean, ci=ci) for est, ci in zip(estimates, cis)))
 
 
-def _print_estimates(estimates: ABD, info: "utils.PliffyInfoABD"):
-    """Print estimates for a, b and diff to Python console as a table"""
+def _report_estimates(
+    estimates: ABD, info: "utils.PliffyInfoABD", report: Callable[[str], Any] = print
+):
+    """Report estimates for a, b and diff as a table (default: print to console)"""
     estimates_table = _make_estimates_table(estimates, info)
-    print(estimates_table)
+    report(estimates_table)
 
 
 def _make_estimates_table(estimates: ABD, info: "utils.PliffyInfoABD") -> str:
@@ -69,6 +167,191 @@ class Estimates(NamedTuple):
     ci: Tuple[float, float] = None
 
 
+class Moments(NamedTuple):
+    """Sufficient statistics of a set of data
+
+    `m2` is the sum of squared deviations from the mean. Moments of separate
+    sets of data can be combined with `_merge_moments`.
+    """
+
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @property
+    def sd(self) -> float:
+        """Standard deviation, computed as with `np.std` (i.e. `ddof=0`)"""
+        return np.sqrt(self.m2 / self.n)
+
+    @property
+    def sem(self) -> float:
+        return self.sd / np.sqrt(self.n)
+
+
+def _moments(data: np.ndarray) -> Moments:
+    """Compute sufficient statistics in a single pass over memory
+
+    Data is processed in chunks small enough to stay in cache. Within a chunk,
+    mean and squared deviations are computed as with `np.mean` and `np.std`;
+    chunks are then merged. 2-D data is reduced along its first axis. Chunks
+    are converted to float64 one at a time, so float32 data is not copied.
+    """
+    data = np.asarray(data)
+    moments = Moments()
+    for start in range(0, len(data), MOMENTS_CHUNK_SIZE):
+        chunk = np.asarray(data[start : start + MOMENTS_CHUNK_SIZE], dtype=float)
+        moments = _merge_moments(moments, _chunk_moments(chunk))
+    return moments
+
+
+def _chunk_moments(chunk: np.ndarray) -> Moments:
+    mean = np.mean(chunk, axis=0)
+    deviations = chunk - mean
+    m2 = np.sum(np.multiply(deviations, deviations, out=deviations), axis=0)
+    return Moments(n=len(chunk), mean=mean, m2=m2)
+
+
+def _merge_moments(moments_x: Moments, moments_y: Moments) -> Moments:
+    """Combine moments of two sets of data
+
+    Equation from: Chan TF, Golub GH, LeVeque RJ (1979). Updating formulae and a
+                   pairwise algorithm for computing sample variances.
+                   Stanford University, Technical Report STAN-CS-79-773
+    """
+    if moments_x.n == 0:
+        return moments_y
+    if moments_y.n == 0:
+        return moments_x
+    n = moments_x.n + moments_y.n
+    delta = moments_y.mean - moments_x.mean
+    mean = moments_x.mean + delta * (moments_y.n / n)
+    m2 = moments_x.m2 + moments_y.m2 + delta ** 2 * (moments_x.n * moments_y.n / n)
+    return Moments(n=n, mean=mean, m2=m2)
+
+
+def _remove_moments(moments_xy: Moments, moments_y: Moments) -> Moments:
+    """Remove moments of data `y` from combined moments of data `x` and `y`
+
+    Inverse of `_merge_moments`. Subtraction loses precision when most of the
+    data is removed.
+    """
+    if moments_y.n == 0:
+        return moments_xy
+    n = moments_xy.n - moments_y.n
+    if n < 0:
+        raise ValueError(
+            f"Cannot remove {moments_y.n} observations from {moments_xy.n}"
+        )
+    if n == 0:
+        return Moments()
+    mean = moments_xy.mean + (moments_xy.mean - moments_y.mean) * (moments_y.n / n)
+    delta = moments_y.mean - mean
+    m2 = moments_xy.m2 - moments_y.m2 - delta ** 2 * (n * moments_y.n / moments_xy.n)
+    return Moments(n=n, mean=mean, m2=max(m2, 0.0))
+
+
+def _calc_moments(
+    info: "utils.PliffyInfoABD",
+) -> Tuple[Moments, Moments, Moments]:
+    """Compute moments of data `a`, `b` and, if paired, of their difference"""
+    if _is_chunked(info.data_a) or _is_chunked(info.data_b):
+        return _calc_chunked_moments(info)
+    data_a, data_b = _data_arrays(info)
+    moments_diff = None
+    if info.design == "paired":
+        _check_paired_length(len(data_a), len(data_b))
+        moments_diff = _paired_diff_moments(data_a, data_b)
+    return _moments(data_a), _moments(data_b), moments_diff
+
+
+def _paired_diff_moments(data_a: np.ndarray, data_b: np.ndarray) -> Moments:
+    """Compute moments of paired differences one chunk at a time
+
+    Avoids creating an array of all differences, which matters when data are
+    memory-mapped.
+    """
+    return _accumulate_moments(
+        np.subtract(
+            data_b[start : start + MOMENTS_CHUNK_SIZE],
+            data_a[start : start + MOMENTS_CHUNK_SIZE],
+            dtype=float,
+        )
+        for start in range(0, len(data_a), MOMENTS_CHUNK_SIZE)
+    )
+
+
+def _is_chunked(data) -> Literal[True, False]:
+    """Determine whether data is provided as an iterable of chunks
+
+    Sequences with a length (lists, tuples, arrays, `range`, `pandas.Series`,
+    ...) hold all data in memory; iterables without a length (e.g. a
+    generator) are assumed to provide chunks of data.
+    """
+    return not hasattr(data, "__len__")
+
+
+def _iter_chunks(data) -> Iterator[np.ndarray]:
+    """Iterate over data as 1-D float arrays"""
+    if not _is_chunked(data):
+        data = [data]
+    for chunk in data:
+        yield np.asarray(chunk, dtype=float).ravel()
+
+
+def _calc_chunked_moments(
+    info: "utils.PliffyInfoABD",
+) -> Tuple[Moments, Moments, Moments]:
+    """Accumulate moments of data `a`, `b` and paired difference chunk by chunk"""
+    chunks_a, chunks_b = _iter_chunks(info.data_a), _iter_chunks(info.data_b)
+    if info.design == "unpaired":
+        return _accumulate_moments(chunks_a), _accumulate_moments(chunks_b), None
+    moments_a, moments_b, moments_diff = Moments(), Moments(), Moments()
+    for chunk_a, chunk_b in _aligned_chunks(chunks_a, chunks_b):
+        moments_a = _merge_moments(moments_a, _moments(chunk_a))
+        moments_b = _merge_moments(moments_b, _moments(chunk_b))
+        moments_diff = _merge_moments(moments_diff, _moments(chunk_b - chunk_a))
+    return moments_a, moments_b, moments_diff
+
+
+def _accumulate_moments(chunks: Iterator[np.ndarray]) -> Moments:
+    moments = Moments()
+    for chunk in chunks:
+        moments = _merge_moments(moments, _moments(chunk))
+    return moments
+
+
+def _aligned_chunks(
+    chunks_a: Iterator[np.ndarray], chunks_b: Iterator[np.ndarray]
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield pairs of chunks of equal length from two iterators of chunks
+
+    Chunks of `a` and `b` do not need to have the same lengths; at most one
+    chunk of each is held in memory at a time.
+    """
+    chunk_a, chunk_b = np.empty(0), np.empty(0)
+    while True:
+        if len(chunk_a) == 0:
+            chunk_a = next(chunks_a, None)
+        if len(chunk_b) == 0:
+            chunk_b = next(chunks_b, None)
+        if chunk_a is None or chunk_b is None:
+            if not (chunk_a is None and chunk_b is None):
+                raise UnequalLength(UNEQUAL_LENGTH_MESSAGE)
+            return
+        size = min(len(chunk_a), len(chunk_b))
+        yield chunk_a[:size], chunk_b[:size]
+        chunk_a, chunk_b = chunk_a[size:], chunk_b[size:]
+
+
+def _data_arrays(info: "utils.PliffyInfoABD") -> Tuple[np.ndarray, np.ndarray]:
+    """Convert data `a` and `b` to float arrays
+
+    Arrays prepared by `utils.load_data` (including float32 arrays) are
+    returned as they are rather than copied.
+    """
+    return utils._load(info.data_a), utils._load(info.data_b)
+
+
 def _calc_means_and_confidence_intervals(
     info: "utils.PliffyInfoABD",
 ) -> Tuple["Estimates"]:
@@ -82,49 +365,204 @@ def _calc_mean_and_confidence_interval(
     data: List[float], ci_percentage: int
 ) -> "Estimate":
     """Calculate mean and confidence interval for single set of data"""
-    data_len = len(data)
-    data_sem = np.std(data) / np.sqrt(data_len)
-    data_mean = np.mean(data)
-    t_value = _t_value(ci_percentage, data_len)
-    margin_of_error = data_sem * t_value
-    ci_vals = (data_mean - margin_of_error, data_mean + margin_of_error)
-    return Estimates(mean=data_mean, ci=ci_vals)
+    return _mean_and_confidence_interval(_moments(data), ci_percentage)
+
+
+def _mean_and_confidence_interval(moments: Moments, ci_percentage: int) -> "Estimate":
+    """Calculate mean and confidence interval from moments of a set of data"""
+    t_value = _t_value(ci_percentage, moments.n)
+    margin_of_error = moments.sem * t_value
+    ci_vals = (moments.mean - margin_of_error, moments.mean + margin_of_error)
+    return Estimates(mean=moments.mean, ci=ci_vals)
 
 
 def _sem(data: List[float]) -> float:
     """Compute standard error of the mean"""
-    return np.std(data) / (np.sqrt(len(data)))
+    return _moments(data).sem
 
 
 def _t_value(ci: int, degrees_of_freedom: int):
-    """Compute student t-value based on degrees-of-freedom and confidence interval"""
-    one_sided_conf_int = (100 - (100 - ci) / 2) / 100
-    return t.ppf(one_sided_conf_int, degrees_of_freedom)
+    """Compute student t-value based on degrees-of-freedom and confidence interval
+
+    Values are looked up in the table built by `precompute_t_values`, if
+    available, otherwise computed and memoized.
+    """
+    global _t_value_table_hits
+    if ci in _t_value_table and isinstance(degrees_of_freedom, (int, np.integer)):
+        table = _t_value_table[ci]
+        if 1 <= degrees_of_freedom <= len(table):
+            _t_value_table_hits += 1
+            return table[degrees_of_freedom - 1]
+    return _cached_t_value(ci, degrees_of_freedom)
+
+
+def _t_values(ci: int, degrees_of_freedom: np.ndarray) -> np.ndarray:
+    """Compute student t-values for an array of degrees-of-freedom
+
+    Integer degrees-of-freedom found in the table built by `precompute_t_values`
+    are looked up; the others are computed together.
+    """
+    global _t_value_table_hits
+    degrees_of_freedom = np.asarray(degrees_of_freedom, dtype=float)
+    t_values = np.empty_like(degrees_of_freedom)
+    to_compute = np.ones(degrees_of_freedom.shape, dtype=bool)
+    if ci in _t_value_table:
+        table = _t_value_table[ci]
+        in_table = (
+            (degrees_of_freedom == np.round(degrees_of_freedom))
+            & (degrees_of_freedom >= 1)
+            & (degrees_of_freedom <= len(table))
+        )
+        t_values[in_table] = table[degrees_of_freedom[in_table].astype(int) - 1]
+        _t_value_table_hits += int(np.count_nonzero(in_table))
+        to_compute = ~in_table
+    if np.any(to_compute):
+        from scipy.stats import t
+
+        t_values[to_compute] = t.ppf(
+            _one_sided_conf_int(ci), degrees_of_freedom[to_compute]
+        )
+    return t_values
+
+
+@lru_cache(maxsize=T_VALUE_CACHE_SIZE)
+def _cached_t_value(ci: int, degrees_of_freedom: int):
+    from scipy.stats import t
+
+    return t.ppf(_one_sided_conf_int(ci), degrees_of_freedom)
+
+
+def _one_sided_conf_int(ci: int) -> float:
+    return (100 - (100 - ci) / 2) / 100
+
+
+_t_value_table = dict()
+_t_value_table_hits = 0
+
+
+def precompute_t_values(
+    ci_percentages: Sequence[int] = (90, 95, 99), max_degrees_of_freedom: int = 1000
+):
+    """Precompute table of student t-values used to compute confidence intervals
+
+    Values are computed for each confidence interval and degrees-of-freedom
+    from 1 to `max_degrees_of_freedom`; other values are computed when needed
+    and memoized.
+
+    Examples
+    --------
+
+    >>> precompute_t_values(ci_percentages=(95,), max_degrees_of_freedom=5000)
+    >>> t_value_cache_info()
+    """
+    from scipy.stats import t
+
+    degrees_of_freedom = np.arange(1, max_degrees_of_freedom + 1)
+    for ci in ci_percentages:
+        _t_value_table[ci] = t.ppf(_one_sided_conf_int(ci), degrees_of_freedom)
+
+
+class TValueCacheInfo(NamedTuple):
+    """Number of student t-values found in or missing from cache and table"""
+
+    hits: int
+    misses: int
+    table_hits: int
+    cache_size: int
+    table_size: int
+
+
+def t_value_cache_info() -> TValueCacheInfo:
+    """Report cache and table statistics of student t-values"""
+    cache_info = _cached_t_value.cache_info()
+    return TValueCacheInfo(
+        hits=cache_info.hits,
+        misses=cache_info.misses,
+        table_hits=_t_value_table_hits,
+        cache_size=cache_info.currsize,
+        table_size=sum(len(table) for table in _t_value_table.values()),
+    )
+
+
+def clear_t_value_cache():
+    """Clear cached and precomputed student t-values and reset statistics"""
+    global _t_value_table_hits
+    _cached_t_value.cache_clear()
+    _t_value_table.clear()
+    _t_value_table_hits = 0
 
 
 def _unpaired_mean_diff_and_confidence_interval(
     info: "utils.PliffyInfoABD", estimates_a: "Estimate", estimates_b: "Estimate"
 ):
-    """Calculate mean difference and confidence interval of the mean difference
+    """Calculate mean difference and confidence interval of the mean difference"""
+    data_a, data_b = _data_arrays(info)
+    diff_mean = estimates_b.mean - estimates_a.mean
+    return _unpaired_diff_confidence_interval(
+        diff_mean, _moments(data_a), _moments(data_b), info.ci_percentage
+    )
+
+
+def _unpaired_diff_confidence_interval(
+    diff_mean: float, moments_a: Moments, moments_b: Moments, ci_percentage: int
+) -> "Estimates":
+    """Calculate confidence interval of the unpaired mean difference
 
     Equation from: Cumming G, Calin-Jageman R (2017). Introduction to the New
                    Statistics: Estimation, Open Science, and Beyond.
                    Routledge, New York
     """
-    len_data_a, len_data_b = _data_len(info)
-    degrees_of_freedom = len_data_a + len_data_b - 2
-    t_component = _t_value(info.ci_percentage, degrees_of_freedom)
-    weighted_sd_a = _weighted_sd(info.data_a)
-    weighted_sd_b = _weighted_sd(info.data_b)
+    degrees_of_freedom = moments_a.n + moments_b.n - 2
+    t_component = _t_value(ci_percentage, degrees_of_freedom)
+    weighted_sd_a = _weighted_sd_from_moments(moments_a)
+    weighted_sd_b = _weighted_sd_from_moments(moments_b)
     variabilility_component = np.sqrt(
         (weighted_sd_a + weighted_sd_b) / degrees_of_freedom
     )
-    sample_size_component = np.sqrt(1 / len_data_a + 1 / len_data_b)
+    sample_size_component = np.sqrt(1 / moments_a.n + 1 / moments_b.n)
     margin_of_error = t_component * variabilility_component * sample_size_component
-    diff_mean = estimates_b.mean - estimates_a.mean
     diff_ci_vals = (diff_mean - margin_of_error, diff_mean + margin_of_error)
-    estimates_diff = Estimates(mean=diff_mean, ci=diff_ci_vals)
-    return estimates_diff
+    return Estimates(mean=diff_mean, ci=diff_ci_vals)
+
+
+def _welch_diff_confidence_interval(
+    diff_mean: float, moments_a: Moments, moments_b: Moments, ci_percentage: int
+) -> "Estimates":
+    """Calculate confidence interval of the unpaired mean difference (Welch)
+
+    Variances of `a` and `b` are not assumed to be equal; degrees-of-freedom
+    are approximated with the Welch-Satterthwaite equation.
+
+    Equation from: Welch BL (1947). The generalization of 'Student's' problem
+                   when several different population variances are involved.
+                   Biometrika 34(1-2):28-35
+    """
+    variance_a, variance_b = moments_a.sem ** 2, moments_b.sem ** 2
+    degrees_of_freedom = _welch_degrees_of_freedom(
+        variance_a, variance_b, moments_a.n, moments_b.n
+    )
+    t_component = _t_value(ci_percentage, float(degrees_of_freedom))
+    margin_of_error = t_component * np.sqrt(variance_a + variance_b)
+    diff_ci_vals = (diff_mean - margin_of_error, diff_mean + margin_of_error)
+    return Estimates(mean=diff_mean, ci=diff_ci_vals)
+
+
+def _welch_degrees_of_freedom(variance_a, variance_b, len_data_a, len_data_b):
+    """Welch-Satterthwaite degrees-of-freedom from squared SEMs of `a` and `b`
+
+    Works on single values and on arrays of values alike. When neither group
+    varies, the interval has zero width and pooled degrees-of-freedom are used.
+    """
+    if min(len_data_a, len_data_b) < 2:
+        raise ValueError(
+            "Welch confidence intervals require at least 2 values in each group"
+        )
+    denominator = np.add(
+        variance_a ** 2 / (len_data_a - 1), variance_b ** 2 / (len_data_b - 1)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        degrees_of_freedom = (variance_a + variance_b) ** 2 / denominator
+    return np.where(denominator == 0, len_data_a + len_data_b - 2, degrees_of_freedom)
 
 
 def _data_len(info: "utils.PliffyInfoABD") -> Tuple[int, int]:
@@ -134,27 +572,377 @@ def _data_len(info: "utils.PliffyInfoABD") -> Tuple[int, int]:
 
 def _weighted_sd(data: List[float]) -> float:
     """Calculate weighted standard deviation"""
-    return (len(data) - 1) * (np.std(data)) ** 2
+    return _weighted_sd_from_moments(_moments(data))
+
+
+def _weighted_sd_from_moments(moments: Moments) -> float:
+    return (moments.n - 1) * moments.sd ** 2
 
 
 def _paired_mean_diff_and_confidence_interval(info: "utils.PliffyInfoABD"):
     """Calculate mean difference of confidence interval of the mean difference"""
-    len_data_a, len_data_b = _data_len(info)
+    data_a, data_b = _data_arrays(info)
+    _check_paired_length(len(data_a), len(data_b))
+    moments_diff = _paired_diff_moments(data_a, data_b)
+    return _mean_and_confidence_interval(moments_diff, info.ci_percentage)
+
+
+def _check_paired_length(len_data_a: int, len_data_b: int):
     if len_data_a != len_data_b:
-        raise UnequalLength(
-            "`PliffyInfoABD.data_a` and `PliffyInfoABD.data_b` must have the "
-            "same length in paired design."
-        )
-    diff_vals = _calc_paired_diffs(info)
-    estimates_diff = _calc_mean_and_confidence_interval(diff_vals, info.ci_percentage)
-    return estimates_diff
+        raise UnequalLength(UNEQUAL_LENGTH_MESSAGE)
 
 
 def _calc_paired_diffs(info: "utils.PliffyInfoABD"):
-    """Calculate paired difference for data in `a` and `b`"""
+    """Calculate paired difference for data in `a` and `b`
+
+    Differences are returned as a float64 NumPy array if either data is an
+    array (as prepared by `utils.load_data`), otherwise as a list.
+    """
+    if isinstance(info.data_a, np.ndarray) or isinstance(info.data_b, np.ndarray):
+        return np.subtract(info.data_b, info.data_a, dtype=float)
     return [b - a for a, b in zip(info.data_a, info.data_b)]
 
 
+ESTIMATE_DTYPE = np.dtype(
+    [
+        ("mean", float),
+        ("sd", float),
+        ("sem", float),
+        ("t_value", float),
+        ("ci", float, (2,)),
+    ]
+)
+ABD_DTYPE = np.dtype(
+    [("a", ESTIMATE_DTYPE), ("b", ESTIMATE_DTYPE), ("diff", ESTIMATE_DTYPE)]
+)
+
+
+def calc_abd_batch(
+    data_a: np.ndarray,
+    data_b: np.ndarray,
+    ci_percentage: int = 95,
+    design: Literal["paired", "unpaired"] = "unpaired",
+    unpaired_variance: Literal["pooled", "welch"] = "pooled",
+) -> np.ndarray:
+    """Calculate estimates for ABD of many comparisons at once
+
+    Each column of `data_a` and `data_b` is one comparison. Estimates match
+    those of `calc_abd` applied to each column in turn; standard deviations
+    are computed with `np.std` (i.e. `ddof=0`), as in `calc_abd`.
+
+    Parameters
+    ----------
+    data_a
+        2-D array of first set of data, one column per comparison
+    data_b
+        2-D array of second set of data, one column per comparison
+    ci_percentage
+        Desired confidence interval.
+        Example: 95 or 99
+    design
+        Flag to identify if data `a` and `b` are `paired` or `unpaired`
+    unpaired_variance
+        "pooled" or "welch" variance for the unpaired mean difference. With
+        "welch", `sd` of the difference is undefined (NaN) and `t_value` is
+        based on Welch-Satterthwaite degrees-of-freedom of each comparison
+
+    Returns
+    -------
+    Structured array with one element per comparison and fields `a`, `b` and
+    `diff`, each with fields `mean`, `sd`, `sem`, `t_value` and `ci`
+
+    Examples
+    --------
+
+    >>> batch = calc_abd_batch(data_a, data_b, design="paired")
+    >>> batch["diff"]["ci"][:, 0]
+    """
+    if design not in VALID_DESIGN:
+        raise ValueError(
+            "`PliffyData.design` must be set to either 'paired' or 'unpaired'"
+        )
+    if unpaired_variance not in VALID_UNPAIRED_VARIANCE:
+        raise ValueError(
+            "`unpaired_variance` must be set to either 'pooled' or 'welch'"
+        )
+    data_a, data_b = _as_columns(data_a), _as_columns(data_b)
+    if data_a.shape[1] != data_b.shape[1]:
+        raise ValueError("`data_a` and `data_b` must have the same number of columns")
+    batch = np.empty(data_a.shape[1], dtype=ABD_DTYPE)
+    _batch_mean_and_confidence_interval(batch["a"], data_a, ci_percentage)
+    _batch_mean_and_confidence_interval(batch["b"], data_b, ci_percentage)
+    if design == "unpaired" and unpaired_variance == "welch":
+        _batch_welch_mean_diff_and_confidence_interval(
+            batch, len(data_a), len(data_b), ci_percentage
+        )
+    elif design == "unpaired":
+        _batch_unpaired_mean_diff_and_confidence_interval(
+            batch, len(data_a), len(data_b), ci_percentage
+        )
+    if design == "paired":
+        if len(data_a) != len(data_b):
+            raise UnequalLength(
+                "`data_a` and `data_b` must have the same number of rows in "
+                "paired design."
+            )
+        _batch_mean_and_confidence_interval(
+            batch["diff"], data_b - data_a, ci_percentage
+        )
+    return batch
+
+
+def _as_columns(data: np.ndarray) -> np.ndarray:
+    """Convert data to 2-D float array, with a 1-D array treated as one column
+
+    Fortran ordering keeps each column contiguous, so reductions along columns
+    are computed as they would be for each column on its own.
+    """
+    data = np.asarray(data, dtype=float)
+    if data.ndim == 1:
+        data = data[:, np.newaxis]
+    return np.asfortranarray(data)
+
+
+def _batch_mean_and_confidence_interval(
+    estimates: np.ndarray, data: np.ndarray, ci_percentage: int
+):
+    """Fill mean, SD, SEM, t-value and CI for each column of `data`"""
+    moments = _moments(data)
+    estimates["mean"] = moments.mean
+    estimates["sd"] = moments.sd
+    estimates["sem"] = moments.sem
+    estimates["t_value"] = _t_value(ci_percentage, moments.n)
+    _batch_confidence_interval(estimates, estimates["sem"] * estimates["t_value"])
+
+
+def _batch_unpaired_mean_diff_and_confidence_interval(
+    batch: np.ndarray, len_data_a: int, len_data_b: int, ci_percentage: int
+):
+    """Fill mean difference and its CI for each unpaired comparison
+
+    `sd` of the difference is the pooled standard deviation.
+    """
+    degrees_of_freedom = len_data_a + len_data_b - 2
+    weighted_sd_a = (len_data_a - 1) * batch["a"]["sd"] ** 2
+    weighted_sd_b = (len_data_b - 1) * batch["b"]["sd"] ** 2
+    diff = batch["diff"]
+    diff["mean"] = batch["b"]["mean"] - batch["a"]["mean"]
+    diff["sd"] = np.sqrt((weighted_sd_a + weighted_sd_b) / degrees_of_freedom)
+    sample_size_component = np.sqrt(1 / len_data_a + 1 / len_data_b)
+    diff["sem"] = diff["sd"] * sample_size_component
+    diff["t_value"] = _t_value(ci_percentage, degrees_of_freedom)
+    _batch_confidence_interval(
+        diff, diff["t_value"] * diff["sd"] * sample_size_component
+    )
+
+
+def _batch_welch_mean_diff_and_confidence_interval(
+    batch: np.ndarray, len_data_a: int, len_data_b: int, ci_percentage: int
+):
+    """Fill mean difference and its Welch CI for each unpaired comparison"""
+    variance_a, variance_b = batch["a"]["sem"] ** 2, batch["b"]["sem"] ** 2
+    degrees_of_freedom = _welch_degrees_of_freedom(
+        variance_a, variance_b, len_data_a, len_data_b
+    )
+    diff = batch["diff"]
+    diff["mean"] = batch["b"]["mean"] - batch["a"]["mean"]
+    diff["sd"] = np.nan
+    diff["sem"] = np.sqrt(variance_a + variance_b)
+    diff["t_value"] = _t_values(ci_percentage, degrees_of_freedom)
+    _batch_confidence_interval(diff, diff["t_value"] * diff["sem"])
+
+
+def _batch_confidence_interval(estimates: np.ndarray, margin_of_error: np.ndarray):
+    estimates["ci"][:, 0] = estimates["mean"] - margin_of_error
+    estimates["ci"][:, 1] = estimates["mean"] + margin_of_error
+
+
+def calc_abd_many(
+    infos: Sequence["utils.PliffyInfoABD"], report: Callable[[str], Any] = print
+) -> List["ABD"]:
+    """Calculate estimates for many `PliffyInfoABD` using `calc_abd_batch`
+
+    Comparisons with the same design, confidence interval, unpaired variance
+    and data lengths are stacked into columns and computed together;
+    comparisons with bootstrap confidence intervals or with data provided as
+    chunks are computed one at a time (see `estimate_abd`).
+    As with `calc_abd`, estimates of each comparison are printed to the Python
+    console; set `report` to another function (or `None`) to change this.
+    """
+    infos = [utils.load_data(info) for info in infos]
+    all_estimates = [None] * len(infos)
+    batches = defaultdict(list)
+    for index, info in enumerate(infos):
+        if (
+            info.ci_method != "t"
+            or _is_chunked(info.data_a)
+            or _is_chunked(info.data_b)
+        ):
+            all_estimates[index] = estimate_abd(info)
+            continue
+        key = (
+            info.design,
+            info.ci_percentage,
+            info.unpaired_variance,
+            len(info.data_a),
+            len(info.data_b),
+        )
+        batches[key].append(index)
+    for (design, ci_percentage, unpaired_variance, _, _), indexes in batches.items():
+        batch = calc_abd_batch(
+            np.column_stack([infos[index].data_a for index in indexes]),
+            np.column_stack([infos[index].data_b for index in indexes]),
+            ci_percentage,
+            design,
+            unpaired_variance,
+        )
+        for index, estimates in zip(indexes, _abd_from_batch(batch)):
+            all_estimates[index] = estimates
+    if report is not None:
+        for estimates, info in zip(all_estimates, infos):
+            _report_estimates(estimates, info, report)
+    return all_estimates
+
+
+def _abd_from_batch(batch: np.ndarray) -> List["ABD"]:
+    """Convert structured array from `calc_abd_batch` to list of ABD of Estimates"""
+    return [
+        ABD(
+            a=_estimates_from_batch(row["a"]),
+            b=_estimates_from_batch(row["b"]),
+            diff=_estimates_from_batch(row["diff"]),
+        )
+        for row in batch
+    ]
+
+
+def _estimates_from_batch(estimates: np.void) -> "Estimates":
+    ci = estimates["ci"]
+    return Estimates(mean=estimates["mean"], ci=(ci[0], ci[1]))
+
+
+class IncrementalEstimator:
+    """Estimates for ABD that are updated as observations are added or removed
+
+    Moments of `a`, `b` and (paired design) their difference are kept rather
+    than the data. Adding or removing k observations costs O(k), and estimates
+    are computed from the moments in constant time. Estimators of separate
+    parts of the data (e.g. computed by several workers) can be merged.
+    Estimates match those of `estimate_abd` for the same data, within
+    floating-point error.
+
+    Only t-based confidence intervals (`ci_method="t"`) can be updated
+    incrementally.
+
+    Parameters
+    ----------
+    info
+        Settings (`design`, `ci_percentage`, `unpaired_variance`) and initial
+        data. `data_a` and `data_b` can be empty
+
+    Examples
+    --------
+
+    >>> estimator = IncrementalEstimator(PliffyInfoABD(data_a=[], data_b=[]))
+    >>> estimator.add_a(first_chunk_a)
+    >>> estimator.add_b(first_chunk_b)
+    >>> estimator.estimates.diff.ci
+    >>> estimator = estimator.merge(estimator_from_worker)
+    """
+
+    def __init__(self, info: "utils.PliffyInfoABD"):
+        _check_settings(info)
+        if info.ci_method != "t":
+            raise ValueError(
+                "`IncrementalEstimator` requires `PliffyData.ci_method` to be set "
+                "to 't'"
+            )
+        self.info = info._replace(data_a=[], data_b=[])
+        self.moments = ABD(*_calc_moments(utils.load_data(info)))
+
+    @property
+    def estimates(self) -> "ABD":
+        """Means and confidence intervals of current data"""
+        if self.moments.a.n == 0 or self.moments.b.n == 0:
+            raise ValueError(
+                "Estimates require at least one observation in `a` and `b`"
+            )
+        return _estimates_from_moments(*self.moments, self.info)
+
+    def add_a(self, values: Sequence[float]):
+        """Add observations to data `a` (unpaired design)"""
+        self._check_design("unpaired", "add_a")
+        self._update(a=_moments(_as_1d(values)))
+
+    def add_b(self, values: Sequence[float]):
+        """Add observations to data `b` (unpaired design)"""
+        self._check_design("unpaired", "add_b")
+        self._update(b=_moments(_as_1d(values)))
+
+    def add_pair(self, values_a: Sequence[float], values_b: Sequence[float]):
+        """Add paired observations to data `a` and `b` (paired design)"""
+        self._check_design("paired", "add_pair")
+        self._update(**self._pair_moments(values_a, values_b))
+
+    def remove_a(self, values: Sequence[float]):
+        """Remove previously added observations from data `a` (unpaired design)"""
+        self._check_design("unpaired", "remove_a")
+        self._update(_remove_moments, a=_moments(_as_1d(values)))
+
+    def remove_b(self, values: Sequence[float]):
+        """Remove previously added observations from data `b` (unpaired design)"""
+        self._check_design("unpaired", "remove_b")
+        self._update(_remove_moments, b=_moments(_as_1d(values)))
+
+    def remove_pair(self, values_a: Sequence[float], values_b: Sequence[float]):
+        """Remove previously added pairs from data `a` and `b` (paired design)"""
+        self._check_design("paired", "remove_pair")
+        self._update(_remove_moments, **self._pair_moments(values_a, values_b))
+
+    def merge(self, other: "IncrementalEstimator") -> "IncrementalEstimator":
+        """Combine with estimator of other observations of the same comparison"""
+        settings = ("design", "ci_percentage", "unpaired_variance")
+        if any(
+            getattr(self.info, name) != getattr(other.info, name) for name in settings
+        ):
+            raise ValueError("Cannot merge estimators with different settings")
+        merged = copy.copy(self)
+        merged._update(**other.moments._asdict())
+        return merged
+
+    def _check_design(self, design: str, method: str):
+        if self.info.design != design:
+            raise ValueError(
+                f"`{method}` can only be used with {design} design, "
+                f"not {self.info.design}"
+            )
+
+    @staticmethod
+    def _pair_moments(values_a: Sequence[float], values_b: Sequence[float]) -> dict:
+        values_a, values_b = _as_1d(values_a), _as_1d(values_b)
+        _check_paired_length(len(values_a), len(values_b))
+        return dict(
+            a=_moments(values_a),
+            b=_moments(values_b),
+            diff=_moments(values_b - values_a),
+        )
+
+    def _update(self, combine: Callable = _merge_moments, **moments: Moments):
+        """Combine current moments with `moments` of `a`, `b` and/or `diff`"""
+        self.moments = self.moments._replace(
+            **{
+                name: combine(getattr(self.moments, name), group_moments)
+                for name, group_moments in moments.items()
+                if group_moments is not None
+            }
+        )
+
+
+def _as_1d(values: Sequence[float]) -> np.ndarray:
+    return np.atleast_1d(np.asarray(values, dtype=float))
+
+
 class UnequalLength(Exception):
     """Custom exception for paired analysis when data_a/data_b not same length"""
+
     pass
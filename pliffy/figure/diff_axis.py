@@ -1,8 +1,10 @@
 from typing import Literal, Tuple
 
 import numpy as np
+from matplotlib.transforms import Bbox, TransformedBbox
 
 from pliffy import utils, parser
+from pliffy.figure import ticks
 
 DIFF_X = 2.5
 DIFF_WIDTH = 0.5
@@ -60,7 +62,7 @@ class DiffAxCreator:
         """
 
         if self._true_false_plot_raw_diff():
-            return min(self.diff_fig_info.raw_diff.data)
+            return np.min(self.diff_fig_info.raw_diff.data)
         else:
             return self.diff_fig_info.ci_diff.data[1][0]
 
@@ -73,7 +75,7 @@ class DiffAxCreator:
         """
 
         if self._true_false_plot_raw_diff():
-            return max(self.diff_fig_info.raw_diff.data)
+            return np.max(self.diff_fig_info.raw_diff.data)
         else:
             return self.diff_fig_info.ci_diff.data[1][1]
 
@@ -92,20 +94,13 @@ class DiffAxCreator:
         return self.parent_figure.info.mean_a.data[1] - abs(self.yticks[0])
 
     def _optimize_diff_yticks(self) -> Tuple[float]:
-        """Optimise yticks to use for floating difference axis"""
-        min_ytick = 0
-        while True:
-            if self.min_diff < min_ytick:
-                min_ytick -= self.ytick_step
-            else:
-                break
-        max_ytick = 0
-        while True:
-            if self.max_diff > max_ytick:
-                max_ytick += self.ytick_step
-            else:
-                break
-        return tuple(np.arange(min_ytick, max_ytick + self.ytick_step, self.ytick_step))
+        """Optimise yticks to use for floating difference axis
+
+        Yticks are multiples of the parent ytick step and always include zero.
+        """
+        return ticks.enclosing_ticks(
+            min(self.min_diff, 0), max(self.max_diff, 0), self.ytick_step
+        )
 
     def _calc_diff_height(self) -> float:
         return self.yticks[-1] - self.yticks[0]
@@ -119,3 +114,32 @@ class DiffAxCreator:
         diff_ax.set_yticks(self.yticks)
         diff_ax.set_ylim((min(self.yticks), max(self.yticks)))
         return diff_ax
+
+    def update_diff_ax(self, diff_ax):
+        """Move, rescale and set yticks of difference axis created by `diff_ax`"""
+        diff_ax.set_axes_locator(
+            _DataBoundsLocator(
+                (self.x, self.y, self.width, self.height),
+                self.parent_figure.ax.transData,
+            )
+        )
+        diff_ax.set_yticks(self.yticks)
+        diff_ax.set_ylim((min(self.yticks), max(self.yticks)))
+
+
+class _DataBoundsLocator:
+    """Locate axis at `bounds` (x, y, width, height) in `transform` coordinates
+
+    Same as the locator of `Axes.inset_axes`; the position is computed at draw
+    time so it follows changes to the limits of the parent axis.
+    """
+
+    def __init__(self, bounds: Tuple[float, float, float, float], transform):
+        self.bounds = bounds
+        self.transform = transform
+
+    def __call__(self, ax, renderer):
+        return TransformedBbox(
+            Bbox.from_bounds(*self.bounds),
+            self.transform - ax.figure.transFigure,
+        )
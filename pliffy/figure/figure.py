@@ -1,7 +1,15 @@
 from typing import Literal, Tuple
 
+import numpy as np
+import matplotlib
+from matplotlib.collections import LineCollection
+from matplotlib.colors import LinearSegmentedColormap, to_rgba
+
 from pliffy.parser import Xticks, Raw, Mean, CI, Paired
 
+DENSITY_GRIDSIZE = (3, 50)
+DENSITY_MIN_ALPHA = 0.1
+
 
 class Figure:
     """Mixin class to add low-level plotting ability"""
@@ -30,18 +38,113 @@ class Figure:
         self.ax.set_ylabel(ylabel)
 
     def _plot_raw_data(self, raw: "Raw"):
-        xval = raw.xval
-        for datum in raw.data:
-            self.ax.plot(xval, datum, clip_on=False, **raw.format_)
-            xval += raw.jitter
+        """Plot all raw data points of a group as a single artist"""
+        data = np.asarray(raw.data, dtype=float)
+        xvals = _jittered_xvals(raw.xval, raw.jitter, len(data))
+        if raw.display == "density":
+            return self._plot_raw_density(
+                xvals, data, raw.format_["color"], raw.rasterized
+            )
+        return self.ax.plot(
+            xvals,
+            data,
+            linestyle="none",
+            clip_on=False,
+            rasterized=raw.rasterized,
+            **raw.format_,
+        )[0]
+
+    def _update_raw_data(self, artist, raw: "Raw"):
+        """Replace raw data points of a group plotted by `_plot_raw_data`
+
+        Density strips are binned when created, so they are replaced.
+        """
+        if raw.display == "density":
+            artist.remove()
+            return self._plot_raw_data(raw)
+        data = np.asarray(raw.data, dtype=float)
+        artist.set_data(_jittered_xvals(raw.xval, raw.jitter, len(data)), data)
+        return artist
+
+    def _plot_raw_density(
+        self, xvals: np.ndarray, data: np.ndarray, color: str, rasterized: bool
+    ):
+        """Plot raw data of a group as a strip of hexagonal bins
+
+        Bin opacity increases with the (log) number of points in the bin.
+        """
+        cmap = LinearSegmentedColormap.from_list(
+            "density", [to_rgba(color, DENSITY_MIN_ALPHA), to_rgba(color, 1)]
+        )
+        return self.ax.hexbin(
+            xvals,
+            data,
+            gridsize=DENSITY_GRIDSIZE,
+            bins="log",
+            mincnt=1,
+            cmap=cmap,
+            linewidths=0,
+            clip_on=False,
+            rasterized=rasterized,
+        )
+
+    def _plot_raw_note(self, note: str):
+        """Write how many raw data points were drawn above top-left of axis"""
+        return self.ax.text(
+            0, 1, note, transform=self.ax.transAxes, fontsize="x-small", va="bottom"
+        )
 
     def _plot_mean_ci(self, mean_: "Mean", ci: "CI"):
-        self.ax.plot(*mean_.data, **mean_.format_)
-        self.ax.plot(*ci.data, **ci.format_)
+        mean_line = self.ax.plot(*mean_.data, **mean_.format_)[0]
+        ci_line = self.ax.plot(*ci.data, **ci.format_)[0]
+        return mean_line, ci_line
+
+    def _update_mean_ci(self, lines, mean_: "Mean", ci: "CI"):
+        """Move mean and CI plotted by `_plot_mean_ci`"""
+        mean_line, ci_line = lines
+        mean_line.set_data([mean_.data[0]], [mean_.data[1]])
+        ci_line.set_data(*ci.data)
 
     def _plot_paired_lines(self, paired: "Paired"):
-        xvals = list(paired.xvals)
-        for a, b in zip(paired.a, paired.b):
-            self.ax.plot(xvals, [a, b], **paired.format_)
-            xvals[0] += paired.jitter
-            xvals[1] -= paired.jitter
+        """Plot all paired joining lines as a single LineCollection"""
+        segments = _paired_segments(paired)
+        lines = LineCollection(
+            segments,
+            colors=paired.format_["color"],
+            linewidths=paired.format_["linewidth"],
+            alpha=paired.format_["alpha"],
+            capstyle=matplotlib.rcParams["lines.solid_capstyle"],
+            joinstyle=matplotlib.rcParams["lines.solid_joinstyle"],
+            rasterized=paired.rasterized,
+        )
+        self.ax.add_collection(lines)
+        self.ax.autoscale_view()
+        return lines
+
+    def _update_paired_lines(self, lines, paired: "Paired"):
+        """Replace paired joining lines plotted by `_plot_paired_lines`"""
+        lines.set_segments(_paired_segments(paired))
+
+
+def _jittered_xvals(start: float, jitter: float, num_vals: int) -> np.ndarray:
+    """Generate x-values that start at `start` and step by `jitter`
+
+    A cumulative sum is used (rather than `np.arange`) so that values are
+    identical to repeatedly adding `jitter` to `start`.
+    """
+    steps = np.full(num_vals, jitter, dtype=float)
+    if num_vals:
+        steps[0] = start
+    return np.cumsum(steps)
+
+
+def _paired_segments(paired: "Paired") -> np.ndarray:
+    """Build (N, 2, 2) array of line segments joining jittered paired values"""
+    data_a = np.asarray(paired.a, dtype=float)
+    data_b = np.asarray(paired.b, dtype=float)
+    segments = np.empty((len(data_a), 2, 2))
+    segments[:, 0, 0] = _jittered_xvals(paired.xvals[0], paired.jitter, len(data_a))
+    segments[:, 0, 1] = data_a
+    segments[:, 1, 0] = _jittered_xvals(paired.xvals[1], -paired.jitter, len(data_b))
+    segments[:, 1, 1] = data_b
+    return segments
@@ -3,8 +3,10 @@ from typing import Literal, Tuple
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure as MatplotlibFigure
 
-from pliffy.figure import Figure
+from pliffy.figure import Figure, ticks
 from pliffy import parser
 
 
@@ -30,21 +32,47 @@ class FigureAB(Figure):
             ax = self._make_figure_axis()
             self.show = True
         self.ax = ax
-        self.min_raw_data = self._min_raw_data()
-        self.max_raw_data = self._max_raw_data()
+        self.tick_space = ax.yaxis.get_tick_space()
+        self.min_raw_data, self.max_raw_data = _raw_data_range(info)
+        self.ytick_step, self.yticks = self._optimise_yticks()
         self._plot()
-        self.ytick_step, self.yticks = self._tweak_yaxis()
+        self._tweak_yaxis()
 
-    def _make_figure_axis(self):
-        width_height_in_inches = self.info.width_height_in_inches
-        ax = plt.subplots(figsize=width_height_in_inches)[1]
-        return ax
+    def update(self, info: "parser.FigureInfoAB"):
+        """Plot new data on existing artists and adjust yticks
 
-    def _min_raw_data(self) -> float:
-        return min(min(self.info.raw_a.data), min(self.info.raw_b.data))
+        `info` must only differ from the current info by its data and
+        estimates; formats and design are those used to create the figure.
+        """
+        matplotlib.rcParams.update({"font.size": info.fontsize})
+        self.info = info
+        self.min_raw_data, self.max_raw_data = _raw_data_range(info)
+        self.ytick_step, self.yticks = self._optimise_yticks()
+        self._update_ab_raw_data()
+        self._update_mean_ci(self.mean_ci_a, info.mean_a, info.ci_a)
+        self._update_mean_ci(self.mean_ci_b, info.mean_b, info.ci_b)
+        self._tweak_yaxis()
+
+    def data_artists(self) -> list:
+        """Artists that show data or estimates, and change when data change"""
+        artists = [*self.raw_artists, *self.mean_ci_a, *self.mean_ci_b]
+        if self.raw_note is not None:
+            artists.append(self.raw_note)
+        return artists
 
-    def _max_raw_data(self) -> float:
-        return max(max(self.info.raw_a.data), max(self.info.raw_b.data))
+    def _make_figure_axis(self):
+        """Create figure and axis
+
+        Only figures to be shown are managed by pyplot. Other figures are
+        attached to an Agg canvas and hold no global state: they are freed once
+        no longer referenced.
+        """
+        width_height_in_inches = self.info.width_height_in_inches
+        if self.info.show:
+            return plt.subplots(figsize=width_height_in_inches)[1]
+        fig = MatplotlibFigure(figsize=width_height_in_inches)
+        FigureCanvasAgg(fig)
+        return fig.add_subplot()
 
     def _plot(self):
         self._plot_ab_raw_data()
@@ -52,15 +80,33 @@ class FigureAB(Figure):
         self._tweak_xaxis()
 
     def _plot_ab_means_cis(self):
-        self._plot_mean_ci(self.info.mean_a, self.info.ci_a)
-        self._plot_mean_ci(self.info.mean_b, self.info.ci_b)
+        self.mean_ci_a = self._plot_mean_ci(self.info.mean_a, self.info.ci_a)
+        self.mean_ci_b = self._plot_mean_ci(self.info.mean_b, self.info.ci_b)
 
     def _plot_ab_raw_data(self):
         if self._data_paired_and_want_lines():
-            self._plot_paired_lines(self.info.paired_lines)
+            self.raw_artists = (self._plot_paired_lines(self.info.paired_lines),)
+        else:
+            self.raw_artists = (
+                self._plot_raw_data(self.info.raw_a),
+                self._plot_raw_data(self.info.raw_b),
+            )
+        self.raw_note = None
+        if self.info.raw_note:
+            self.raw_note = self._plot_raw_note(self.info.raw_note)
+
+    def _update_ab_raw_data(self):
+        if self._data_paired_and_want_lines():
+            self._update_paired_lines(self.raw_artists[0], self.info.paired_lines)
         else:
-            self._plot_raw_data(self.info.raw_a)
-            self._plot_raw_data(self.info.raw_b)
+            self.raw_artists = (
+                self._update_raw_data(self.raw_artists[0], self.info.raw_a),
+                self._update_raw_data(self.raw_artists[1], self.info.raw_b),
+            )
+        if self.raw_note is not None:
+            self.raw_note.set_text(self.info.raw_note)
+        elif self.info.raw_note:
+            self.raw_note = self._plot_raw_note(self.info.raw_note)
 
     def _data_paired_and_want_lines(self) -> Literal[True, False]:
         return (self.info.design == "paired") and self.info.plot_paired_lines
@@ -73,48 +119,68 @@ class FigureAB(Figure):
     def _tweak_yaxis(self):
         self._remove_ax_spine("right")
         self._set_ylabel(self.info.ylabel)
-        ytick_step, yticks = self._optimise_yticks()
-        self._set_ylim((yticks[0], yticks[-1]))
-        return ytick_step, yticks
+        self._set_yticks(self.yticks)
+        self._set_ylim((self.yticks[0], self.yticks[-1]))
 
     def _optimise_yticks(self) -> Tuple[float, Tuple[float]]:
-        """Find yticks that include all raw data points"""
-        current_yticks = self.ax.get_yticks()
-        ytick_step = current_yticks[1] - current_yticks[0]
-        conservative_yticks = self._gen_conservative_yticks(current_yticks, ytick_step)
-        min_ytick = self._find_min_ytick(conservative_yticks)
-        max_ytick = self._find_max_ytick(conservative_yticks)
-        optimised_yticks = self._gen_optimised_yticks(min_ytick, max_ytick, ytick_step)
-        self._set_yticks(optimised_yticks)
-        return ytick_step, optimised_yticks
-
-    def _gen_conservative_yticks(self, current_yticks, ytick_step):
-        """Add three extra ytick at either end"""
-        return tuple(
-            np.arange(
-                current_yticks[0] - ytick_step * EXTRA_Y_TICKS,
-                current_yticks[-1] + EXTRA_Y_TICKS * ytick_step,
-                ytick_step,
-            )
-        )
+        """Find yticks that include all raw data points
+
+        Computed from the data before anything is plotted (see `ab_yticks`),
+        using the space available for ticks when the axis was created.
+        """
+        return ab_yticks(self.info, self.tick_space, self.ax.margins()[1])
+
+
+def ab_yticks(
+    info: "parser.FigureInfoAB", tick_space: int, margin: float = None
+) -> Tuple[float, Tuple[float]]:
+    """Find ytick step and yticks of AB part of figure from its data alone
 
-    def _find_min_ytick(self, conservative_yticks: Tuple[float]) -> float:
-        """Find min ytick that includes all raw data point"""
-        min_ytick = float()
-        for tick in reversed(conservative_yticks):
-            if self.min_raw_data > tick:
-                min_ytick = tick
-                break
-        return min_ytick
-
-    def _find_max_ytick(self, conservative_yticks: Tuple[float]) -> float:
-        """Find max ytick that includes all raw data point"""
-        max_ytick = float()
-        for tick in conservative_yticks:
-            if self.max_raw_data < tick:
-                max_ytick = tick
-                break
-        return max_ytick
-
-    def _gen_optimised_yticks(self, min_ytick, max_ytick, ytick_step):
-        return tuple(np.arange(min_ytick, max_ytick + ytick_step, ytick_step))
+    The step and positions are those Matplotlib would choose for an axis
+    autoscaled to the raw data, means and CIs; yticks then extend to the first
+    tick strictly beyond the lowest and highest raw data points, and no further. As no artists are needed, the
+    layout of the figure (including the diff axis) can be computed, cached or
+    parallelised independently of plotting.
+
+    Parameters
+    ----------
+    info
+        Parsed data and details to plot AB part of figure
+    tick_space
+        Number of ticks that fit on the y-axis, see `Axis.get_tick_space`
+    margin
+        Fraction of data range added at either end when autoscaling. Defaults
+        to `rcParams["axes.ymargin"]`
+    """
+    min_raw_data, max_raw_data = _raw_data_range(info)
+    summary_values = [
+        value
+        for value in (
+            info.mean_a.data[1],
+            info.mean_b.data[1],
+            *info.ci_a.data[1],
+            *info.ci_b.data[1],
+        )
+        if np.isfinite(value)
+    ]
+    current_yticks = ticks.data_ticks(
+        min(min_raw_data, *summary_values),
+        max(max_raw_data, *summary_values),
+        tick_space,
+        margin,
+    )
+    ytick_step = current_yticks[1] - current_yticks[0]
+    optimised_yticks = ticks.enclosing_ticks(
+        min_raw_data,
+        max_raw_data,
+        ytick_step,
+        origin=current_yticks[0] - ytick_step * EXTRA_Y_TICKS,
+        strict=True,
+    )
+    return ytick_step, optimised_yticks
+
+
+def _raw_data_range(info: "parser.FigureInfoAB") -> Tuple[float, float]:
+    min_raw_data = min(np.min(info.raw_a.data), np.min(info.raw_b.data))
+    max_raw_data = max(np.max(info.raw_a.data), np.max(info.raw_b.data))
+    return min_raw_data, max_raw_data
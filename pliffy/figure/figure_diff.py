@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -31,16 +32,27 @@ class FigureDiff(Figure):
         self._plot_diff_raw_data()
         self._plot_zero_line()
         self._tweak_axes()
-        plt.tight_layout()
+        self.ax.figure.tight_layout()
         self._save()
         self._show()
 
+    def update(self, info: "parser.FigureInfoDiff"):
+        """Plot new data on existing artists; figure is not saved or shown
+
+        Move and rescale the axis first (see `DiffAxCreator.update_diff_ax`).
+        """
+        self.info = info
+        self._update_mean_ci(self.mean_ci_diff, info.mean_diff, info.ci_diff)
+        if self.raw_diff is not None:
+            self.raw_diff = self._update_raw_data(self.raw_diff, info.raw_diff)
+
     def _plot_diff_mean_ci(self):
-        self._plot_mean_ci(self.info.mean_diff, self.info.ci_diff)
+        self.mean_ci_diff = self._plot_mean_ci(self.info.mean_diff, self.info.ci_diff)
 
     def _plot_diff_raw_data(self):
+        self.raw_diff = None
         if self._plot_raw_diff_true():
-            self._plot_raw_data(self.info.raw_diff)
+            self.raw_diff = self._plot_raw_data(self.info.raw_diff)
 
     def _plot_raw_diff_true(self):
         return (self.info.raw_diff.data is not None) and self.info.plot_raw_diff
@@ -76,10 +88,16 @@ class FigureDiff(Figure):
         self._remove_ax_spine("left")
 
     def _save(self):
+        """Save figure to file in `save.path`, or write it to file-like `save.path`"""
         if self.save.yes_no:
+            if not isinstance(self.save.path, (str, os.PathLike)):
+                self.ax.figure.savefig(
+                    self.save.path, format=self.save.type_, dpi=self.save.dpi
+                )
+                return
             name = self.save.name + "." + self.save.type_
             fig_path = Path(self.save.path) / name
-            plt.savefig(fig_path, dpi=self.save.dpi)
+            self.ax.figure.savefig(fig_path, dpi=self.save.dpi)
 
     def _show(self):
         if self.info.show:
@@ -0,0 +1,118 @@
+import math
+from typing import Tuple
+
+import numpy as np
+import matplotlib
+from matplotlib.ticker import AutoLocator
+
+MAX_TICKS = 10_000
+MAX_AUTO_TICK_BINS = 9
+
+
+def enclosing_ticks(
+    min_value: float,
+    max_value: float,
+    step: float,
+    origin: float = 0.0,
+    strict: bool = False,
+) -> Tuple[float]:
+    """Find fewest evenly spaced ticks that enclose `min_value` and `max_value`
+
+    Ticks lie on the grid `origin + k * step` (k integer). The first tick is the
+    highest grid value below `min_value` and the last tick the lowest grid value
+    above `max_value`; with `strict=False`, ticks equal to `min_value` or
+    `max_value` are also accepted. Tick positions are computed directly, so the
+    cost does not depend on how many steps separate the data from `origin`.
+
+    Raises
+    ------
+    ValueError
+        If `step` is not finite and positive, values are not finite, or more
+        than `MAX_TICKS` ticks would be needed
+    """
+    if not (math.isfinite(step) and step > 0):
+        raise ValueError(f"Tick step must be finite and positive, not {step}")
+    if not all(map(math.isfinite, (min_value, max_value, origin))):
+        raise ValueError(
+            f"Cannot compute ticks for non-finite values: min={min_value}, "
+            f"max={max_value}, origin={origin}"
+        )
+    if min_value > max_value:
+        raise ValueError(f"Min value ({min_value}) is greater than max ({max_value})")
+    first = _first_index(min_value, step, origin, strict)
+    last = _last_index(max_value, step, origin, strict)
+    if last - first + 1 > MAX_TICKS:
+        raise ValueError(
+            f"Tick step {step} is too small for values from {min_value} to "
+            f"{max_value}: more than {MAX_TICKS} ticks needed"
+        )
+    return tuple(origin + np.arange(first, last + 1) * step)
+
+
+def data_ticks(
+    min_value: float, max_value: float, tick_space: int, margin: float = None
+) -> np.ndarray:
+    """Find ticks Matplotlib would place on an axis autoscaled to the data range
+
+    Reproduces autoscaling (margins included) and the default tick locator
+    from the data range alone, so ticks are known before anything is plotted.
+
+    Parameters
+    ----------
+    min_value, max_value
+        Lowest and highest values plotted on the axis
+    tick_space
+        Number of ticks that fit on the axis, see `Axis.get_tick_space`
+    margin
+        Fraction of data range added at either end. Defaults to
+        `rcParams["axes.ymargin"]`
+    """
+    if margin is None:
+        margin = matplotlib.rcParams["axes.ymargin"]
+    locator = AutoLocator()
+    locator.set_params(nbins=int(np.clip(tick_space, 1, MAX_AUTO_TICK_BINS)))
+    min_value, max_value = locator.nonsingular(min_value, max_value)
+    delta = (max_value - min_value) * margin
+    view_min, view_max = locator.view_limits(min_value - delta, max_value + delta)
+    return locator.tick_values(view_min, view_max)
+
+
+def _steps_from_origin(value: float, step: float, origin: float) -> float:
+    steps = (value - origin) / step
+    if not math.isfinite(steps):
+        raise ValueError(f"Tick step {step} is too small for value {value}")
+    return steps
+
+
+def _first_index(min_value: float, step: float, origin: float, strict: bool) -> int:
+    """Index of highest grid value below (or at, if not `strict`) `min_value`
+
+    Floor division of floats can be off by one near grid values; the index is
+    corrected so that comparisons hold for the grid values actually used.
+    """
+    index = math.floor(_steps_from_origin(min_value, step, origin))
+
+    def below(i):
+        tick = origin + i * step
+        return tick < min_value if strict else tick <= min_value
+
+    if not below(index):
+        index -= 1
+    elif below(index + 1):
+        index += 1
+    return index
+
+
+def _last_index(max_value: float, step: float, origin: float, strict: bool) -> int:
+    """Index of lowest grid value above (or at, if not `strict`) `max_value`"""
+    index = math.ceil(_steps_from_origin(max_value, step, origin))
+
+    def above(i):
+        tick = origin + i * step
+        return tick > max_value if strict else tick >= max_value
+
+    if not above(index):
+        index += 1
+    elif above(index - 1):
+        index -= 1
+    return index
@@ -0,0 +1,185 @@
+from time import monotonic
+from typing import Sequence
+
+import numpy as np
+
+from pliffy import estimate, utils
+from pliffy.plot import AbdPlot
+
+REFRESH_INTERVAL = 0.1
+
+
+class LiveAbdPlot(AbdPlot):
+    """ABD plot of data that arrive while it is displayed
+
+    New observations are appended with `add_a` and `add_b` (unpaired design)
+    or `add_pair` (paired design). Estimates are updated with each new
+    observation (see `estimate.IncrementalEstimator`) rather than recomputed
+    from all data. Observations are stored in arrays whose capacity doubles
+    when full, and refreshes plot views of these arrays. The plot is refreshed
+    at most once every `refresh_interval` seconds.
+
+    Refreshes use blitting: axes, spines, labels and ticks are drawn once and
+    kept as a background, and only artists that show data or estimates are
+    redrawn on top of it (the whole difference axis is redrawn, as it moves
+    with the mean of `a`). The figure is fully redrawn and laid out again only
+    when the yticks change. Blitting requires a canvas that supports it, such
+    as Agg (headless) or most interactive backends.
+
+    Only t-based confidence intervals (`ci_method="t"`) can be updated
+    incrementally.
+
+    Parameters
+    ----------
+    info
+        Information used to generate the ABD plot, including data available
+        when the plot is created
+    refresh_interval
+        Minimum time in seconds between refreshes triggered by new data. Use
+        0 to refresh on every addition and `numpy.inf` to refresh only when
+        `refresh` is called
+    ax
+        Matplotlib axis to plot on, e.g. from a figure displayed with pyplot.
+        Defaults to a new headless figure
+
+    Examples
+    --------
+
+    >>> import matplotlib.pyplot as plt
+    >>> from pliffy import PliffyInfoABD
+    >>> from pliffy.live import LiveAbdPlot
+    >>> fig, ax = plt.subplots(figsize=(3.23, 3.23))
+    >>> info = PliffyInfoABD(data_a=baseline, data_b=first_samples)
+    >>> live_plot = LiveAbdPlot(info, refresh_interval=0.2, ax=ax)
+    >>> plt.show(block=False)
+    >>> for sample in stream:
+    ...     live_plot.add_b(sample)
+    ...     plt.pause(0.01)
+    """
+
+    def __init__(
+        self,
+        info: "utils.PliffyInfoABD",
+        refresh_interval: float = REFRESH_INTERVAL,
+        ax=None,
+    ):
+        estimator = estimate.IncrementalEstimator(info)
+        super().__init__(info, ax)
+        self.refresh_interval = refresh_interval
+        self._estimator = estimator
+        self._data_a = _Buffer(self.info.data_a)
+        self._data_b = _Buffer(self.info.data_b)
+        self._pending = False
+        self._last_refresh = monotonic()
+        self._background = None
+        self._animated = []
+        self._animate()
+        self.figure.canvas.mpl_connect("draw_event", self._on_draw)
+        self.figure.canvas.draw()
+
+    def add_a(self, values: Sequence[float]):
+        """Append observations to data `a` (unpaired design)"""
+        values = _as_array(values)
+        self._estimator.add_a(values)
+        self._data_a.extend(values)
+        self._data_added()
+
+    def add_b(self, values: Sequence[float]):
+        """Append observations to data `b` (unpaired design)"""
+        values = _as_array(values)
+        self._estimator.add_b(values)
+        self._data_b.extend(values)
+        self._data_added()
+
+    def add_pair(self, values_a: Sequence[float], values_b: Sequence[float]):
+        """Append paired observations to data `a` and `b` (paired design)"""
+        values_a, values_b = _as_array(values_a), _as_array(values_b)
+        self._estimator.add_pair(values_a, values_b)
+        self._data_a.extend(values_a)
+        self._data_b.extend(values_b)
+        self._data_added()
+
+    def refresh(self) -> bool:
+        """Plot data added since the last refresh
+
+        Returns
+        -------
+        bool
+            Whether data were added, in which case the plot was redrawn
+        """
+        if not self._pending:
+            return False
+        yticks = self.ab_figure.yticks
+        info = self.info._replace(
+            data_a=self._data_a.values, data_b=self._data_b.values
+        )
+        self._update_artists(info, self._estimator.estimates)
+        self._animate()
+        if self.ab_figure.yticks != yticks or self._background is None:
+            self._tight_layout()
+            self.figure.canvas.draw()
+        else:
+            self._blit()
+        self._pending = False
+        self._last_refresh = monotonic()
+        return True
+
+    def _data_added(self):
+        self._pending = True
+        if monotonic() - self._last_refresh >= self.refresh_interval:
+            self.refresh()
+
+    def _animate(self):
+        """Exclude data artists from figure draws, so they can be blitted"""
+        self._animated = sorted(
+            self.ab_figure.data_artists() + [self.diff_figure.ax],
+            key=lambda artist: artist.get_zorder(),
+        )
+        for artist in self._animated:
+            artist.set_animated(True)
+
+    def _on_draw(self, event):
+        """Keep background from full draws, then draw data artists on top"""
+        canvas = self.figure.canvas
+        self._background = canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated:
+            self.figure.draw_artist(artist)
+
+    def _blit(self):
+        canvas = self.figure.canvas
+        canvas.restore_region(self._background)
+        self._draw_animated()
+        canvas.blit(self.figure.bbox)
+        canvas.flush_events()
+
+
+class _Buffer:
+    """Array of observations that grows as observations are appended
+
+    Capacity doubles when full, so appending costs amortized constant time per
+    observation, and `values` is a view rather than a copy of the data.
+    """
+
+    def __init__(self, values: Sequence[float]):
+        self._array = np.array(values, dtype=float)
+        self._size = len(self._array)
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._array[: self._size]
+
+    def extend(self, values: np.ndarray):
+        size = self._size + len(values)
+        if size > len(self._array):
+            array = np.empty(max(size, 2 * len(self._array)))
+            array[: self._size] = self.values
+            self._array = array
+        self._array[self._size : size] = values
+        self._size = size
+
+
+def _as_array(values: Sequence[float]) -> np.ndarray:
+    return np.atleast_1d(np.asarray(values, dtype=float))
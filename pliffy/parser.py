@@ -1,6 +1,8 @@
-from typing import NamedTuple, Literal, Tuple, List
+from typing import NamedTuple, Literal, Tuple, Union, BinaryIO
 from pathlib import Path
 
+import numpy as np
+
 from pliffy import estimate
 from pliffy import utils
 
@@ -11,16 +13,38 @@ DIFF_XVAL_RAW = 0.15
 AB_XLIM = (0.8, 3)
 DIFF_XLIM = (0.0, 0.5)
 JITTER_RANGE = 0.1
+RAW_DISPLAYS = ("all", "subsample", "density")
 
 
 def abd(info: "utils.PliffyInfoABD", estimates: "utils.ABD"):
-    """Parse pliffy data and information to simplify plotting ABD figure"""
-    jitter = _calc_jitter(info)
-    raw_a, raw_b, raw_diff = _parse_raw_abd(info, jitter)
+    """Parse pliffy data and information to simplify plotting ABD figure
+
+    Estimates are computed from all data; with `raw_display` other than "all",
+    only the raw data to be drawn is parsed here.
+    """
+    if info.raw_display not in RAW_DISPLAYS:
+        raise ValueError(
+            "`PliffyData.raw_display` must be set to either 'all', 'subsample' "
+            "or 'density'"
+        )
+    if info.raw_max_points < 2:
+        raise ValueError("`PliffyData.raw_max_points` must be at least 2")
+    subsampled_info = _subsample(info) if _subsampled(info) else info
+    raw_info = info if info.raw_display == "density" else subsampled_info
+    raw_a, raw_b, raw_diff = _parse_raw_abd(raw_info, _calc_jitter(raw_info))
+    if info.raw_display == "density":
+        raw_a, raw_b, raw_diff = (
+            raw._replace(display="density") for raw in (raw_a, raw_b, raw_diff)
+        )
     mean_a, mean_b, mean_diff = _parse_mean_abd(info, estimates)
     ci_a, ci_b, ci_diff = _parse_ci_abd(info, estimates)
     plot_paired_lines = info.paired_data_joining_lines
-    paired_lines = _parse_paired_lines(info, jitter)
+    paired_lines = _parse_paired_lines(subsampled_info, _calc_jitter(subsampled_info))
+    if info.rasterize_raw_data:
+        raw_a, raw_b, raw_diff, paired_lines = (
+            raw._replace(rasterized=True)
+            for raw in (raw_a, raw_b, raw_diff, paired_lines)
+        )
     plot_raw_diff = info.paired_data_plot_raw_diff
     xticks = _parse_xticks(info)
     ab_xlim = AB_XLIM
@@ -49,6 +73,8 @@ def abd(info: "utils.PliffyInfoABD", estimates: "utils.ABD"):
         design=design,
         fontsize=fontsize,
         width_height_in_inches=width_height_in_inches,
+        raw_note=_raw_note(info, subsampled_info),
+        show=show,
     )
     diff_figure_info = FigureInfoDiff(
         raw_diff=raw_diff,
@@ -67,12 +93,93 @@ def _calc_jitter(info: "utils.PliffyInfoABD") -> float:
     return JITTER_RANGE / max([len(info.data_a), len(info.data_b)])
 
 
+def _subsampled(info: "utils.PliffyInfoABD") -> bool:
+    """Whether raw data to draw are subsampled
+
+    With `raw_display="density"`, all data are drawn as density strips, so only
+    paired lines, if drawn, are subsampled.
+    """
+    if info.raw_display == "density":
+        return info.design == "paired" and info.paired_data_joining_lines
+    return info.raw_display == "subsample"
+
+
+def _subsample(info: "utils.PliffyInfoABD") -> "utils.PliffyInfoABD":
+    """Keep at most `raw_max_points` quantiles of each group (pairs stay paired)"""
+    data_a, data_b = np.asarray(info.data_a), np.asarray(info.data_b)
+    if info.design == "paired":
+        indexes = _paired_quantile_indexes(data_a, data_b, info.raw_max_points)
+        return info._replace(data_a=data_a[indexes], data_b=data_b[indexes])
+    return info._replace(
+        data_a=data_a[_quantile_indexes(data_a, info.raw_max_points)],
+        data_b=data_b[_quantile_indexes(data_b, info.raw_max_points)],
+    )
+
+
+def _quantile_indexes(data: np.ndarray, max_points: int) -> np.ndarray:
+    """Indexes of at most `max_points` evenly spaced order statistics of `data`
+
+    The minimum and maximum are always included (`max_points` must be at least
+    2), so axis limits are unchanged. Indexes are sorted, so points keep their original order (and jitter).
+    """
+    if len(data) <= max_points:
+        return np.arange(len(data))
+    ranks = np.round(np.linspace(0, len(data) - 1, max_points)).astype(int)
+    return np.sort(np.argsort(data, kind="stable")[ranks])
+
+
+def _paired_quantile_indexes(
+    data_a: np.ndarray, data_b: np.ndarray, max_points: int
+) -> np.ndarray:
+    """Indexes of pairs spanning quantiles of paired differences
+
+    Pairs holding the minimum and maximum of `a` and `b` are also included when
+    `max_points` leaves room for them and at least 2 quantiles.
+    """
+    if len(data_a) <= max_points:
+        return np.arange(len(data_a))
+    extremes = [
+        np.argmin(data_a),
+        np.argmax(data_a),
+        np.argmin(data_b),
+        np.argmax(data_b),
+    ]
+    if max_points - len(extremes) < 2:
+        return _quantile_indexes(data_b - data_a, max_points)
+    diff_indexes = _quantile_indexes(data_b - data_a, max_points - len(extremes))
+    return np.union1d(diff_indexes, extremes)
+
+
+def _raw_note(
+    info: "utils.PliffyInfoABD", subsampled_info: "utils.PliffyInfoABD"
+) -> str:
+    """Describe how many raw data points were drawn (empty if all were drawn)"""
+    labels = info.xtick_labels
+    num_total_a, num_total_b = len(info.data_a), len(info.data_b)
+    num_drawn_a, num_drawn_b = len(subsampled_info.data_a), len(subsampled_info.data_b)
+    if info.design == "paired" and info.paired_data_joining_lines:
+        if num_drawn_a == num_total_a:
+            return ""
+        return f"Pairs drawn: {num_drawn_a:,} of {num_total_a:,}"
+    if info.raw_display == "density":
+        return (
+            f"Points drawn as density: {labels.a} {num_total_a:,}; "
+            f"{labels.b} {num_total_b:,}"
+        )
+    if (num_drawn_a, num_drawn_b) == (num_total_a, num_total_b):
+        return ""
+    return (
+        f"Points drawn: {labels.a} {num_drawn_a:,} of {num_total_a:,}; "
+        f"{labels.b} {num_drawn_b:,} of {num_total_b:,}"
+    )
+
+
 class Save(NamedTuple):
     """Helper namedtuple to store save-related details"""
 
     name: str
     yes_no: Literal[True, False]
-    path: Path
+    path: Union[Path, BinaryIO]
     type_: Literal["png", "svg", "pdf"] = "png"
     dpi: int = 180
 
@@ -117,10 +224,12 @@ def _raw_format(color: str, marker: str, markersize: int, alpha: float) -> dict:
 class Raw(NamedTuple):
     """Helper nametuple to store details for plotting raw data"""
 
-    data: List[float]
+    data: np.ndarray
     xval: float
     jitter: float
     format_: dict
+    display: Literal["points", "density"] = "points"
+    rasterized: Literal[True, False] = False
 
 
 def _parse_raw_abd(info: "utils.PliffyInfoABD", jitter: float) -> Tuple[Raw, Raw, Raw]:
@@ -232,11 +341,12 @@ def _parse_ci_abd(
 class Paired(NamedTuple):
     """Helper namedtuple to store data and format details to plot paired lines"""
 
-    a: List[float]
-    b: List[float]
+    a: np.ndarray
+    b: np.ndarray
     xvals: Tuple[float, float]
     jitter: float
     format_: dict
+    rasterized: Literal[True, False] = False
 
 
 def _paired_line_format(color: str, linewidth: int, alpha: float) -> dict:
@@ -287,6 +397,8 @@ class FigureInfoAB(NamedTuple):
     design: Literal["paired", "unpaired"]
     fontsize: int
     width_height_in_inches: Tuple[float, float]
+    raw_note: str = ""
+    show: Literal[True, False] = True
 
 
 class FigureInfoDiff(NamedTuple):
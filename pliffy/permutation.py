@@ -0,0 +1,394 @@
+from itertools import combinations, islice
+from typing import Literal, NamedTuple, Tuple, Iterator
+
+import numpy as np
+
+from pliffy import estimate, utils
+from pliffy.bootstrap import INDEX_BYTES
+from pliffy.utils import ABD
+
+
+MAX_PERMUTATIONS = 100_000
+BATCH_SIZE = 1_000
+MAX_MEMORY_BYTES = 2 ** 26
+# Bytes of the largest arrays created per permuted value (indices, then values)
+BATCH_BYTES_PER_VALUE = INDEX_BYTES + 8
+CI_SAMPLE_SIZE = 20_000
+TOLERANCE = 0.005
+BISECTION_ITERATIONS = 100
+RELATIVE_TIE = 1e-12
+
+
+class PermutationResult(NamedTuple):
+    """Mean difference with randomization confidence interval and p-value
+
+    `mean` and `ci` come first so that a result can replace the `Estimates`
+    of the difference in an `ABD` (see `permutation_abd`).
+    """
+
+    mean: float = None
+    ci: Tuple[float, float] = None
+    p_value: float = None
+    n_permutations: int = None
+    exact: Literal[True, False] = None
+
+
+class _Permutations(NamedTuple):
+    """Permuted mean differences at zero shift and their rate of change with shift
+
+    When `b` is shifted by `delta`, each permuted mean difference becomes
+    `stats - delta * slopes`, while the observed mean difference becomes
+    `observed - delta`.
+    """
+
+    stats: np.ndarray
+    slopes: np.ndarray
+
+
+def permutation_test(
+    data_a: np.ndarray,
+    data_b: np.ndarray,
+    design: Literal["paired", "unpaired"] = "unpaired",
+    ci_percentage: int = 95,
+    max_permutations: int = MAX_PERMUTATIONS,
+    batch_size: int = BATCH_SIZE,
+    tolerance: float = TOLERANCE,
+    seed: int = None,
+    max_memory_bytes: int = MAX_MEMORY_BYTES,
+) -> PermutationResult:
+    """Permutation test and randomization confidence interval of mean difference
+
+    Unpaired data are permuted by shuffling group labels; paired data by
+    flipping the signs of paired differences. If the number of possible
+    permutations does not exceed `max_permutations`, all are evaluated and the
+    test is exact. Otherwise, random permutations are evaluated in batches
+    until the standard error of the p-value is below `tolerance` or
+    `max_permutations` is reached.
+
+    The confidence interval contains all shifts of `b` that are not rejected
+    by the two-sided test, evaluated on the same permutations, or on a random
+    sample of `CI_SAMPLE_SIZE` of them if there are more.
+
+    Memory use is fixed: batches are made smaller if needed to fit in
+    `max_memory_bytes` however large the data, and only counts and the sample
+    used for the confidence interval are kept however many permutations are
+    evaluated.
+
+    Parameters
+    ----------
+    data_a
+        First set of data
+    data_b
+        Second set of data
+    design
+        Flag to identify if data `a` and `b` are `paired` or `unpaired`
+    ci_percentage
+        Desired confidence interval.
+        Example: 95 or 99
+    max_permutations
+        Maximum number of permutations to evaluate
+    batch_size
+        Maximum number of permutations evaluated at a time
+    tolerance
+        Stop once the standard error of the p-value is below this value
+    seed
+        Seed of `np.random.Generator` used to draw random permutations, or to
+        sample all permutations for the confidence interval
+    max_memory_bytes
+        Approximate memory limit of the arrays of a batch of permutations
+
+    Examples
+    --------
+
+    >>> result = permutation_test(data_a, data_b, design="paired", seed=1)
+    >>> result.p_value, result.ci
+    """
+    data_a = np.asarray(data_a, dtype=float)
+    data_b = np.asarray(data_b, dtype=float)
+    if design == "paired":
+        estimate._check_paired_length(len(data_a), len(data_b))
+        batch_size = _batch_size(batch_size, len(data_a), max_memory_bytes)
+        batches, exact = _sign_flips(
+            data_b - data_a, max_permutations, batch_size, seed
+        )
+    else:
+        num_values = len(data_a) + len(data_b)
+        batch_size = _batch_size(batch_size, num_values, max_memory_bytes)
+        batches, exact = _label_shuffles(
+            data_a, data_b, max_permutations, batch_size, seed
+        )
+    observed = np.mean(data_b) - np.mean(data_a)
+    sample, num_extreme, num_permutations = _evaluate(
+        batches, observed, exact, tolerance, seed
+    )
+    sample_exact = exact and len(sample.stats) == num_permutations
+    alpha = (100 - ci_percentage) / 100
+    return PermutationResult(
+        mean=observed,
+        ci=_randomization_interval(sample, observed, sample_exact, alpha),
+        p_value=_p_value_from_counts(num_extreme, num_permutations, exact),
+        n_permutations=num_permutations,
+        exact=exact,
+    )
+
+
+def permutation_abd(
+    info: "utils.PliffyInfoABD", estimates: "ABD" = None, **kwargs
+) -> "ABD":
+    """Replace estimates of the difference with a `PermutationResult`
+
+    The returned `ABD` can be used wherever estimates from `calc_abd` are used,
+    for example to plot the randomization confidence interval.
+
+    Parameters
+    ----------
+    info
+        Information used to generate ABD plot
+    estimates
+        Estimates of `a`, `b` and diff. Computed with `estimate_abd` if `None`
+    kwargs
+        Passed on to `permutation_test`
+
+    Examples
+    --------
+
+    >>> estimates = permutation_abd(info, seed=1)
+    >>> estimates.diff.p_value
+    """
+    info = utils.load_data(info)
+    if estimates is None:
+        estimates = estimate.estimate_abd(info)
+    result = permutation_test(
+        info.data_a,
+        info.data_b,
+        design=info.design,
+        ci_percentage=info.ci_percentage,
+        **kwargs,
+    )
+    return estimates._replace(diff=result)
+
+
+def _batch_size(batch_size: int, num_values: int, max_memory_bytes: int) -> int:
+    """Reduce `batch_size` so that arrays of a batch fit in `max_memory_bytes`"""
+    bytes_per_permutation = num_values * BATCH_BYTES_PER_VALUE
+    return int(max(1, min(batch_size, max_memory_bytes // bytes_per_permutation)))
+
+
+def _sign_flips(
+    diffs: np.ndarray, max_permutations: int, batch_size: int, seed: int
+) -> Tuple[Iterator[_Permutations], Literal[True, False]]:
+    """Batches of permuted mean differences obtained by flipping signs"""
+    num_diffs = len(diffs)
+    exact = num_diffs < 63 and 2 ** num_diffs <= max_permutations
+    if exact:
+        flip_batches = _all_sign_flips(num_diffs, batch_size)
+    else:
+        flip_batches = _random_sign_flips(num_diffs, max_permutations, batch_size, seed)
+    total = np.sum(diffs)
+
+    def permuted(flipped: np.ndarray) -> _Permutations:
+        num_kept = num_diffs - 2 * np.count_nonzero(flipped, axis=1)
+        return _Permutations(
+            stats=(total - 2 * (flipped @ diffs)) / num_diffs,
+            slopes=num_kept / num_diffs,
+        )
+
+    return map(permuted, flip_batches), exact
+
+
+def _all_sign_flips(num_diffs: int, batch_size: int) -> Iterator[np.ndarray]:
+    """Masks of flipped differences, for every possible combination of signs"""
+    bits = np.arange(num_diffs)
+    for start in range(0, 2 ** num_diffs, batch_size):
+        codes = np.arange(start, min(start + batch_size, 2 ** num_diffs))
+        yield ((codes[:, np.newaxis] >> bits) & 1).astype(bool)
+
+
+def _random_sign_flips(
+    num_diffs: int, max_permutations: int, batch_size: int, seed: int
+) -> Iterator[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    for start in range(0, max_permutations, batch_size):
+        size = min(batch_size, max_permutations - start)
+        yield rng.integers(0, 2, size=(size, num_diffs), dtype=np.int8).astype(bool)
+
+
+def _label_shuffles(
+    data_a: np.ndarray,
+    data_b: np.ndarray,
+    max_permutations: int,
+    batch_size: int,
+    seed: int,
+) -> Tuple[Iterator[_Permutations], Literal[True, False]]:
+    """Batches of permuted mean differences obtained by shuffling group labels"""
+    len_a, len_b = len(data_a), len(data_b)
+    pooled = np.concatenate((data_a, data_b))
+    exact = _num_label_shuffles_at_most(len_a + len_b, len_b, max_permutations)
+    if exact:
+        index_batches = _all_label_shuffles(len_a + len_b, len_b, batch_size)
+    else:
+        index_batches = _random_label_shuffles(
+            len_a + len_b, len_b, max_permutations, batch_size, seed
+        )
+    total = np.sum(pooled)
+
+    def permuted(b_indexes: np.ndarray) -> _Permutations:
+        sum_b = pooled[b_indexes].sum(axis=1)
+        stats = sum_b / len_b - (total - sum_b) / len_a
+        num_b_in_b = np.count_nonzero(b_indexes >= len_a, axis=1)
+        slopes = num_b_in_b / len_b - (len_b - num_b_in_b) / len_a
+        return _Permutations(stats=stats, slopes=slopes)
+
+    return map(permuted, index_batches), exact
+
+
+def _num_label_shuffles_at_most(num_values: int, len_b: int, limit: int) -> bool:
+    """Whether there are at most `limit` ways to choose `len_b` of `num_values`
+
+    Binomial coefficients are built one term at a time, stopping as soon as
+    `limit` is exceeded, rather than computing a huge number for large groups.
+    """
+    len_b = min(len_b, num_values - len_b)
+    num_shuffles = 1
+    for i in range(len_b):
+        num_shuffles = num_shuffles * (num_values - i) // (i + 1)
+        if num_shuffles > limit:
+            return False
+    return num_shuffles <= limit
+
+
+def _all_label_shuffles(
+    num_values: int, len_b: int, batch_size: int
+) -> Iterator[np.ndarray]:
+    """Indexes of values assigned to `b`, for every possible assignment"""
+    all_b_indexes = combinations(range(num_values), len_b)
+    while True:
+        b_indexes = np.array(list(islice(all_b_indexes, batch_size)), dtype=np.intp)
+        if len(b_indexes) == 0:
+            return
+        yield b_indexes
+
+
+def _random_label_shuffles(
+    num_values: int, len_b: int, max_permutations: int, batch_size: int, seed: int
+) -> Iterator[np.ndarray]:
+    """Indexes of values assigned to `b` by random shuffles of group labels"""
+    rng = np.random.default_rng(seed)
+    for start in range(0, max_permutations, batch_size):
+        size = min(batch_size, max_permutations - start)
+        orders = np.tile(np.arange(num_values), (size, 1))
+        rng.permuted(orders, axis=1, out=orders)
+        yield orders[:, :len_b]
+
+
+def _evaluate(
+    batches: Iterator[_Permutations],
+    observed: float,
+    exact: Literal[True, False],
+    tolerance: float,
+    seed: int,
+) -> Tuple[_Permutations, int, int]:
+    """Evaluate batches of permutations, stopping early once p-value is settled
+
+    Only counts of extreme and evaluated permutations are accumulated, along
+    with a sample of at most `CI_SAMPLE_SIZE` permutations used to find the
+    confidence interval: the first ones, as random permutations are already
+    in random order, or a random sample of all permutations (those with the
+    smallest random keys).
+    """
+    rng = np.random.default_rng(seed)
+    sample = _Permutations(stats=np.empty(0), slopes=np.empty(0))
+    keys = np.empty(0)
+    num_extreme, num_permutations = 0, 0
+    for batch in batches:
+        num_extreme += np.count_nonzero(_extreme(batch.stats, observed))
+        num_permutations += len(batch.stats)
+        if exact:
+            keys = np.concatenate((keys, rng.random(len(batch.stats))))
+            sample = _concatenate(sample, batch)
+            if len(keys) > CI_SAMPLE_SIZE:
+                kept = np.argpartition(keys, CI_SAMPLE_SIZE)[:CI_SAMPLE_SIZE]
+                keys, sample = keys[kept], _take(sample, kept)
+            continue
+        num_missing = CI_SAMPLE_SIZE - len(sample.stats)
+        if num_missing > 0:
+            sample = _concatenate(sample, _take(batch, slice(num_missing)))
+        p_value = _p_value_from_counts(num_extreme, num_permutations, exact)
+        if np.sqrt(p_value * (1 - p_value) / num_permutations) < tolerance:
+            break
+    return sample, num_extreme, num_permutations
+
+
+def _concatenate(permutations: _Permutations, other: _Permutations) -> _Permutations:
+    return _Permutations(
+        *(np.concatenate(values) for values in zip(permutations, other))
+    )
+
+
+def _take(permutations: _Permutations, indexes) -> _Permutations:
+    return _Permutations(*(values[indexes] for values in permutations))
+
+
+def _extreme(stats: np.ndarray, observed: float) -> np.ndarray:
+    """Permuted statistics at least as extreme as observed, allowing for rounding"""
+    return np.abs(stats) >= np.abs(observed) * (1 - RELATIVE_TIE)
+
+
+def _p_value(
+    permutations: _Permutations,
+    observed: float,
+    exact: Literal[True, False],
+    delta: float = 0.0,
+) -> float:
+    """Two-sided p-value of the mean difference after shifting `b` by `delta`
+
+    Random permutations include the observed data, as recommended by: Phipson B,
+    Smyth GK (2010). Permutation P-values Should Never Be Zero. Statistical
+    Applications in Genetics and Molecular Biology 9(1):39
+    """
+    stats = permutations.stats - delta * permutations.slopes
+    num_extreme = np.count_nonzero(_extreme(stats, observed - delta))
+    return _p_value_from_counts(num_extreme, len(stats), exact)
+
+
+def _p_value_from_counts(
+    num_extreme: int, num_permutations: int, exact: Literal[True, False]
+) -> float:
+    if exact:
+        return num_extreme / num_permutations
+    return (num_extreme + 1) / (num_permutations + 1)
+
+
+def _randomization_interval(
+    permutations: _Permutations,
+    observed: float,
+    exact: Literal[True, False],
+    alpha: float,
+) -> Tuple[float, float]:
+    """Invert the permutation test: find shifts of `b` with p-value above alpha
+
+    If no shift can be rejected (too few permutations), bounds are infinite.
+    """
+    scale = np.max(np.abs(permutations.stats - observed * permutations.slopes))
+    scale = scale if scale > 0 else max(abs(observed), 1.0)
+    bounds = list()
+    for direction in (-1, 1):
+        inside = observed
+        outside = observed + direction * scale
+        for _ in range(BISECTION_ITERATIONS):
+            if _p_value(permutations, observed, exact, outside) <= alpha:
+                break
+            inside, outside = outside, outside + direction * (outside - observed)
+        else:
+            bounds.append(direction * np.inf)
+            continue
+        for _ in range(BISECTION_ITERATIONS):
+            middle = (inside + outside) / 2
+            if middle in (inside, outside):
+                break
+            if _p_value(permutations, observed, exact, middle) > alpha:
+                inside = middle
+            else:
+                outside = middle
+        bounds.append(inside)
+    return bounds[0], bounds[1]
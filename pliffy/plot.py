@@ -1,18 +1,351 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+from time import perf_counter
+from typing import NamedTuple, Sequence, Literal, List, Union, Iterator, Callable, Any
+
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
 from pliffy import estimate, parser, utils, figure
 
+SUBPLOT_PARAMS = ("left", "bottom", "right", "top", "wspace", "hspace")
+
 
-def plot_abd(info: "utils.PliffyInfoABD", ax=None):
+def plot_abd(info: "utils.PliffyInfoABD", ax=None) -> Figure:
     """Main user interface to generate ABD plot
 
+    Returns the Matplotlib figure the plot was drawn on. Unless `ax` is
+    provided or `show=True`, the figure is not managed by pyplot (it is not the
+    current figure of `plt.gcf`, and `plt.close` is not needed): it is freed
+    once no longer referenced. See also `abd_figure`.
+
+    This differs from earlier versions, where every figure was created with
+    pyplot: with `show=False`, `plt.gcf()` and `plt.savefig()` no longer refer
+    to the ABD plot. Use the returned figure instead (e.g. `fig.savefig`), or
+    pass an `ax` created with pyplot to keep using pyplot.
+
     Examples
     --------
 
     >>> from pliffy import PliffyInfoABD, plot_abd
-    >>> info = PliffyInfoABD(data_a=data_a, data_b=data_b)
-    >>> plot_abd(info)
+    >>> info = PliffyInfoABD(data_a=data_a, data_b=data_b, show=False)
+    >>> fig = plot_abd(info)
+    >>> fig.savefig("abd.svg")
+
+    >>> import matplotlib.pyplot as plt
+    >>> fig, ax = plt.subplots(figsize=info.width_height_in_inches)
+    >>> plot_abd(info, ax=ax)
+    >>> plt.savefig("abd.svg")
     """
+    info = utils.load_data(info)
     estimates = estimate.calc_abd(info)
+    return _plot_estimates(info, estimates, ax)
+
+
+def _plot_estimates(
+    info: "utils.PliffyInfoABD", estimates: "utils.ABD", ax=None
+) -> Figure:
+    """Plot ABD figure of data with estimates already computed"""
     save, ab_info, diff_info = parser.abd(info, estimates)
     ab_ax = figure.FigureAB(ab_info, ax)
     diff_ax = figure.DiffAxCreator(ab_ax, info, diff_info).diff_ax()
     figure.FigureDiff(diff_info, diff_ax, save)
+    return ab_ax.ax.figure
+
+
+@contextmanager
+def abd_figure(info: "utils.PliffyInfoABD") -> Iterator[Figure]:
+    """Generate ABD plot and close its figure on exit
+
+    The figure is never shown and, unlike `plot_abd`, estimates are not
+    printed. On exit, it is closed if managed by pyplot and
+    cleared, so its artists and renderer are released immediately, even in
+    long-running processes that generate many figures.
+
+    Examples
+    --------
+
+    >>> from pliffy import PliffyInfoABD, abd_figure
+    >>> with abd_figure(PliffyInfoABD(data_a=data_a, data_b=data_b)) as fig:
+    ...     fig.savefig(stream, format="png")
+    """
+    info = utils.load_data(info._replace(show=False))
+    fig = _plot_estimates(info, estimate.estimate_abd(info))
+    try:
+        yield fig
+    finally:
+        _close_figure(fig)
+
+
+def _close_figure(fig: Figure):
+    """Remove `fig` from pyplot (if managed) and release its artists"""
+    plt.close(fig)
+    fig.clear()
+
+
+def plot_abd_bytes(info: "utils.PliffyInfoABD") -> bytes:
+    """Generate ABD plot in memory and return content of figure file
+
+    The figure is rendered using `save_type` and `dpi`, then released (see
+    `abd_figure`); nothing is shown or written to disk. To write to an open
+    file or stream instead, set `save_path` to a writable binary file-like
+    object.
+
+    Examples
+    --------
+
+    >>> from pliffy import PliffyInfoABD, plot_abd_bytes
+    >>> png = plot_abd_bytes(PliffyInfoABD(data_a=data_a, data_b=data_b))
+    >>> svg = plot_abd_bytes(PliffyInfoABD(data_a=data_a, data_b=data_b,
+    ...                                    save_type="svg"))
+    """
+    buffer = BytesIO()
+    with abd_figure(info._replace(save=True, save_path=buffer)):
+        return buffer.getvalue()
+
+
+class AbdPlot:
+    """ABD plot that is updated with new data rather than rebuilt
+
+    The figure, axes and artists are created once. `update` computes new
+    estimates and ticks, moves the existing artists to the new data and
+    redraws the figure; nothing is redrawn if the data did not change. The
+    figure looks the same as one generated by `plot_abd` for the same data.
+
+    The figure is never shown, saved or printed; use `figure` (e.g.
+    `figure.savefig`) and `estimates` instead. Formats and design are those
+    of the `PliffyInfoABD` used to create the plot.
+
+    Parameters
+    ----------
+    info
+        Information used to generate the ABD plot
+    ax
+        Matplotlib axis to plot on. Defaults to a new figure that is not
+        managed by pyplot
+
+    Examples
+    --------
+
+    >>> from pliffy import PliffyInfoABD, AbdPlot
+    >>> abd_plot = AbdPlot(PliffyInfoABD(data_a=data_a, data_b=data_b))
+    >>> while True:
+    ...     abd_plot.update(*read_data())
+    ...     abd_plot.figure.savefig(stream, format="png")
+    """
+
+    def __init__(self, info: "utils.PliffyInfoABD", ax=None):
+        self.info = utils.load_data(info)._replace(save=False, show=False)
+        self.estimates = estimate.estimate_abd(self.info)
+        save, ab_info, diff_info = parser.abd(self.info, self.estimates)
+        self.ab_figure = figure.FigureAB(ab_info, ax)
+        diff_ax = figure.DiffAxCreator(self.ab_figure, self.info, diff_info).diff_ax()
+        self.diff_figure = figure.FigureDiff(diff_info, diff_ax, save)
+        self.figure = self.ab_figure.ax.figure
+
+    def update(self, data_a, data_b) -> bool:
+        """Plot new data `a` and `b`
+
+        Returns
+        -------
+        bool
+            Whether the data changed, in which case the figure was redrawn
+        """
+        info = self.info._replace(data_a=data_a, data_b=data_b)
+        if _same_data(info, self.info):
+            return False
+        self._update_artists(info, estimate.estimate_abd(info))
+        self._tight_layout()
+        self.figure.canvas.draw_idle()
+        return True
+
+    def _update_artists(self, info: "utils.PliffyInfoABD", estimates: "utils.ABD"):
+        """Plot new data and estimates on existing artists, without drawing"""
+        self.info = info
+        self.estimates = estimates
+        save, ab_info, diff_info = parser.abd(info, estimates)
+        self.ab_figure.update(ab_info)
+        diff_axis = figure.DiffAxCreator(self.ab_figure, info, diff_info)
+        diff_axis.update_diff_ax(self.diff_figure.ax)
+        self.diff_figure.update(diff_info)
+
+    def _tight_layout(self):
+        """Lay out figure as if newly created (see `FigureDiff`)"""
+        _reset_subplot_params(self.figure)
+        self.figure.tight_layout()
+
+
+def _same_data(info: "utils.PliffyInfoABD", other: "utils.PliffyInfoABD") -> bool:
+    return all(
+        np.array_equal(
+            np.asarray(data, dtype=float), np.asarray(other_data, dtype=float)
+        )
+        for data, other_data in (
+            (info.data_a, other.data_a),
+            (info.data_b, other.data_b),
+        )
+    )
+
+
+class BatchTimings(NamedTuple):
+    """Time (in seconds) spent in each stage of `plot_abd_many`"""
+
+    estimate: float = 0.0
+    parse: float = 0.0
+    plot: float = 0.0
+    save: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.estimate + self.parse + self.plot + self.save
+
+
+def plot_abd_many(
+    infos: Sequence["utils.PliffyInfoABD"], report: Callable[[str], Any] = None
+) -> BatchTimings:
+    """Generate ABD plots for many comparisons in a single call
+
+    Estimates for all comparisons are computed first in batches (see
+    `estimate.calc_abd_many`), then parsed, then each figure is plotted and
+    saved. Unlike `plot_abd`, estimates are not printed unless `report` is
+    provided (e.g. `print`).
+
+    A single Matplotlib figure is reused for all plots, so figures are never
+    shown; set `save=True` in each `PliffyInfoABD` to write them to file.
+    Saved files are identical to those generated by calling `plot_abd` in a
+    loop.
+
+    Examples
+    --------
+
+    >>> from pliffy import PliffyInfoABD, plot_abd_many
+    >>> infos = [PliffyInfoABD(data_a=a, data_b=b, save=True, save_path=path,
+    ...                        plot_name=f"figure{i}")
+    ...          for i, (a, b) in enumerate(comparisons)]
+    >>> timings = plot_abd_many(infos)
+    >>> print(f"{timings.total:.2f} seconds")
+    """
+    infos = [utils.load_data(info)._replace(show=False) for info in infos]
+
+    start = perf_counter()
+    all_estimates = estimate.calc_abd_many(infos, report=report)
+    estimate_time = perf_counter() - start
+
+    start = perf_counter()
+    all_parsed = [
+        parser.abd(info, estimates) for info, estimates in zip(infos, all_estimates)
+    ]
+    parse_time = perf_counter() - start
+
+    plot_time, save_time = 0.0, 0.0
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    for info, (save, ab_info, diff_info) in zip(infos, all_parsed):
+        start = perf_counter()
+        ax = _reuse_figure_axis(fig, info)
+        ab_ax = figure.FigureAB(ab_info, ax)
+        diff_ax = figure.DiffAxCreator(ab_ax, info, diff_info).diff_ax()
+        diff_figure = figure.FigureDiff(diff_info, diff_ax, save._replace(yes_no=False))
+        plot_time += perf_counter() - start
+
+        start = perf_counter()
+        diff_figure.save = save
+        diff_figure._save()
+        save_time += perf_counter() - start
+    fig.clear()
+    return BatchTimings(
+        estimate=estimate_time, parse=parse_time, plot=plot_time, save=save_time
+    )
+
+
+def _reuse_figure_axis(fig, info: "utils.PliffyInfoABD"):
+    """Clear `fig` and return a fresh axis, as if created by `plt.subplots`
+
+    Font size must be updated before the axis is created so that tick labels
+    match those of a newly created figure.
+    """
+    fig.clear()
+    fig.set_size_inches(info.width_height_in_inches)
+    _reset_subplot_params(fig)
+    matplotlib.rcParams.update({"font.size": info.fontsize})
+    return fig.add_subplot()
+
+
+def _reset_subplot_params(fig: Figure):
+    """Restore default position of subplots, as before `tight_layout`"""
+    fig.subplots_adjust(
+        **{
+            param: matplotlib.rcParams[f"figure.subplot.{param}"]
+            for param in SUBPLOT_PARAMS
+        }
+    )
+
+
+def plot_abd_parallel(
+    infos: Sequence["utils.PliffyInfoABD"],
+    max_workers: int = None,
+    chunksize: int = 1,
+    output: Literal["path", "bytes"] = "path",
+) -> List[Union[Path, bytes, None]]:
+    """Generate ABD plots in parallel using a pool of processes
+
+    Each `PliffyInfoABD` is plotted as with `abd_figure` in a worker process
+    that uses the headless Agg backend; figures are never shown and estimates
+    are not printed. Results are
+    returned in the same order as `infos`. If a job raises an exception, it is
+    re-raised in the calling process.
+
+    Parameters
+    ----------
+    infos
+        Information used to generate each ABD plot
+    max_workers
+        Number of worker processes. Defaults to the number of processors
+    chunksize
+        Number of jobs sent to a worker process at a time
+    output
+        If "path", each figure is saved as specified in its `PliffyInfoABD`
+        and the path of the saved file is returned (`None` if `save=False`).
+        If "bytes", each figure is rendered in memory using `save_type` and
+        `dpi` and the file content is returned; nothing is written to disk.
+
+    Examples
+    --------
+
+    >>> from pliffy import PliffyInfoABD, plot_abd_parallel
+    >>> infos = [PliffyInfoABD(data_a=a, data_b=b, save=True, save_path=path,
+    ...                        plot_name=f"figure{i}")
+    ...          for i, (a, b) in enumerate(comparisons)]
+    >>> paths = plot_abd_parallel(infos, max_workers=8, chunksize=10)
+    """
+    if output not in ("path", "bytes"):
+        raise ValueError("`output` must be set to either 'path' or 'bytes'")
+    render = partial(_render_abd, output=output)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_use_headless_backend
+    ) as executor:
+        return list(executor.map(render, infos, chunksize=chunksize))
+
+
+def _use_headless_backend():
+    """Initialise worker process to render without a display"""
+    matplotlib.use("Agg")
+
+
+def _render_abd(
+    info: "utils.PliffyInfoABD", output: Literal["path", "bytes"]
+) -> Union[Path, bytes, None]:
+    """Plot single ABD figure in a worker process"""
+    if output == "bytes":
+        return plot_abd_bytes(info)
+    with abd_figure(info):
+        pass
+    if info.save:
+        return Path(info.save_path) / (info.plot_name + "." + info.save_type)
+    return None
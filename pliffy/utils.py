@@ -1,8 +1,13 @@
 from typing import NamedTuple, Union, Literal, Tuple
 from pathlib import Path
 
+import numpy as np
+
 from pliffy import estimate
 
+# Data arrays with these types are used as they are (float32 halves memory use)
+DATA_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
 
 class ABD(NamedTuple):
     """Namedtuple to store info/data for `a`, `b`, `diff`
@@ -32,9 +37,16 @@ class PliffyInfoABD(NamedTuple):
     Parameters
     ----------
     data_a: list = None
-        Data to be plotted and used to compute difference
+        Data to be plotted and used to compute difference. To only compute estimates
+        (`estimate.calc_abd`) of data too large to hold in memory, can also be an
+        iterable (e.g. generator) of NumPy arrays that are read one chunk at a time
     data_b: list = None
-        Data to be plotted and used to compute difference
+        Data to be plotted and used to compute difference. Same types as `data_a`
+
+        `data_a` and `data_b` can also be NumPy arrays, `np.memmap` arrays or paths to
+        `.npy` files. Files are memory-mapped rather than read into memory. Data are
+        converted once to float64 arrays (see `load_data`); float32 arrays are kept as
+        float32 to halve memory use, while estimates are still computed in float64
     ci_percentage: int = 95
         Value used to compute confidence intervals
     design: Literal["paired", "unpaired"] = "unpaired"
@@ -50,7 +62,8 @@ class PliffyInfoABD(NamedTuple):
     save: Literal[True, False] = False
         Flag whether or not to save figure
     save_path: Path = None
-        Path where to save figure
+        Path where to save figure, or writable binary file-like object (e.g. `io.BytesIO`) to
+        write figure to; see also `plot_abd_bytes`
     save_type: Literal["png", "svg", "pdf"] = "png"
         What type of figure to save
     dpi: int = 180
@@ -86,10 +99,34 @@ class PliffyInfoABD(NamedTuple):
         Width of zero line
     show: Literal[True, False] = True
         Indicate whether or not to show plot after generation. Set to `False` if want to save but
-        not show figure. Also set to `False` if current figure is a subplot of a larger figure
+        not show figure. Also set to `False` if current figure is a subplot of a larger figure.
+        With `False`, the figure is not managed by pyplot (see `plot_abd`)
     width_height_in_inches: Tuple[float, float] = (8.2, 8.2)
         Width and height of pliffy plot (in inches). Default is set to a one-column figure in
         a two-column journal format
+    ci_method: Literal["t", "percentile", "bca"] = "t"
+        Method used to compute confidence intervals: Student t-distribution, or percentile
+        or bias-corrected and accelerated (bca) bootstrap
+    bootstrap_resamples: int = 10000
+        Number of resamples used to compute bootstrap confidence intervals
+    bootstrap_seed: int = None
+        Seed of random number generator used to compute bootstrap confidence intervals
+    unpaired_variance: Literal["pooled", "welch"] = "pooled"
+        Variance used to compute confidence interval of unpaired mean difference: pooled
+        variance, or separate variances with Welch-Satterthwaite degrees-of-freedom. Welch
+        is preferable when groups differ in size and spread
+    raw_display: Literal["all", "subsample", "density"] = "all"
+        How raw data points (and paired lines) are drawn: all of them; a subsample of at most
+        `raw_max_points` evenly spaced quantiles (which always includes the minimum and maximum);
+        or a density (hexbin) strip of all points. Means and CIs are always computed from all
+        data, and the figure reports how many points were drawn
+    raw_max_points: int = 5000
+        Maximum number of data points (or pairs) drawn per group when subsampling; also used
+        for paired lines with `raw_display="density"`. Must be at least 2
+    rasterize_raw_data: Literal[True, False] = False
+        Rasterize raw data points and paired lines (at `dpi`) when saving as svg or pdf, while
+        axes, text, means and CIs remain vector graphics. Greatly reduces file size and save
+        time when there are many data points
     """
 
     data_a: list = None
@@ -120,6 +157,13 @@ class PliffyInfoABD(NamedTuple):
     zero_line_width: int = 1
     show: Literal[True, False] = True
     width_height_in_inches: Tuple[float, float] = (3.23, 3.23)
+    ci_method: Literal["t", "percentile", "bca"] = "t"
+    bootstrap_resamples: int = 10000
+    bootstrap_seed: int = None
+    unpaired_variance: Literal["pooled", "welch"] = "pooled"
+    raw_display: Literal["all", "subsample", "density"] = "all"
+    raw_max_points: int = 5000
+    rasterize_raw_data: Literal[True, False] = False
 
     def __repr__(self):
         return (
@@ -151,5 +195,54 @@ class PliffyInfoABD(NamedTuple):
             f"\tzero_line_width={repr(self.zero_line_width)},\n"
             f"\tshow={repr(self.show)},\n"
             f"\twidth_height_in_inches={repr(self.width_height_in_inches)},\n"
+            f"\tci_method={repr(self.ci_method)},\n"
+            f"\tbootstrap_resamples={repr(self.bootstrap_resamples)},\n"
+            f"\tbootstrap_seed={repr(self.bootstrap_seed)},\n"
+            f"\tunpaired_variance={repr(self.unpaired_variance)},\n"
+            f"\traw_display={repr(self.raw_display)},\n"
+            f"\traw_max_points={repr(self.raw_max_points)},\n"
+            f"\trasterize_raw_data={repr(self.rasterize_raw_data)},\n"
             ")"
         )
+
+
+def load_data(info: PliffyInfoABD) -> PliffyInfoABD:
+    """Prepare `data_a` and `data_b` once for estimates and plotting
+
+    Paths to `.npy` files are memory-mapped. Other data held in memory
+    (lists, tuples, arrays or other sequences, such as `pandas.Series`) are
+    converted to contiguous float64 NumPy arrays, unless they already are
+    contiguous float64 or float32 arrays, which are used without copying.
+    Estimates, parsing and plotting then share these arrays by reference.
+    Iterables of chunks are returned unchanged.
+    """
+    return info._replace(data_a=_load(info.data_a), data_b=_load(info.data_b))
+
+
+def _load(data):
+    if isinstance(data, (str, Path)):
+        return _load_npy(data)
+    if data is None or estimate._is_chunked(data):
+        return data
+    return _as_data_array(data)
+
+
+def _as_data_array(data) -> np.ndarray:
+    """Contiguous float array of `data`, copied only if needed"""
+    if (
+        isinstance(data, np.ndarray)
+        and data.dtype in DATA_DTYPES
+        and data.flags.c_contiguous
+    ):
+        return data
+    return np.ascontiguousarray(data, dtype=float)
+
+
+def _load_npy(data) -> np.memmap:
+    path = Path(data)
+    if path.suffix != ".npy":
+        raise ValueError(
+            f"Data file '{path}' must be a NumPy `.npy` file "
+            "(e.g. saved with `numpy.save`)"
+        )
+    return np.load(path, mmap_mode="r")
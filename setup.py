@@ -26,5 +26,10 @@ setup(
     packages=find_packages(),
     include_package_data=False,
     install_requires=["numpy>=1.19.1", "scipy>=1.5.2", "matplotlib>=3.3.1"],
-    tests_require=["pytest>=6.0.1", "pytest-cov>=2.10.1", "pytest-mpl>= 0.11"]
+    tests_require=[
+        "pytest>=6.0.1",
+        "pytest-cov>=2.10.1",
+        "pytest-mpl>= 0.11",
+        "hypothesis>=5.0",
+    ],
 )
@@ -92,6 +92,13 @@ def pliffy_info_abd_default_asdict():
         "zero_line_color": "grey",
         "zero_line_width": 1,
         "width_height_in_inches": (3.23, 3.23),
+        "ci_method": "t",
+        "bootstrap_resamples": 10000,
+        "bootstrap_seed": None,
+        "unpaired_variance": "pooled",
+        "raw_display": "all",
+        "raw_max_points": 5000,
+        "rasterize_raw_data": False,
     }
 
 
@@ -125,6 +132,13 @@ def _pliffy_info_abd_custom():
         "zero_line_color": "grey",
         "zero_line_width": 1,
         "width_height_in_inches": (3.23, 3.23),
+        "ci_method": "t",
+        "bootstrap_resamples": 10000,
+        "bootstrap_seed": None,
+        "unpaired_variance": "pooled",
+        "raw_display": "all",
+        "raw_max_points": 5000,
+        "rasterize_raw_data": False,
     }
 
 
@@ -168,6 +182,13 @@ def _pliffy_info_abd_custom_neg_unpaired():
         "zero_line_color": "grey",
         "zero_line_width": 1,
         "width_height_in_inches": (3.23, 3.23),
+        "ci_method": "t",
+        "bootstrap_resamples": 10000,
+        "bootstrap_seed": None,
+        "unpaired_variance": "pooled",
+        "raw_display": "all",
+        "raw_max_points": 5000,
+        "rasterize_raw_data": False,
     }
 
 
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from pytest import approx
+
+from pliffy import bootstrap, estimate
+
+
+@pytest.fixture()
+def skewed_data():
+    rng = np.random.default_rng(42)
+    return rng.lognormal(0, 1, 60), rng.lognormal(0.3, 1, 45)
+
+
+@pytest.mark.parametrize("method", ["percentile", "bca"])
+def test_bootstrap_abd_unpaired_close_to_t(method):
+    data_a, data_b = np.random.default_rng(1).normal(10, 2, (2, 200))
+    cis = bootstrap.bootstrap_abd(
+        data_a, data_b, method=method, n_resamples=5000, seed=3
+    )
+    expected = estimate._calc_mean_and_confidence_interval(data_a, 95).ci
+    assert cis.a == approx(expected, rel=0.01)
+    assert cis.diff[0] < np.mean(data_b) - np.mean(data_a) < cis.diff[1]
+
+
+def test_bootstrap_abd_bca_skewed(skewed_data):
+    percentile = bootstrap.bootstrap_abd(*skewed_data, n_resamples=5000, seed=3)
+    bca = bootstrap.bootstrap_abd(*skewed_data, method="bca", n_resamples=5000, seed=3)
+    # Right-skewed data shift BCa interval upwards
+    assert bca.a[0] > percentile.a[0]
+    assert bca.a[1] > percentile.a[1]
+
+
+def test_bootstrap_abd_reproducible_across_blocks_and_workers(skewed_data):
+    data_a = skewed_data[0]
+    kwargs = dict(design="paired", n_resamples=2000, seed=7, max_memory_bytes=50000)
+    serial = bootstrap.bootstrap_abd(data_a, data_a * 1.1, **kwargs)
+    parallel = bootstrap.bootstrap_abd(data_a, data_a * 1.1, max_workers=2, **kwargs)
+    assert serial == parallel
+    assert serial.diff == approx(tuple(0.1 * ci for ci in serial.a))
+
+
+def test_block_sizes():
+    assert bootstrap._block_sizes(100, 10, 10 ** 9) == [10]
+    bytes_per_resample = 100 * (bootstrap.INDEX_BYTES + 8)
+    assert bootstrap._block_sizes(100, 10, 3 * bytes_per_resample) == [3, 3, 3, 1]
+
+
+def test_block_sizes_invalid_resamples():
+    with pytest.raises(ValueError, match="`n_resamples` must be a positive"):
+        bootstrap._block_sizes(100, 0, 10 ** 9)
+
+
+@pytest.mark.parametrize("design", ["paired", "unpaired"])
+def test_estimate_abd_bca_constant_data(pliffy_data_unpaired, design):
+    data_a = np.asarray(pliffy_data_unpaired.data_a[:20])
+    info = pliffy_data_unpaired._replace(
+        data_a=data_a,
+        data_b=data_a + 1 if design == "paired" else np.full(20, 3.0),
+        design=design,
+        ci_method="bca",
+        bootstrap_seed=1,
+    )
+    estimates = estimate.estimate_abd(info)
+    constant = estimates.diff if design == "paired" else estimates.b
+    assert constant.ci == approx((constant.mean, constant.mean))
+    assert all(np.isfinite(est.ci).all() for est in estimates)
+
+
+def test_bootstrap_abd_invalid_method(skewed_data):
+    with pytest.raises(ValueError, match="`method` must be set to"):
+        bootstrap.bootstrap_abd(*skewed_data, method="normal")
+
+
+def test_estimate_abd_bootstrap(pliffy_data_unpaired):
+    info = pliffy_data_unpaired._replace(ci_method="bca", bootstrap_seed=5)
+    estimates = estimate.estimate_abd(info)
+    expected = estimate.estimate_abd(pliffy_data_unpaired)
+    assert [est.mean for est in estimates] == [exp.mean for exp in expected]
+    assert estimates == estimate.estimate_abd(info)
+    assert estimates.diff.ci == approx(expected.diff.ci, rel=0.25)
+
+
+def test_estimate_abd_invalid_ci_method(pliffy_data_unpaired):
+    with pytest.raises(ValueError, match="`PliffyData.ci_method` must be set"):
+        estimate.estimate_abd(pliffy_data_unpaired._replace(ci_method="z"))
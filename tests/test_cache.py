@@ -0,0 +1,153 @@
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pytest
+import matplotlib
+
+from pliffy import cache, estimate, plot
+
+matplotlib.use("Agg")
+
+
+def test_plot_abd_cached_hit_skips_rendering(tmpdir, monkeypatch, pliffy_info_example2):
+    info = pliffy_info_example2._replace(save_type="png")
+    plot_cache = cache.PlotCache(Path(tmpdir) / "cache")
+    first = cache.plot_abd_cached(info, plot_cache)
+    assert first.image == plot.plot_abd_bytes(info)
+    assert first.estimates == estimate.estimate_abd(info)
+
+    def fail(info):
+        raise AssertionError("cached plot rendered again")
+
+    monkeypatch.setattr(cache, "_render", fail)
+    second = cache.plot_abd_cached(info, plot_cache)
+    assert second == first
+
+
+def test_plot_abd_cached_saves_figure(tmpdir, pliffy_info_example2):
+    info = pliffy_info_example2._replace(
+        save=True, save_path=tmpdir, plot_name="cached", save_type="svg"
+    )
+    plot_cache = cache.PlotCache(Path(tmpdir) / "cache")
+    for _ in range(2):
+        (Path(tmpdir) / "cached.svg").unlink(missing_ok=True)
+        image = cache.plot_abd_cached(info, plot_cache).image
+        assert (Path(tmpdir) / "cached.svg").read_bytes() == image
+
+
+def test_cache_key(tmpdir, pliffy_info_example2):
+    plot_cache = cache.PlotCache(tmpdir)
+    key = plot_cache.key(pliffy_info_example2)
+    data_b = np.array(pliffy_info_example2.data_b, dtype=float)
+    data_b[0] += 1e-9
+    changed = [
+        pliffy_info_example2._replace(data_b=data_b),
+        pliffy_info_example2._replace(paired_data_line_color="red"),
+        pliffy_info_example2._replace(save_type="svg"),
+    ]
+    assert all(plot_cache.key(info) != key for info in changed)
+    unchanged = [
+        pliffy_info_example2._replace(plot_name="other", show=True),
+        pliffy_info_example2._replace(data_a=list(pliffy_info_example2.data_a)),
+    ]
+    assert all(plot_cache.key(info) == key for info in unchanged)
+    with matplotlib.rc_context({"lines.antialiased": False}):
+        assert plot_cache.key(pliffy_info_example2) != key
+    plot.plot_abd(pliffy_info_example2._replace(fontsize=20))
+    assert plot_cache.key(pliffy_info_example2) == key
+
+
+def test_cache_least_recently_used_eviction(tmpdir):
+    plot_cache = cache.PlotCache(tmpdir, max_bytes=3_500)
+    estimates = estimate.estimate_abd(plot.utils.PliffyInfoABD([1, 2], [2, 4]))
+    cached_plot = cache.CachedPlot(image=bytes(1_000), estimates=estimates)
+    for i, key in enumerate(["first", "second", "third"]):
+        plot_cache.put(key, cached_plot)
+        os.utime(plot_cache._path(key), (i, i))
+    assert plot_cache.get("first") == cached_plot
+    plot_cache.put("fourth", cached_plot)
+    assert plot_cache.get("second") is None
+    assert all(plot_cache.get(key) for key in ("first", "third", "fourth"))
+    assert plot_cache.size() <= 3_500
+    plot_cache.clear()
+    assert plot_cache.size() == 0
+
+
+def test_cache_clear_removes_stale_versions(tmpdir):
+    stale_version = Path(tmpdir) / "pliffy-0.0.1-abc_matplotlib-3.3.1"
+    recent_version = Path(tmpdir) / "pliffy-0.0.2-def_matplotlib-3.3.1"
+    unrelated = Path(tmpdir) / "figures"
+    for path in (stale_version, recent_version, unrelated):
+        path.mkdir()
+    (stale_version / "key.entry").write_bytes(b"[]\n")
+    stale_time = time.time() - cache.STALE_VERSION_SECONDS - 60
+    for path in (stale_version, unrelated):
+        os.utime(path, (stale_time, stale_time))
+    plot_cache = cache.PlotCache(tmpdir)
+    assert stale_version.exists()
+    plot_cache.clear()
+    assert not stale_version.exists()
+    assert recent_version.exists()
+    assert unrelated.exists()
+    assert plot_cache.directory.exists()
+
+
+def test_cache_put_recreates_deleted_directory(tmpdir):
+    plot_cache = cache.PlotCache(tmpdir)
+    estimates = estimate.estimate_abd(plot.utils.PliffyInfoABD([1, 2], [2, 4]))
+    cached_plot = cache.CachedPlot(image=b"image", estimates=estimates)
+    shutil.rmtree(plot_cache.directory)
+    plot_cache.put("key", cached_plot)
+    assert plot_cache.get("key") == cached_plot
+
+
+def _put_with_other_version(directory):
+    cache._versions = lambda: "pliffy-other-abc_matplotlib-other"
+    plot_cache = cache.PlotCache(directory)
+    estimates = estimate.estimate_abd(plot.utils.PliffyInfoABD([1, 2], [2, 4]))
+    plot_cache.put("key", cache.CachedPlot(image=b"other", estimates=estimates))
+    return plot_cache.directory
+
+
+def test_cache_shared_with_other_version(tmpdir):
+    plot_cache = cache.PlotCache(tmpdir)
+    estimates = estimate.estimate_abd(plot.utils.PliffyInfoABD([1, 2], [2, 4]))
+    cached_plot = cache.CachedPlot(image=b"image", estimates=estimates)
+    plot_cache.put("key", cached_plot)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        other_directory = executor.submit(_put_with_other_version, tmpdir).result()
+    assert other_directory != plot_cache.directory
+    assert (other_directory / ("key" + cache.ENTRY_SUFFIX)).exists()
+    assert plot_cache.get("key") == cached_plot
+    plot_cache.put("other_key", cached_plot)
+    assert cache.PlotCache(tmpdir).get("other_key") == cached_plot
+    assert other_directory.exists()
+
+
+def _plot_cached(info, directory):
+    return cache.plot_abd_cached(info, cache.PlotCache(directory, max_bytes=150_000))
+
+
+def test_cache_shared_by_processes(
+    tmpdir, pliffy_info_example1, pliffy_info_example2, pliffy_info_example3
+):
+    infos = [pliffy_info_example1, pliffy_info_example2, pliffy_info_example3]
+    infos = [info._replace(dpi=100, save_type="png", show=False) for info in infos] * 4
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        plots = list(executor.map(partial(_plot_cached, directory=tmpdir), infos))
+    for info, cached_plot in zip(infos, plots):
+        assert cached_plot.image == plot.plot_abd_bytes(info)
+    entries = list(cache.PlotCache(tmpdir).directory.iterdir())
+    assert all(path.suffix == cache.ENTRY_SUFFIX for path in entries)
+    assert sum(path.stat().st_size for path in entries) <= 150_000
+
+
+def test_cache_requires_data_in_memory(tmpdir, pliffy_info_example2):
+    info = pliffy_info_example2._replace(data_a=iter([np.ones(3)]))
+    with pytest.raises(ValueError, match="held in memory"):
+        cache.PlotCache(tmpdir).key(info)
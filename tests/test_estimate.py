@@ -1,8 +1,11 @@
+from array import array
+from pathlib import Path
+
 from pytest import approx
 import pytest
 import numpy as np
 
-from pliffy import estimate
+from pliffy import estimate, utils
 
 
 def test_weighted_sd(data_a):
@@ -113,3 +116,361 @@ def test_ValueError_PliffyData_unequal_length_data(
         "same length in paired design.",
     ):
         estimates_diff = estimate.calc_abd(pliffy_data_unpaired_data_paired_design)
+
+
+@pytest.mark.parametrize("design", ["paired", "unpaired"])
+def test_calc_abd_batch_matches_calc_abd(capfd, design):
+    rng = np.random.default_rng(42)
+    data_a = rng.normal(10, 2, (25, 6))
+    data_b = rng.normal(12, 3, (25, 6))
+    batch = estimate.calc_abd_batch(data_a, data_b, 99, design)
+    for column in range(6):
+        info = utils.PliffyInfoABD(
+            data_a=list(data_a[:, column]),
+            data_b=list(data_b[:, column]),
+            ci_percentage=99,
+            design=design,
+        )
+        expected = estimate.calc_abd(info)
+        for name in ("a", "b", "diff"):
+            assert batch[name]["mean"][column] == approx(expected._asdict()[name].mean)
+            assert tuple(batch[name]["ci"][column]) == approx(
+                expected._asdict()[name].ci
+            )
+
+
+def test_calc_abd_batch_fields(data_a):
+    batch = estimate.calc_abd_batch(data_a, data_a, 95, "paired")
+    assert batch.shape == (1,)
+    assert batch["a"]["sem"][0] == approx(5.429385)
+    assert batch["a"]["t_value"][0] == approx(2.042272)
+    assert batch["diff"]["sd"][0] == 0
+
+
+def test_calc_abd_batch_unequal_length():
+    with pytest.raises(estimate.UnequalLength):
+        estimate.calc_abd_batch(np.ones((5, 2)), np.ones((4, 2)), design="paired")
+
+
+def test_calc_abd_many_matches_calc_abd(
+    capfd, pliffy_data_paired, pliffy_data_unpaired, pliffy_info_example1
+):
+    infos = [pliffy_data_paired, pliffy_data_unpaired, pliffy_info_example1]
+    actual = estimate.calc_abd_many(infos)
+    for estimates, info in zip(actual, infos):
+        expected = estimate.calc_abd(info)
+        for est, exp in zip(estimates, expected):
+            assert (est.mean, *est.ci) == approx((exp.mean, *exp.ci))
+
+
+def test_calc_abd_sequences_held_in_memory(monkeypatch, pliffy_data_unpaired):
+    def fail(*args, **kwargs):
+        raise AssertionError("sequence treated as chunks")
+
+    monkeypatch.setattr(estimate, "_calc_chunked_moments", fail)
+    expected = estimate.estimate_abd(
+        pliffy_data_unpaired._replace(data_a=list(range(1000)))
+    )
+    for data_a in (range(1000), array("d", range(1000))):
+        info = pliffy_data_unpaired._replace(data_a=data_a)
+        assert estimate.estimate_abd(info) == expected
+        assert isinstance(utils.load_data(info).data_a, np.ndarray)
+
+
+def test_calc_abd_many_chunked_data(capfd, pliffy_data_paired):
+    chunked_info = pliffy_data_paired._replace(
+        data_a=_chunks(pliffy_data_paired.data_a, [10, 20]),
+        data_b=_chunks(pliffy_data_paired.data_b, [25, 5]),
+    )
+    actual = estimate.calc_abd_many([chunked_info, pliffy_data_paired], report=None)
+    for est, exp in zip(actual[0], actual[1]):
+        assert (est.mean, *est.ci) == approx((exp.mean, *exp.ci), rel=1e-12)
+
+
+def test_moments(data_a):
+    moments = estimate._moments(data_a)
+    assert moments.n == 30
+    assert moments.mean == approx(42.368976)
+    assert moments.sem == approx(5.429385)
+    assert moments.sd == approx(np.std(data_a))
+
+
+def test_moments_across_chunks():
+    data = np.random.default_rng(42).normal(1e6, 3, estimate.MOMENTS_CHUNK_SIZE * 3 + 7)
+    moments = estimate._moments(data)
+    assert moments.n == len(data)
+    assert moments.mean == approx(np.mean(data), rel=1e-12)
+    assert moments.sd == approx(np.std(data), rel=1e-9)
+
+
+def test_merge_moments(data_a):
+    merged = estimate._merge_moments(
+        estimate._moments(data_a[:11]), estimate._moments(data_a[11:])
+    )
+    expected = estimate._moments(data_a)
+    assert (merged.n, merged.mean, merged.m2) == approx(
+        (expected.n, expected.mean, expected.m2)
+    )
+
+
+def _chunks(data, sizes):
+    start = 0
+    for size in sizes:
+        yield np.array(data[start : start + size])
+        start += size
+
+
+@pytest.mark.parametrize("design", ["paired", "unpaired"])
+def test_calc_abd_chunked_matches_in_memory(capfd, pliffy_data_paired, design):
+    info = pliffy_data_paired._replace(design=design)
+    expected = estimate.calc_abd(info)
+    chunked_info = info._replace(
+        data_a=_chunks(info.data_a, [7, 13, 10]),
+        data_b=_chunks(info.data_b, [1, 20, 2, 7]),
+    )
+    actual = estimate.calc_abd(chunked_info)
+    for act, exp in zip(actual, expected):
+        assert (act.mean, *act.ci) == approx((exp.mean, *exp.ci), rel=1e-12)
+
+
+def test_calc_abd_chunked_unequal_length(pliffy_data_paired):
+    info = pliffy_data_paired._replace(
+        data_a=_chunks(pliffy_data_paired.data_a, [10, 10]),
+        data_b=_chunks(pliffy_data_paired.data_b, [10, 10, 10]),
+    )
+    with pytest.raises(estimate.UnequalLength):
+        estimate.calc_abd(info)
+
+
+def test_calc_abd_npy_files_match_lists(capfd, tmpdir, pliffy_data_paired):
+    path_a, path_b = Path(tmpdir) / "a.npy", Path(tmpdir) / "b.npy"
+    np.save(path_a, pliffy_data_paired.data_a)
+    np.save(path_b, pliffy_data_paired.data_b)
+    expected = estimate.calc_abd(pliffy_data_paired)
+    actual = estimate.calc_abd(
+        pliffy_data_paired._replace(data_a=path_a, data_b=path_b)
+    )
+    for act, exp in zip(actual, expected):
+        assert (act.mean, *act.ci) == approx((exp.mean, *exp.ci))
+
+
+@pytest.mark.parametrize("design", ["paired", "unpaired"])
+def test_estimate_abd_float32_computed_in_float64(pliffy_data_paired, design):
+    info = pliffy_data_paired._replace(
+        data_a=np.asarray(pliffy_data_paired.data_a, dtype=np.float32),
+        data_b=np.asarray(pliffy_data_paired.data_b, dtype=np.float32),
+        design=design,
+    )
+    expected = estimate.estimate_abd(
+        info._replace(
+            data_a=info.data_a.astype(float), data_b=info.data_b.astype(float)
+        )
+    )
+    assert estimate.estimate_abd(info) == expected
+
+
+def test_t_value_cache():
+    estimate.clear_t_value_cache()
+    first = estimate._t_value(95, 30)
+    second = estimate._t_value(95, 30)
+    assert first == second == approx(2.042272)
+    info = estimate.t_value_cache_info()
+    assert (info.hits, info.misses, info.table_hits, info.cache_size) == (1, 1, 0, 1)
+
+
+def test_precompute_t_values():
+    estimate.clear_t_value_cache()
+    estimate.precompute_t_values(ci_percentages=(95, 99), max_degrees_of_freedom=10)
+    assert estimate._t_value(99, 5) == approx(4.032142)
+    assert estimate._t_value(95, 30) == approx(2.042272)
+    info = estimate.t_value_cache_info()
+    assert (info.table_hits, info.misses, info.table_size) == (1, 1, 20)
+    estimate.clear_t_value_cache()
+    assert estimate.t_value_cache_info() == (0, 0, 0, 0, 0)
+
+
+def test_estimate_abd_no_output(capfd, pliffy_data_unpaired):
+    estimates = estimate.estimate_abd(pliffy_data_unpaired)
+    assert capfd.readouterr().out == ""
+    expected = estimate.calc_abd(pliffy_data_unpaired)
+    assert estimates == expected
+    assert "95% CI" in capfd.readouterr().out
+
+
+def test_estimate_abd_report(capfd, pliffy_data_paired):
+    reports = list()
+    estimates = estimate.estimate_abd(pliffy_data_paired, report=reports.append)
+    assert capfd.readouterr().out == ""
+    assert reports == [estimate._make_estimates_table(estimates, pliffy_data_paired)]
+
+
+def test_welch_diff_confidence_interval():
+    rng = np.random.default_rng(3)
+    data_a, data_b = rng.normal(10, 1, 50), rng.normal(12, 4, 10)
+    info = utils.PliffyInfoABD(
+        data_a=list(data_a), data_b=list(data_b), unpaired_variance="welch"
+    )
+    estimates_diff = estimate.estimate_abd(info).diff
+    variance_a = np.var(data_a) / len(data_a)
+    variance_b = np.var(data_b) / len(data_b)
+    degrees_of_freedom = (variance_a + variance_b) ** 2 / (
+        variance_a ** 2 / 49 + variance_b ** 2 / 9
+    )
+    margin_of_error = estimate._t_value(95, degrees_of_freedom) * np.sqrt(
+        variance_a + variance_b
+    )
+    assert 9 < degrees_of_freedom < 58
+    assert estimates_diff.ci == approx(
+        (estimates_diff.mean - margin_of_error, estimates_diff.mean + margin_of_error)
+    )
+    pooled = estimate.estimate_abd(info._replace(unpaired_variance="pooled")).diff
+    assert pooled.mean == estimates_diff.mean
+    assert pooled.ci[1] - pooled.ci[0] < estimates_diff.ci[1] - estimates_diff.ci[0]
+
+
+def test_welch_constant_data():
+    info = utils.PliffyInfoABD(
+        data_a=[1.0] * 5, data_b=[3.0] * 4, unpaired_variance="welch"
+    )
+    assert estimate.estimate_abd(info).diff.ci == approx((2, 2))
+    batch = estimate.calc_abd_batch(
+        np.ones((5, 2)), np.full((4, 2), 3.0), unpaired_variance="welch"
+    )
+    assert batch["diff"]["ci"] == approx(np.full((2, 2), 2.0))
+    info = info._replace(data_b=[3.0, 4.0, 5.0])
+    assert np.all(np.isfinite(estimate.estimate_abd(info).diff.ci))
+
+
+def test_welch_single_value_group():
+    info = utils.PliffyInfoABD(
+        data_a=[1.0, 2.0, 3.0], data_b=[3.0], unpaired_variance="welch"
+    )
+    with pytest.raises(ValueError, match="at least 2 values"):
+        estimate.estimate_abd(info)
+    with pytest.raises(ValueError, match="at least 2 values"):
+        estimate.calc_abd_batch(
+            np.ones((3, 2)), np.ones((1, 2)), unpaired_variance="welch"
+        )
+
+
+def test_welch_invalid_unpaired_variance(pliffy_data_unpaired):
+    with pytest.raises(ValueError):
+        estimate.estimate_abd(pliffy_data_unpaired._replace(unpaired_variance="x"))
+    with pytest.raises(ValueError):
+        estimate.calc_abd_batch(np.ones((5, 2)), np.ones((5, 2)), unpaired_variance="x")
+
+
+@pytest.mark.parametrize("precompute", [False, True])
+def test_calc_abd_batch_welch_matches_estimate_abd(precompute):
+    estimate.clear_t_value_cache()
+    if precompute:
+        estimate.precompute_t_values(ci_percentages=(99,))
+    rng = np.random.default_rng(4)
+    data_a = rng.normal(10, 1, (50, 20))
+    data_b = rng.normal(12, 4, (10, 20))
+    batch = estimate.calc_abd_batch(data_a, data_b, 99, unpaired_variance="welch")
+    assert np.all(np.isnan(batch["diff"]["sd"]))
+    for column in range(20):
+        info = utils.PliffyInfoABD(
+            data_a=data_a[:, column],
+            data_b=data_b[:, column],
+            ci_percentage=99,
+            unpaired_variance="welch",
+        )
+        expected = estimate.estimate_abd(info).diff
+        assert batch["diff"]["mean"][column] == approx(expected.mean)
+        assert tuple(batch["diff"]["ci"][column]) == approx(expected.ci)
+    estimate.clear_t_value_cache()
+
+
+def test_t_values_uses_table_for_integer_degrees_of_freedom():
+    estimate.clear_t_value_cache()
+    estimate.precompute_t_values(ci_percentages=(95,), max_degrees_of_freedom=10)
+    degrees_of_freedom = np.array([5, 5.5, 30])
+    t_values = estimate._t_values(95, degrees_of_freedom)
+    expected = [estimate._cached_t_value(95, df) for df in degrees_of_freedom]
+    assert t_values == approx(expected)
+    assert estimate.t_value_cache_info().table_hits == 1
+    estimate.clear_t_value_cache()
+
+
+def test_calc_abd_many_welch(capfd, pliffy_data_unpaired):
+    infos = [
+        pliffy_data_unpaired,
+        pliffy_data_unpaired._replace(unpaired_variance="welch"),
+    ]
+    pooled, welch = estimate.calc_abd_many(infos)
+    assert pooled == estimate.estimate_abd(infos[0])
+    expected = estimate.estimate_abd(infos[1])
+    assert (welch.diff.mean, *welch.diff.ci) == approx(
+        (expected.diff.mean, *expected.diff.ci)
+    )
+
+
+def _assert_estimates_approx(actual, expected):
+    for actual_estimates, expected_estimates in zip(actual, expected):
+        assert actual_estimates.mean == approx(expected_estimates.mean, rel=1e-10)
+        assert actual_estimates.ci == approx(expected_estimates.ci, rel=1e-10)
+
+
+@pytest.mark.parametrize(
+    "design, unpaired_variance",
+    [("unpaired", "pooled"), ("unpaired", "welch"), ("paired", "pooled")],
+)
+def test_incremental_estimator_matches_full_recompute(design, unpaired_variance):
+    rng = np.random.default_rng(4)
+    data_a, data_b = rng.normal(10, 2, 200), rng.normal(11, 3, 200)
+    info = utils.PliffyInfoABD(
+        data_a=data_a[:10],
+        data_b=data_b[:10],
+        design=design,
+        unpaired_variance=unpaired_variance,
+    )
+    estimator = estimate.IncrementalEstimator(info)
+    for start in range(10, 200, 7):
+        stop = min(start + 7, 200)
+        if design == "paired":
+            estimator.add_pair(data_a[start:stop], data_b[start:stop])
+        else:
+            estimator.add_a(data_a[start:stop])
+            estimator.add_b(data_b[start:stop])
+    expected = estimate.estimate_abd(info._replace(data_a=data_a, data_b=data_b))
+    _assert_estimates_approx(estimator.estimates, expected)
+
+
+def test_incremental_estimator_merge_and_remove():
+    rng = np.random.default_rng(5)
+    data_a, data_b = rng.normal(10, 2, 90), rng.normal(12, 2, 90)
+    empty_info = utils.PliffyInfoABD(data_a=[], data_b=[], design="paired")
+    workers = []
+    for chunk_a, chunk_b in zip(np.split(data_a, 3), np.split(data_b, 3)):
+        worker = estimate.IncrementalEstimator(empty_info)
+        worker.add_pair(chunk_a, chunk_b)
+        workers.append(worker)
+    merged = workers[0].merge(workers[1]).merge(workers[2])
+    expected = estimate.estimate_abd(empty_info._replace(data_a=data_a, data_b=data_b))
+    _assert_estimates_approx(merged.estimates, expected)
+    assert workers[0].moments.a.n == 30
+
+    merged.remove_pair(data_a[:30], data_b[:30])
+    expected = estimate.estimate_abd(
+        empty_info._replace(data_a=data_a[30:], data_b=data_b[30:])
+    )
+    _assert_estimates_approx(merged.estimates, expected)
+
+
+def test_incremental_estimator_errors():
+    info = utils.PliffyInfoABD(data_a=[1, 2, 3], data_b=[2, 3])
+    estimator = estimate.IncrementalEstimator(info)
+    with pytest.raises(ValueError, match="`add_pair` can only be used with paired"):
+        estimator.add_pair([1], [2])
+    with pytest.raises(ValueError, match="Cannot remove 3 observations from 2"):
+        estimator.remove_b([1, 2, 3])
+    with pytest.raises(ValueError, match="different settings"):
+        estimator.merge(estimate.IncrementalEstimator(info._replace(ci_percentage=99)))
+    with pytest.raises(ValueError, match="at least one observation"):
+        estimate.IncrementalEstimator(info._replace(data_b=[])).estimates
+    with pytest.raises(ValueError, match="ci_method"):
+        estimate.IncrementalEstimator(info._replace(ci_method="bca"))
+    with pytest.raises(estimate.UnequalLength):
+        estimate.IncrementalEstimator(info._replace(design="paired"))
@@ -1,4 +1,7 @@
+import pytest
+
 from pliffy import estimate, parser, figure
+from pliffy.utils import PliffyInfoABD
 
 
 def test_figure_ab_paired_data(pliffy_info_abd_custom_asnamedtuple):
@@ -33,3 +36,91 @@ def test_figure_ab_unpaired_data(pliffy_info_abd_custom_neg_unpaired_asnamedtupl
     assert ab_ax.ax.get_xticklabels()[0].get_text() == "Biceps"
     assert ab_ax.ax.get_xticklabels()[1].get_text() == "Triceps"
     assert ab_ax.ax.get_xticklabels()[2].get_text() == "Effect"
+
+
+def test_figure_ab_raw_data_single_artist_per_group(
+    pliffy_info_abd_custom_neg_unpaired_asnamedtuple,
+):
+    info = pliffy_info_abd_custom_neg_unpaired_asnamedtuple
+    estimates = estimate.calc_abd(info)
+    save, ab_info, diff_info = parser.abd(info, estimates)
+    ab_ax = figure.FigureAB(ab_info)
+    raw_lines = [line for line in ab_ax.ax.lines if len(line.get_xdata()) == 5]
+    assert len(raw_lines) == 2
+    assert list(raw_lines[0].get_ydata()) == [-11, -22, -32, -43, -52]
+    assert list(raw_lines[0].get_xdata()) == pytest.approx(
+        [1.1, 1.12, 1.14, 1.16, 1.18]
+    )
+
+
+def test_figure_ab_paired_lines_single_collection(pliffy_info_example1):
+    info = pliffy_info_example1
+    estimates = estimate.calc_abd(info)
+    save, ab_info, diff_info = parser.abd(info, estimates)
+    ab_ax = figure.FigureAB(ab_info)
+    assert len(ab_ax.ax.collections) == 1
+    segments = ab_ax.ax.collections[0].get_segments()
+    assert len(segments) == 30
+    assert segments[0].tolist() == [[1.0, info.data_a[0]], [2.0, info.data_b[0]]]
+    jitter = ab_info.paired_lines.jitter
+    assert segments[1][:, 0] == pytest.approx([1 + jitter, 2 - jitter])
+
+
+def test_figure_ab_subsampled_raw_data(
+    pliffy_info_abd_custom_neg_unpaired_asnamedtuple,
+):
+    info = pliffy_info_abd_custom_neg_unpaired_asnamedtuple._replace(
+        raw_display="subsample", raw_max_points=3
+    )
+    estimates = estimate.calc_abd(info)
+    save, ab_info, diff_info = parser.abd(info, estimates)
+    ab_ax = figure.FigureAB(ab_info)
+    raw_lines = [line for line in ab_ax.ax.lines if len(line.get_xdata()) == 3]
+    assert len(raw_lines) == 2
+    assert list(raw_lines[0].get_ydata()) == [-11, -32, -52]
+    assert ab_ax.ax.get_ylim() == (-100.0, 0.0)
+    assert ab_ax.ax.texts[0].get_text() == "Points drawn: Biceps 3 of 5; Triceps 3 of 5"
+
+
+def test_figure_ab_density_raw_data(
+    pliffy_info_abd_custom_neg_unpaired_asnamedtuple,
+):
+    info = pliffy_info_abd_custom_neg_unpaired_asnamedtuple._replace(
+        raw_display="density"
+    )
+    estimates = estimate.calc_abd(info)
+    save, ab_info, diff_info = parser.abd(info, estimates)
+    ab_ax = figure.FigureAB(ab_info)
+    assert len(ab_ax.ax.collections) == 2
+    assert ab_ax.ax.collections[0].get_array().sum() == pytest.approx(5)
+    assert ab_ax.ax.get_ylim() == (-100.0, 0.0)
+    assert "density" in ab_ax.ax.texts[0].get_text()
+
+
+def test_ab_yticks_computed_before_plotting(pliffy_info_example1):
+    estimates = estimate.calc_abd(pliffy_info_example1)
+    save, ab_info, diff_info = parser.abd(pliffy_info_example1, estimates)
+    ab_ax = figure.FigureAB(ab_info)
+    tick_space = ab_ax.ax.yaxis.get_tick_space()
+    ytick_step, yticks = figure.figure_ab.ab_yticks(ab_info, tick_space)
+    assert (ytick_step, yticks) == (ab_ax.ytick_step, ab_ax.yticks)
+    # Same ticks as autoscaling would give once everything is plotted
+    ab_ax.ax.relim()
+    ab_ax.ax.autoscale()
+    autoscaled_yticks = ab_ax.ax.get_yticks()
+    assert ytick_step == autoscaled_yticks[1] - autoscaled_yticks[0]
+
+
+def test_ab_yticks_end_at_first_tick_above_data():
+    # Yticks used to be generated with `np.arange`, whose float overshoot
+    # sometimes added a tick past the first one above the data (0.03 here)
+    info = PliffyInfoABD(
+        data_a=[0.01, 0.019, 0.003, 0.019, 0.006, 0.008],
+        data_b=[0.021, 0.01, 0.014, 0.001, 0.019, 0.013],
+        show=False,
+    )
+    estimates = estimate.estimate_abd(info)
+    save, ab_info, diff_info = parser.abd(info, estimates)
+    ytick_step, yticks = figure.figure_ab.ab_yticks(ab_info, tick_space=5)
+    assert ytick_step == pytest.approx(0.005)
+    assert yticks == pytest.approx((0, 0.005, 0.01, 0.015, 0.02, 0.025))
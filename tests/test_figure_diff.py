@@ -2,7 +2,6 @@ from pathlib import Path
 
 import pytest
 import matplotlib
-import matplotlib.pyplot as plt
 
 from pliffy.plot import plot_abd
 from pliffy.utils import PliffyInfoABD
@@ -14,24 +13,21 @@ matplotlib.use("Qt5Agg")
     savefig_kwargs={"dpi": 600}, baseline_dir=str(Path(".") / "baseline")
 )
 def test_example1(pliffy_info_example1):
-    plot_abd(pliffy_info_example1)
-    return plt.gcf()
+    return plot_abd(pliffy_info_example1)
 
 
 @pytest.mark.mpl_image_compare(
     savefig_kwargs={"dpi": 600}, baseline_dir=str(Path(".") / "baseline")
 )
 def test_example2(pliffy_info_example2):
-    plot_abd(pliffy_info_example2)
-    return plt.gcf()
+    return plot_abd(pliffy_info_example2)
 
 
 @pytest.mark.mpl_image_compare(
     savefig_kwargs={"dpi": 600}, baseline_dir=str(Path(".") / "baseline")
 )
 def test_example3(pliffy_info_example3):
-    plot_abd(pliffy_info_example3)
-    return plt.gcf()
+    return plot_abd(pliffy_info_example3)
 
 
 def test_example_save(tmpdir):
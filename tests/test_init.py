@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+import pliffy
+
+
+def test_import_does_not_load_matplotlib_scipy_multiprocessing():
+    code = (
+        "import sys, pliffy\n"
+        "print(any(module.split('.')[0] in ('matplotlib', 'scipy', 'multiprocessing') "
+        "for module in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_lazy_attributes():
+    from pliffy.plot import plot_abd
+
+    assert pliffy.plot_abd is plot_abd
+    assert pliffy.figure.FigureAB.__name__ == "FigureAB"
+    assert "plot_abd_many" in dir(pliffy)
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+import matplotlib
+
+from pliffy import live, estimate
+from pliffy.utils import PliffyInfoABD
+
+matplotlib.use("Agg")
+
+
+class FakeClock:
+    """Replaces `time.monotonic` so refreshes do not depend on test speed"""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(live, "monotonic", fake_clock)
+    return fake_clock
+
+
+def _live_plot(design, refresh_interval=0.0, size=20):
+    rng = np.random.default_rng(0)
+    info = PliffyInfoABD(
+        data_a=rng.normal(10, 2, size),
+        data_b=rng.normal(11, 2, size),
+        design=design,
+        show=False,
+    )
+    return live.LiveAbdPlot(info, refresh_interval=refresh_interval)
+
+
+def _add(live_plot, rng, size=3):
+    if live_plot.info.design == "paired":
+        live_plot.add_pair(rng.normal(10, 2, size), rng.normal(11, 2, size))
+    else:
+        live_plot.add_b(rng.normal(11, 2, size))
+
+
+def _canvas_pixels(live_plot):
+    return np.asarray(live_plot.figure.canvas.buffer_rgba()).copy()
+
+
+@pytest.mark.parametrize("design", ["unpaired", "paired"])
+def test_live_blit_matches_full_redraw(design):
+    rng = np.random.default_rng(1)
+    live_plot = _live_plot(design)
+    full_draws = []
+    live_plot.figure.canvas.mpl_connect("draw_event", full_draws.append)
+    for _ in range(30):
+        _add(live_plot, rng)
+    assert len(full_draws) < 30
+    blitted = _canvas_pixels(live_plot)
+    live_plot.figure.canvas.draw()
+    assert np.array_equal(blitted, _canvas_pixels(live_plot))
+
+
+@pytest.mark.parametrize("design", ["unpaired", "paired"])
+def test_live_estimates_match_full_recompute(design):
+    rng = np.random.default_rng(2)
+    live_plot = _live_plot(design)
+    for _ in range(20):
+        _add(live_plot, rng, size=5)
+    if design == "unpaired":
+        live_plot.add_a(rng.normal(10, 2, 7))
+    assert len(live_plot.info.data_b) == 120
+    expected = estimate.estimate_abd(live_plot.info)
+    for actual, estimates in zip(live_plot.estimates, expected):
+        assert actual.mean == pytest.approx(estimates.mean, rel=1e-12)
+        assert actual.ci == pytest.approx(estimates.ci, rel=1e-12)
+
+
+def test_live_data_stored_in_growing_arrays():
+    rng = np.random.default_rng(4)
+    live_plot = _live_plot("paired")
+    expected_a, expected_b = [live_plot.info.data_a], [live_plot.info.data_b]
+    arrays = list()
+    for _ in range(100):
+        values_a, values_b = rng.normal(10, 2, 3), rng.normal(11, 2, 3)
+        live_plot.add_pair(values_a, values_b)
+        expected_a.append(values_a)
+        expected_b.append(values_b)
+        arrays.append(live_plot.info.data_a.base)
+    assert np.array_equal(live_plot.info.data_a, np.concatenate(expected_a))
+    assert np.array_equal(live_plot.info.data_b, np.concatenate(expected_b))
+    assert arrays[-1] is arrays[-2] is not None
+    assert len({id(array) for array in arrays}) <= 5
+
+
+def test_live_refresh_interval(clock):
+    rng = np.random.default_rng(3)
+    live_plot = _live_plot("unpaired", refresh_interval=1.0)
+    clock.time = 0.5
+    _add(live_plot, rng)
+    assert len(live_plot.info.data_b) == 20
+    clock.time = 1.2
+    _add(live_plot, rng)
+    assert len(live_plot.info.data_b) == 26
+    clock.time = 1.5
+    _add(live_plot, rng)
+    assert live_plot.refresh()
+    assert len(live_plot.info.data_b) == 29
+    assert not live_plot.refresh()
+
+
+def test_live_design_checks():
+    live_plot = _live_plot("paired")
+    with pytest.raises(ValueError, match="`add_b` can only be used with unpaired"):
+        live_plot.add_b([1.0])
+    with pytest.raises(estimate.UnequalLength):
+        live_plot.add_pair([1.0, 2.0], [1.0])
+    with pytest.raises(ValueError, match="`add_pair` can only be used with paired"):
+        _live_plot("unpaired").add_pair([1.0], [2.0])
+
+
+def test_live_requires_t_confidence_intervals():
+    info = PliffyInfoABD(data_a=[1, 2, 3], data_b=[2, 3, 4], ci_method="percentile")
+    with pytest.raises(ValueError, match="ci_method"):
+        live.LiveAbdPlot(info)
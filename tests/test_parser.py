@@ -1,5 +1,9 @@
+import numpy as np
+import pytest
+
+from pliffy import parser
 from pliffy.parser import abd
-from pliffy.utils import ABD
+from pliffy.utils import ABD, PliffyInfoABD, load_data
 from pliffy.parser import Raw, CI, Xticks, Mean, Paired, ZeroLine
 
 
@@ -70,6 +74,8 @@ def test_abd_figure_info(pliffy_info_abd_custom_asnamedtuple, pliffy_estimates):
         "design": "paired",
         "fontsize": 12,
         "width_height_in_inches": (3.23, 3.23),
+        "raw_note": "",
+        "show": False,
     }
 
 
@@ -101,3 +107,79 @@ def test_abd_diff_figure_info(pliffy_info_abd_custom_asnamedtuple, pliffy_estima
         "show": False,
         'zero_line': ZeroLine(color='grey', width=1),
     }
+
+
+def test_abd_subsample_keeps_quantiles_and_extremes(pliffy_estimates):
+    data_a, noise = np.random.default_rng(1).normal(0, 1, (2, 10_000))
+    data_b = data_a + noise
+    info = PliffyInfoABD(
+        data_a=data_a,
+        data_b=data_b,
+        design="paired",
+        raw_display="subsample",
+        raw_max_points=100,
+    )
+    save, ab_info, diff_info = abd(info, pliffy_estimates)
+    assert len(ab_info.raw_a.data) <= 100
+    assert len(ab_info.paired_lines.a) == len(ab_info.raw_a.data)
+    assert ab_info.raw_a.data.min() == data_a.min()
+    assert ab_info.raw_b.data.max() == data_b.max()
+    quartiles = [0.25, 0.5, 0.75]
+    assert np.quantile(diff_info.raw_diff.data, quartiles) == pytest.approx(
+        np.quantile(noise, quartiles), abs=0.05
+    )
+    assert ab_info.raw_a.jitter == 0.1 / len(ab_info.raw_a.data)
+    assert ab_info.raw_note == f"Pairs drawn: {len(ab_info.raw_a.data)} of 10,000"
+
+
+@pytest.mark.parametrize("max_points", [2, 3, 5, 6, 7])
+def test_abd_subsample_at_most_max_points(pliffy_estimates, max_points):
+    data_a, data_b = np.random.default_rng(2).normal(0, 1, (2, 50))
+    for design in ("paired", "unpaired"):
+        info = PliffyInfoABD(
+            data_a=data_a,
+            data_b=data_b,
+            design=design,
+            raw_display="subsample",
+            raw_max_points=max_points,
+        )
+        save, ab_info, diff_info = abd(info, pliffy_estimates)
+        assert len(ab_info.raw_a.data) <= max_points
+        assert len(ab_info.raw_b.data) <= max_points
+        if design == "unpaired":
+            assert ab_info.raw_a.data.max() == data_a.max()
+            assert ab_info.raw_b.data.min() == data_b.min()
+
+
+def test_abd_invalid_raw_max_points(pliffy_estimates):
+    info = PliffyInfoABD(data_a=[1, 2, 3], data_b=[2, 4, 5], raw_max_points=1)
+    with pytest.raises(ValueError):
+        abd(info._replace(raw_display="subsample"), pliffy_estimates)
+
+
+def test_abd_density_unpaired_does_not_subsample(monkeypatch, pliffy_estimates):
+    def fail(info):
+        raise AssertionError("unpaired density figures draw all data")
+
+    monkeypatch.setattr(parser, "_subsample", fail)
+    info = PliffyInfoABD(
+        data_a=list(range(20)), data_b=list(range(20)), raw_display="density"
+    )
+    save, ab_info, diff_info = abd(info, pliffy_estimates)
+    assert len(ab_info.raw_a.data) == 20
+
+
+def test_abd_shares_data_arrays(pliffy_estimates):
+    info = load_data(PliffyInfoABD(data_a=[1, 2, 3], data_b=[2, 4, 5], design="paired"))
+    save, ab_info, diff_info = abd(info, pliffy_estimates)
+    assert ab_info.raw_a.data is info.data_a
+    assert ab_info.raw_b.data is info.data_b
+    assert ab_info.paired_lines.a is info.data_a
+    assert ab_info.paired_lines.b is info.data_b
+    assert diff_info.raw_diff.data.dtype == np.float64
+
+
+def test_abd_invalid_raw_display(pliffy_info_abd_custom_asnamedtuple, pliffy_estimates):
+    info = pliffy_info_abd_custom_asnamedtuple._replace(raw_display="x")
+    with pytest.raises(ValueError):
+        abd(info, pliffy_estimates)
@@ -0,0 +1,157 @@
+import time
+from itertools import combinations, product
+from math import comb
+
+import numpy as np
+import pytest
+from pytest import approx
+
+from pliffy import estimate, parser, permutation
+from pliffy.utils import PliffyInfoABD
+
+
+def _brute_force_p_value(data_a, data_b, design):
+    observed = abs(np.mean(data_b) - np.mean(data_a))
+    if design == "paired":
+        diffs = np.asarray(data_b) - np.asarray(data_a)
+        all_signs = product((1, -1), repeat=len(diffs))
+        stats = [np.mean(diffs * signs) for signs in all_signs]
+    else:
+        pooled = np.concatenate((data_a, data_b))
+        stats = list()
+        for b_indexes in combinations(range(len(pooled)), len(data_b)):
+            in_b = np.isin(np.arange(len(pooled)), b_indexes)
+            stats.append(np.mean(pooled[in_b]) - np.mean(pooled[~in_b]))
+    return np.mean(np.abs(stats) >= observed * (1 - 1e-12))
+
+
+@pytest.mark.parametrize("design", ["paired", "unpaired"])
+def test_permutation_test_exact_matches_brute_force(design):
+    rng = np.random.default_rng(0)
+    data_a = rng.normal(10, 2, 7)
+    data_b = data_a + rng.normal(1.5, 1.5, 7)
+    result = permutation.permutation_test(data_a, data_b, design=design)
+    assert result.exact
+    assert result.p_value == approx(_brute_force_p_value(data_a, data_b, design))
+    assert result.mean == approx(np.mean(data_b) - np.mean(data_a))
+
+
+def test_permutation_test_paired_matches_scipy():
+    stats = pytest.importorskip("scipy.stats")
+    rng = np.random.default_rng(1)
+    data_a = rng.normal(10, 2, 12)
+    data_b = data_a + rng.normal(0.8, 1.5, 12)
+    result = permutation.permutation_test(data_a, data_b, design="paired")
+    expected = stats.permutation_test(
+        (data_a, data_b),
+        lambda x, y, axis=-1: np.mean(y - x, axis=axis),
+        permutation_type="samples",
+        n_resamples=np.inf,
+        vectorized=True,
+    )
+    assert result.n_permutations == 2 ** 12
+    assert result.p_value == approx(expected.pvalue)
+
+
+@pytest.mark.parametrize("design", ["paired", "unpaired"])
+def test_permutation_test_interval_inverts_test(design):
+    rng = np.random.default_rng(2)
+    data_a = rng.normal(10, 2, 50)
+    data_b = data_a + rng.normal(1, 2, 50)
+    result = permutation.permutation_test(data_a, data_b, design=design, seed=3)
+    assert not result.exact
+    info = PliffyInfoABD(data_a=data_a, data_b=data_b, design=design)
+    t_ci = estimate.estimate_abd(info).diff.ci
+    assert result.ci == approx(t_ci, abs=0.15)
+    for bound in result.ci:
+        shifted = permutation.permutation_test(
+            data_a, data_b - bound, design=design, seed=3, tolerance=0
+        )
+        assert shifted.p_value == approx(0.05, abs=0.01)
+
+
+def test_permutation_test_stops_early_and_is_reproducible():
+    rng = np.random.default_rng(4)
+    data_a, data_b = rng.normal(0, 1, (2, 40))
+    kwargs = dict(max_permutations=20_000, batch_size=500, seed=5)
+    result = permutation.permutation_test(data_a, data_b, tolerance=0.01, **kwargs)
+    assert result.n_permutations < 20_000
+    assert result.n_permutations % 500 == 0
+    assert result == permutation.permutation_test(
+        data_a, data_b, tolerance=0.01, **kwargs
+    )
+    full = permutation.permutation_test(data_a, data_b, tolerance=0, **kwargs)
+    assert full.n_permutations == 20_000
+    assert full.p_value == approx(result.p_value, abs=0.03)
+
+
+def test_permutation_test_too_few_permutations_gives_infinite_interval():
+    result = permutation.permutation_test([1, 2, 3], [2, 4, 5], design="paired")
+    assert result.n_permutations == 8
+    assert result.ci == (-np.inf, np.inf)
+
+
+def test_permutation_test_paired_unequal_length():
+    with pytest.raises(estimate.UnequalLength):
+        permutation.permutation_test([1, 2, 3], [1, 2], design="paired")
+
+
+def test_permutation_abd_attaches_result(pliffy_data_paired):
+    estimates = permutation.permutation_abd(pliffy_data_paired, seed=1)
+    assert isinstance(estimates.diff, permutation.PermutationResult)
+    assert estimates.a == estimate.estimate_abd(pliffy_data_paired).a
+    assert 0 <= estimates.diff.p_value <= 1
+    _, _, diff_info = parser.abd(pliffy_data_paired, estimates)
+    assert diff_info.mean_diff.data[1] == estimates.diff.mean
+    assert diff_info.ci_diff.data[1] == estimates.diff.ci
+
+
+def test_num_label_shuffles_at_most():
+    for num_values, len_b, limit in product(range(12), range(12), range(0, 500, 7)):
+        if len_b <= num_values:
+            expected = comb(num_values, len_b) <= limit
+            got = permutation._num_label_shuffles_at_most(num_values, len_b, limit)
+            assert got == expected
+
+
+def test_num_label_shuffles_at_most_large_groups_is_fast():
+    start = time.perf_counter()
+    assert not permutation._num_label_shuffles_at_most(2_000_000, 1_000_000, 10_000)
+    assert time.perf_counter() - start < 0.1
+
+
+@pytest.mark.parametrize("design", ["paired", "unpaired"])
+def test_permutation_test_memory_does_not_grow_with_data(design):
+    tracemalloc = pytest.importorskip("tracemalloc")
+    rng = np.random.default_rng(6)
+    data_a, data_b = rng.normal(0, 1, (2, 50_000))
+    max_memory_bytes = 2 ** 22
+    tracemalloc.start()
+    result = permutation.permutation_test(
+        data_a,
+        data_b,
+        design=design,
+        max_permutations=300,
+        tolerance=0,
+        seed=7,
+        max_memory_bytes=max_memory_bytes,
+    )
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert result.n_permutations == 300
+    assert peak < 3 * max_memory_bytes
+
+
+@pytest.mark.parametrize("design", ["paired", "unpaired"])
+def test_permutation_test_interval_from_sample(monkeypatch, design):
+    rng = np.random.default_rng(8)
+    data_a = rng.normal(10, 2, 12)
+    data_b = data_a + rng.normal(1, 1, 12)
+    max_permutations = 2 ** 12 if design == "paired" else 10_000
+    kwargs = dict(design=design, max_permutations=max_permutations)
+    full = permutation.permutation_test(data_a, data_b, seed=9, **kwargs)
+    monkeypatch.setattr(permutation, "CI_SAMPLE_SIZE", 1_000)
+    sampled = permutation.permutation_test(data_a, data_b, seed=9, **kwargs)
+    assert sampled.n_permutations == full.n_permutations
+    assert sampled.p_value == full.p_value
+    assert sampled.ci == approx(full.ci, abs=0.2)
@@ -0,0 +1,229 @@
+import gc
+import os
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pytest
+import matplotlib
+import matplotlib.pyplot as plt
+
+from pliffy import plot
+
+matplotlib.use("Agg")
+
+
+def _save_infos(infos, save_path):
+    return [
+        info._replace(
+            save=True,
+            save_path=save_path,
+            save_type="png",
+            dpi=100,
+            plot_name=f"figure{i}",
+            show=False,
+        )
+        for i, info in enumerate(infos)
+    ]
+
+
+def test_plot_abd_many_matches_plot_abd(
+    capfd, tmpdir, pliffy_info_example1, pliffy_info_example2, pliffy_info_example3
+):
+    infos = [pliffy_info_example1, pliffy_info_example2, pliffy_info_example3]
+    loop_dir = Path(tmpdir) / "loop"
+    many_dir = Path(tmpdir) / "many"
+    loop_dir.mkdir()
+    many_dir.mkdir()
+    for info in _save_infos(infos, loop_dir):
+        plot.plot_abd(info)
+        plt.close("all")
+    capfd.readouterr()
+    timings = plot.plot_abd_many(_save_infos(infos, many_dir))
+    assert capfd.readouterr().out == ""
+    for i in range(len(infos)):
+        name = f"figure{i}.png"
+        assert (loop_dir / name).read_bytes() == (many_dir / name).read_bytes()
+    assert timings.total == (
+        timings.estimate + timings.parse + timings.plot + timings.save
+    )
+    assert all(stage >= 0 for stage in timings)
+
+
+def test_plot_abd_parallel_paths(tmpdir, pliffy_info_example1, pliffy_info_example3):
+    infos = _save_infos([pliffy_info_example1, pliffy_info_example3], tmpdir)
+    paths = plot.plot_abd_parallel(infos, max_workers=2)
+    assert paths == [Path(tmpdir) / "figure0.png", Path(tmpdir) / "figure1.png"]
+    assert all(path.is_file() for path in paths)
+
+
+def test_plot_abd_parallel_bytes_ordered(
+    tmpdir, pliffy_info_example1, pliffy_info_example2, pliffy_info_example3
+):
+    infos = [pliffy_info_example1, pliffy_info_example2, pliffy_info_example3]
+    infos = _save_infos(infos, tmpdir)
+    for info in infos:
+        plot.plot_abd(info)
+        plt.close("all")
+    images = plot.plot_abd_parallel(infos, max_workers=2, output="bytes")
+    for i, image in enumerate(images):
+        assert image == (Path(tmpdir) / f"figure{i}.png").read_bytes()
+
+
+def test_plot_abd_parallel_raises_job_exception(pliffy_data_bad_design):
+    with pytest.raises(
+        ValueError,
+        match="`PliffyData.design` must be set to either 'paired' or 'unpaired'",
+    ):
+        plot.plot_abd_parallel([pliffy_data_bad_design], max_workers=1)
+
+
+def test_plot_abd_parallel_invalid_output(pliffy_info_example1):
+    with pytest.raises(ValueError, match="`output` must be set to"):
+        plot.plot_abd_parallel([pliffy_info_example1], output="screen")
+
+
+def test_plot_abd_memmap_data(tmpdir, pliffy_info_example1):
+    path_a, path_b = Path(tmpdir) / "a.npy", Path(tmpdir) / "b.npy"
+    np.save(path_a, pliffy_info_example1.data_a)
+    np.save(path_b, pliffy_info_example1.data_b)
+    plot.plot_abd(_save_infos([pliffy_info_example1], tmpdir)[0])
+    expected = (Path(tmpdir) / "figure0.png").read_bytes()
+    plt.close("all")
+    info_files = pliffy_info_example1._replace(data_a=path_a, data_b=str(path_b))
+    plot.plot_abd(_save_infos([info_files], tmpdir)[0])
+    plt.close("all")
+    assert (Path(tmpdir) / "figure0.png").read_bytes() == expected
+
+
+def test_plot_abd_bytes_matches_file(tmpdir, pliffy_info_example1):
+    info = _save_infos([pliffy_info_example1], tmpdir)[0]
+    plot.plot_abd(info)
+    plt.close("all")
+    figures_before = plt.get_fignums()
+    image = plot.plot_abd_bytes(info._replace(save=False, save_path=None))
+    assert image == (Path(tmpdir) / "figure0.png").read_bytes()
+    assert plt.get_fignums() == figures_before
+    assert list(Path(tmpdir).iterdir()) == [Path(tmpdir) / "figure0.png"]
+
+
+def test_headless_plots_do_not_print(capfd, pliffy_info_example1):
+    info = pliffy_info_example1._replace(save_type="png")
+    plot.plot_abd_bytes(info)
+    with plot.abd_figure(info):
+        pass
+    plot.plot_abd_parallel([info], max_workers=1, output="bytes")
+    assert capfd.readouterr().out == ""
+
+
+def test_plot_abd_file_like_save_path(pliffy_info_example1):
+    buffer = BytesIO()
+    info = _save_infos([pliffy_info_example1], buffer)[0]
+    plot.plot_abd(info._replace(save_type="svg"))
+    plt.close("all")
+    assert buffer.getvalue().startswith(b"<?xml")
+    assert b"<svg" in buffer.getvalue()
+
+
+def _rss_mb():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+
+
+def test_plot_abd_not_managed_by_pyplot(pliffy_info_example2):
+    figures_before = plt.get_fignums()
+    fig = plot.plot_abd(pliffy_info_example2)
+    assert plt.get_fignums() == figures_before
+    assert fig.axes
+
+
+def test_abd_figure_closes_figure(pliffy_info_example1):
+    figures_before = plt.get_fignums()
+    with plot.abd_figure(pliffy_info_example1) as fig:
+        assert len(fig.axes) == 1
+    assert not fig.axes
+    assert plt.get_fignums() == figures_before
+
+
+@pytest.mark.skipif(not Path("/proc/self/statm").exists(), reason="Linux only")
+def test_plot_abd_memory_bounded(pliffy_info_example2):
+    """Memory does not grow with number of figures generated
+
+    Uses 100 figures to keep the test fast; see `benchmarks/bench_figure_memory`
+    for 10k figures. Figures that are never released take > 1 MB each.
+    """
+    for _ in range(20):
+        plot.plot_abd(pliffy_info_example2)
+    gc.collect()
+    rss_before = _rss_mb()
+    for _ in range(100):
+        plot.plot_abd(pliffy_info_example2)
+    gc.collect()
+    assert _rss_mb() - rss_before < 20
+
+
+def _png(fig):
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png", dpi=100)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "design, options",
+    [
+        ("unpaired", {}),
+        ("paired", {}),
+        ("paired", {"paired_data_joining_lines": False}),
+        ("paired", {"raw_display": "density"}),
+        ("unpaired", {"raw_display": "subsample", "raw_max_points": 20}),
+    ],
+)
+def test_abd_plot_update_matches_plot_abd(design, options):
+    rng = np.random.default_rng(5)
+    info = plot.utils.PliffyInfoABD(
+        data_a=[1, 2, 3], data_b=[2, 3, 5], design=design, show=False, **options
+    )
+    abd_plot = plot.AbdPlot(info)
+    for loc, scale, size in [(5, 1, 10), (100, 40, 50), (0.1, 0.05, 30)]:
+        data_a = rng.normal(loc, scale, size)
+        data_b = rng.normal(loc * 1.3, scale, size)
+        assert abd_plot.update(data_a, data_b)
+        expected = plot.plot_abd(info._replace(data_a=data_a, data_b=data_b))
+        assert _png(abd_plot.figure) == _png(expected)
+        assert abd_plot.estimates == plot.estimate.estimate_abd(abd_plot.info)
+
+
+def test_abd_plot_update_unchanged_data(pliffy_info_example2):
+    abd_plot = plot.AbdPlot(pliffy_info_example2)
+    figures_before = plt.get_fignums()
+    data_a, data_b = list(pliffy_info_example2.data_a), pliffy_info_example2.data_b
+    assert not abd_plot.update(data_a, data_b)
+    assert abd_plot.update(data_a, data_b[::-1])
+    assert plt.get_fignums() == figures_before
+
+
+@pytest.mark.parametrize("save_type", ["svg", "pdf"])
+def test_plot_abd_rasterize_raw_data(tmpdir, save_type):
+    data_a = np.random.default_rng(3).normal(10, 2, 2000)
+    sizes = dict()
+    for rasterize in (False, True):
+        info = plot.utils.PliffyInfoABD(
+            data_a=data_a,
+            data_b=data_a + 1,
+            design="paired",
+            rasterize_raw_data=rasterize,
+            save=True,
+            save_path=tmpdir,
+            save_type=save_type,
+            plot_name=f"figure_{rasterize}",
+            show=False,
+        )
+        plot.plot_abd(info)
+        plt.close("all")
+        path = Path(tmpdir, f"figure_{rasterize}.{save_type}")
+        sizes[rasterize] = path.stat().st_size
+    assert sizes[True] < sizes[False] / 1.2
+    if save_type == "svg":
+        # Paired lines and raw differences are images; nothing else is
+        svg = Path(tmpdir, "figure_True.svg").read_text()
+        assert svg.count("<image") == 2
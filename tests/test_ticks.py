@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+import pytest
+import matplotlib.pyplot as plt
+from hypothesis import given, assume, settings, strategies as st
+
+from pliffy.figure.ticks import enclosing_ticks, data_ticks, MAX_TICKS
+
+values = st.floats(min_value=-1e6, max_value=1e6, allow_nan=False)
+steps = st.floats(min_value=1e-3, max_value=1e5, allow_nan=False)
+
+
+def _scan_ticks(min_value, max_value, step):
+    """Reference: step one tick at a time from zero (`DiffAxCreator` before)"""
+    min_tick = 0
+    while min_value < min_tick:
+        min_tick -= step
+    max_tick = 0
+    while max_value > max_tick:
+        max_tick += step
+    return min_tick, max_tick
+
+
+@given(values, values, steps, values, st.booleans())
+def test_enclosing_ticks_properties(value1, value2, step, origin, strict):
+    min_value, max_value = min(value1, value2), max(value1, value2)
+    assume((max_value - min_value) / step < MAX_TICKS - 2)
+    ticks = enclosing_ticks(min_value, max_value, step, origin, strict)
+    if strict:
+        assert ticks[0] < min_value and ticks[-1] > max_value
+    else:
+        assert ticks[0] <= min_value and ticks[-1] >= max_value
+    # Fewest ticks: no tick could be dropped at either end
+    tolerance = 1e-9 * max(abs(step), abs(min_value), abs(max_value), abs(origin))
+    if len(ticks) == 1:
+        assert not strict and ticks[0] == min_value == max_value
+        return
+    assert ticks[1] >= min_value - tolerance
+    assert ticks[-2] <= max_value + tolerance
+    assert np.diff(ticks) == pytest.approx(step, abs=tolerance)
+    steps_from_origin = (ticks[0] - origin) / step
+    assert steps_from_origin == pytest.approx(round(steps_from_origin), abs=1e-6)
+
+
+@given(
+    st.floats(min_value=-1000, max_value=0),
+    st.floats(min_value=0, max_value=1000),
+    st.sampled_from([0.5, 1.0, 2.0, 5.0, 20.0, 100.0]),
+)
+def test_enclosing_ticks_matches_scan(min_value, max_value, step):
+    ticks = enclosing_ticks(min_value, max_value, step)
+    assert (ticks[0], ticks[-1]) == _scan_ticks(min_value, max_value, step)
+
+
+def test_enclosing_ticks_far_from_origin():
+    ticks = enclosing_ticks(1e12, 1e12 + 3, 1.0)
+    assert ticks == (1e12, 1e12 + 1, 1e12 + 2, 1e12 + 3)
+
+
+@pytest.mark.parametrize("step", [0.0, -1.0, math.nan, math.inf, -math.inf])
+def test_enclosing_ticks_invalid_step(step):
+    with pytest.raises(ValueError, match="step"):
+        enclosing_ticks(0, 1, step)
+
+
+@pytest.mark.parametrize(
+    "min_value, max_value", [(math.nan, 1), (0, math.inf), (-math.inf, 0)]
+)
+def test_enclosing_ticks_non_finite_values(min_value, max_value):
+    with pytest.raises(ValueError, match="non-finite"):
+        enclosing_ticks(min_value, max_value, 1.0)
+
+
+def test_enclosing_ticks_too_many():
+    with pytest.raises(ValueError, match="too small"):
+        enclosing_ticks(0, 1e6, 1e-6)
+    with pytest.raises(ValueError, match="too small"):
+        enclosing_ticks(0, 1e300, 1e-300)
+
+
+@settings(max_examples=50, deadline=None)
+@given(values, values, st.floats(min_value=1, max_value=10))
+def test_data_ticks_matches_autoscaled_axis(value1, value2, height):
+    fig, ax = plt.subplots(figsize=(3, height))
+    ax.plot([0, 1], [value1, value2])
+    expected = ax.get_yticks()
+    actual = data_ticks(
+        min(value1, value2), max(value1, value2), ax.yaxis.get_tick_space()
+    )
+    plt.close(fig)
+    assert list(actual) == list(expected)
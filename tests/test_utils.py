@@ -1,3 +1,6 @@
+from pathlib import Path
+
+import numpy as np
 import pytest
 
 from pliffy import utils
@@ -57,4 +60,36 @@ def test_pliffy_info_set_data(pliffy_info_abd_custom_asdict):
         zero_line_width=1,
         width_height_in_inches=(3.23, 3.23),
     )
-    assert actual._asdict() == pliffy_info_abd_custom_asdict
\ No newline at end of file
+    assert actual._asdict() == pliffy_info_abd_custom_asdict
+
+
+def test_load_data_npy_memmap(tmpdir):
+    path = Path(tmpdir) / "data_a.npy"
+    np.save(path, np.arange(5, dtype=float))
+    info = utils.load_data(utils.PliffyInfoABD(data_a=str(path), data_b=[1, 2]))
+    assert isinstance(info.data_a, np.memmap)
+    assert list(info.data_a) == [0, 1, 2, 3, 4]
+    assert info.data_b.dtype == np.float64
+    assert list(info.data_b) == [1, 2]
+
+
+def test_load_data_invalid_file(tmpdir):
+    with pytest.raises(ValueError, match="must be a NumPy `.npy` file"):
+        utils.load_data(utils.PliffyInfoABD(data_a=Path(tmpdir) / "data_a.csv"))
+
+
+def test_load_data_arrays_shared():
+    data_a = np.arange(5, dtype=np.float32)
+    data_b = np.arange(5, dtype=float)
+    info = utils.load_data(utils.PliffyInfoABD(data_a=data_a, data_b=data_b))
+    assert info.data_a is data_a
+    assert info.data_b is data_b
+    info = utils.load_data(
+        utils.PliffyInfoABD(data_a=(1, 2), data_b=np.arange(10)[::2])
+    )
+    for data in (info.data_a, info.data_b):
+        assert data.dtype == np.float64
+        assert data.flags.c_contiguous
+    assert list(info.data_b) == [0, 2, 4, 6, 8]
+    chunks = iter([np.ones(3)])
+    assert utils.load_data(utils.PliffyInfoABD(data_a=chunks)).data_a is chunks